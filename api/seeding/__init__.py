@@ -0,0 +1,33 @@
+"""
+Seed de la base de données JGazette
+Crée des utilisateurs, articles et commentaires valides au regard des modèles Mongoose
+
+Usage (depuis api/) :
+    python -m seeding                        # jeu de données d'exemple
+    python -m seeding --profile small        # 1k utilisateurs, 10k articles, 20k commentaires
+    python -m seeding --profile xl           # 100k / 10M / 30M, un processus par cœur
+    python -m seeding --profile large --comments 0
+                                             # un profil, une option explicite qui prime
+    python -m seeding --users 100000 --posts 1000000 --comments 5000000
+                                             # corpus synthétique, inséré en flux par lots
+    python -m seeding --posts 10000000 --workers 8
+                                             # même chose, réparti sur 8 processus
+    python -m seeding --resume --workers 8   # reprendre un seed interrompu
+    python -m seeding --users 1000 --posts 100000 --seed 42
+                                             # jeu reproductible (voir .seed-cache/manifest.json)
+    python -m seeding --users 1000 --posts 100 --comments 200000 --comment-posts 10
+                                             # fils de commentaires imbriqués, 20k par article
+    python -m seeding --profile medium --content markov
+                                             # contenu unique synthétisé, tailles à queue lourde
+    python -m seeding --posts 1000000 --insert-workers 8
+                                             # 8 lots en vol : génération et réseau se recouvrent
+    python -m seeding --profile large --write-concern 0 --compressors zlib --max-pool-size 4
+                                             # base jetable : débit maximal (voir .seed-cache/report.json)
+    python -m seeding --profile xl --output dumps/xl
+                                             # archives mongorestore --gzip, générées hors ligne sur tous les cœurs
+    python -m seeding --profile xl --dry-run --estimate
+                                             # stockage, index et working set estimés, sans base
+
+Modules : config (paramètres), corpus (données d'exemple), generators (un générateur
+par collection), storage (écriture en base), pipeline (orchestration), profiles, cli.
+"""
@@ -0,0 +1,130 @@
+"""
+Écriture asynchrone des lots : génération et insertions se recouvrent
+
+Une étape de production génère, contrôle et empreinte les lots dans un thread et
+les dépose dans une file bornée ; `insert_workers` tâches d'insertion les consomment,
+si bien que plusieurs lots sont en vol pendant que le suivant est généré. La file
+pleine suspend la production (contre-pression) : la mémoire reste bornée à environ
+2 × insert_workers lots.
+
+Les insertions passent par motor (requirements.txt), ou par AsyncMongoClient avec
+pymongo >= 4.9 ; sans driver asynchrone, ThreadedCollection sert de repli.
+"""
+
+import time
+import asyncio
+from itertools import islice
+from pymongo import ReplaceOne
+
+from .config import MONGODB_URI, UPSERT_KEYS
+from .schema import validate_document
+from .storage import staging_collection, documents_digest, client_options, load_write_concern
+
+def async_driver():
+    """Classe du client MongoDB asynchrone disponible : pymongo >= 4.9, puis motor ; None sinon"""
+    try:
+        from pymongo import AsyncMongoClient
+        return AsyncMongoClient
+    except ImportError:
+        pass
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        return AsyncIOMotorClient
+    except ImportError:
+        return None
+
+class ThreadedCollection:
+    """Collection pymongo synchrone exposée en asynchrone, chaque écriture dans un thread
+
+    Repli quand aucun driver asynchrone n'est installé : pymongo relâche le GIL
+    pendant les E/S réseau, les insertions en vol se recouvrent donc quand même.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def insert_many(self, documents, **kwargs):
+        return await asyncio.to_thread(self.collection.insert_many, documents, **kwargs)
+
+    async def bulk_write(self, requests, **kwargs):
+        return await asyncio.to_thread(self.collection.bulk_write, requests, **kwargs)
+
+async def write_batches_async(collection, name, batches, documents, checkpoint=None, progress=True, metrics=None,
+                              insert_workers=4):
+    """Même contrat que storage.write_batches, avec `insert_workers` lots en vol
+
+    Les lots se terminent dans le désordre : le journal de reprise les marque un
+    par un, une reprise rejoue en upsert ceux qui étaient en vol.
+    """
+    key = UPSERT_KEYS[name]
+    queue = asyncio.Queue(maxsize=insert_workers * 2)
+    written = 0
+    started = time.perf_counter()
+
+    def produce(start, stop):
+        produce_started = time.perf_counter()
+        batch = list(islice(documents, stop - start))
+        checksum_started = time.perf_counter()
+        if batch:
+            validate_document(name, batch[0])
+        digest, size = documents_digest(batch)
+        hashing = metrics.take_hash_wait() if metrics is not None else 0.0
+        return batch, digest, size, checksum_started - produce_started, time.perf_counter() - checksum_started, hashing
+
+    async def producer():
+        # Le générateur n'est avancé que par ce thread, un lot à la fois
+        for start, stop in batches:
+            await queue.put((start, stop) + await asyncio.to_thread(produce, start, stop))
+        for _ in range(insert_workers):
+            await queue.put(None)
+
+    async def inserter():
+        nonlocal written
+        while (item := await queue.get()) is not None:
+            start, stop, batch, digest, size, produced, checksum, hashing = item
+            insert_started = time.perf_counter()
+            if checkpoint is not None and checkpoint.needs_upsert(name, start):
+                await collection.bulk_write(
+                    [ReplaceOne({key: doc[key]}, doc, upsert=True) for doc in batch], ordered=False
+                )
+            else:
+                if checkpoint is not None:
+                    checkpoint.mark("started", name, start, stop)
+                await collection.insert_many(batch, ordered=False)
+            if checkpoint is not None:
+                checkpoint.mark("done", name, start, stop, digest)
+            finished = time.perf_counter()
+            if metrics is not None:
+                metrics.record_batch(name, len(batch), size, produced, checksum, finished - insert_started, hashing)
+            written += len(batch)
+            if progress:
+                rate = written / (finished - started)
+                print(f"   … {written} documents écrits dans {name} ({rate:,.0f} docs/s)", end='\r')
+
+    await asyncio.gather(producer(), *(inserter() for _ in range(insert_workers)))
+    if progress and batches:
+        print()
+    return written
+
+async def write_staging_async(db, name, batches, documents, args, checkpoint=None, progress=True, metrics=None):
+    client = None
+    write_concern = load_write_concern(args)
+    driver = async_driver()
+    if driver is None:
+        collection = ThreadedCollection(staging_collection(db, name, write_concern))
+    else:
+        client = driver(MONGODB_URI, **client_options(args))
+        collection = staging_collection(client[db.name], name, write_concern)
+    try:
+        return await write_batches_async(
+            collection, name, batches, documents, checkpoint, progress, metrics, args.insert_workers
+        )
+    finally:
+        if client is not None:
+            closing = client.close()
+            if asyncio.iscoroutine(closing):
+                await closing
+
+def write_staging_concurrently(db, name, batches, documents, args, checkpoint=None, progress=True, metrics=None):
+    """Écrire les lots d'une collection de chargement avec args.insert_workers insertions en vol"""
+    return asyncio.run(write_staging_async(db, name, batches, documents, args, checkpoint, progress, metrics))
@@ -0,0 +1,176 @@
+"""
+Recalcul en bloc de readTime et excerpt pour les articles écrits sans passer par Mongoose
+
+Post.calculateReadTime n'est appelé que dans le hook pre('save') : les insertions
+directes (insert_many du seed, insertMany de import-atlas-data-nodejs.js) laissent
+des articles sans readTime, ou avec une valeur saisie à la main. Ce job relit les
+readTime est recalculé par le serveur (update_many avec un pipeline, sans lire le
+contenu) ; seuls les articles dont l'excerpt manque ou dépasse la limite sont relus
+par tranches de _id pour le dériver du markdown, et écrits par bulk_write non ordonné.
+Chaque correction met updatedAt à jour, comme un save() Mongoose : l'export
+incrémental et migrate --sync la propagent.
+
+Usage (depuis api/) :
+    python -m seeding.backfill                   # tous les articles
+    python -m seeding.backfill --incremental     # articles modifiés depuis le dernier passage
+    python -m seeding.backfill --since 2025-01-01 --dry-run
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+from datetime import datetime, timezone
+from pymongo import UpdateOne, ASCENDING
+
+from .config import SEED_CACHE_DIR, DEFAULT_BATCH_SIZE
+from .markov import excerpt
+from .storage import connect_db
+
+# Dernier updatedAt traité par --incremental
+DEFAULT_WATERMARK_PATH = os.path.join(SEED_CACHE_DIR, 'backfill-watermark.json')
+
+# Limite de Post.excerpt (maxlength) dans src/models/Post.js
+EXCERPT_MAX_LENGTH = 300
+
+CODE_FENCE = re.compile(r'^```.*?^```', re.M | re.S)
+INLINE_MARKUP = re.compile(r'[*_`]+|^\s*(?:[-*>]|\d+\.)\s+', re.M)
+LINK = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+
+# Post.calculateReadTime côté serveur : content.split(' ').length mots, 200 par minute
+READ_TIME = {"$max": [1, {"$ceil": {"$divide": [{"$size": {"$split": [{"$ifNull": ["$content", ""]}, " "]}}, 200]}}]}
+STALE_READ_TIME = {"$expr": {"$ne": ["$readTime", READ_TIME]}}
+# Excerpt vide (ou absent) ou plus long que la limite : à vérifier sur le client
+EXCERPT_CANDIDATES = {"$or": [
+    {"excerpt": {"$not": re.compile(r'\S')}},
+    {"excerpt": re.compile(r'^[\s\S]{%d}' % (EXCERPT_MAX_LENGTH + 1))}
+]}
+
+def summary_from_markdown(content):
+    """Premier paragraphe de texte d'un contenu markdown, sans titres, code ni balisage"""
+    for paragraph in CODE_FENCE.sub('', content).split('\n\n'):
+        lines = [line for line in paragraph.splitlines() if line.strip() and not line.lstrip().startswith(('#', '|'))]
+        text = ' '.join(INLINE_MARKUP.sub('', LINK.sub(r'\1', ' '.join(lines))).split())
+        if text:
+            return text
+    return ''
+
+def excerpt_change(post):
+    """Excerpt à écrire pour un article s'il manque ou est trop long, None sinon"""
+    current = (post.get("excerpt") or '').strip()
+    if not current:
+        return excerpt(summary_from_markdown(post.get("content") or ''), EXCERPT_MAX_LENGTH) or None
+    if len(current) > EXCERPT_MAX_LENGTH:
+        return excerpt(current, EXCERPT_MAX_LENGTH)
+    return None
+
+def iter_chunks(collection, query, chunk_size):
+    """Parcourir les documents par tranches de _id croissants (une requête courte par tranche)"""
+    last_id = None
+    projection = {"content": 1, "excerpt": 1}
+    while True:
+        chunk_query = dict(query)
+        if last_id is not None:
+            chunk_query["_id"] = {"$gt": last_id}
+        chunk = list(collection.find(chunk_query, projection).sort("_id", ASCENDING).limit(chunk_size))
+        if not chunk:
+            return
+        last_id = chunk[-1]["_id"]
+        yield chunk
+
+def backfill_posts(collection, since=None, chunk_size=DEFAULT_BATCH_SIZE, dry_run=False, progress=True):
+    """Recalculer readTime / excerpt des articles (modifiés depuis `since` si fourni)
+
+    Retourne (readTime corrigés, excerpts corrigés, plus grand updatedAt avant le passage).
+    Les articles corrigés reçoivent un updatedAt plus récent : le passage suivant les
+    relit sans rien y changer.
+    """
+    query = {"updatedAt": {"$gte": since}} if since is not None else {}
+    latest = collection.find_one(query, {"updatedAt": 1}, sort=[("updatedAt", -1)])
+    watermark = latest.get("updatedAt") if latest else since
+    if dry_run:
+        read_times = collection.count_documents({**query, **STALE_READ_TIME})
+    else:
+        read_times = collection.update_many(
+            {**query, **STALE_READ_TIME}, [{"$set": {"readTime": READ_TIME, "updatedAt": "$$NOW"}}]
+        ).modified_count
+    excerpts = 0
+    for chunk in iter_chunks(collection, {**query, **EXCERPT_CANDIDATES}, chunk_size):
+        requests = []
+        for post in chunk:
+            derived = excerpt_change(post)
+            if derived is not None:
+                requests.append(UpdateOne(
+                    {"_id": post["_id"]}, {"$set": {"excerpt": derived}, "$currentDate": {"updatedAt": True}}
+                ))
+        if requests and not dry_run:
+            collection.bulk_write(requests, ordered=False)
+        excerpts += len(requests)
+        if progress:
+            print(f"   … {excerpts} excerpts à corriger", end='\r')
+    if progress and excerpts:
+        print()
+    return read_times, excerpts, watermark
+
+def utc_datetime(value):
+    """Date ISO 8601 en UTC naïf, comme les dates renvoyées par pymongo (un décalage est converti)"""
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+def load_watermark(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return utc_datetime(json.load(f)["updatedAt"])
+
+def save_watermark(path, watermark):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"updatedAt": watermark.isoformat()}, f)
+
+def parse_args(argv=None):
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Recalcul de readTime et excerpt des articles JGazette")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"articles relus et écrits par bulk_write pour les excerpts (défaut: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument('--incremental', action='store_true',
+                        help="ne traiter que les articles modifiés depuis le dernier passage (voir --watermark)")
+    parser.add_argument('--since', type=utc_datetime,
+                        help="ne traiter que les articles modifiés depuis cette date (ISO 8601, UTC sans décalage)")
+    parser.add_argument('--watermark', default=DEFAULT_WATERMARK_PATH,
+                        help="fichier du dernier updatedAt traité, lu et mis à jour par --incremental")
+    parser.add_argument('--dry-run', action='store_true', help="compter les corrections sans rien écrire")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size doit être >= 1")
+    if args.incremental and args.since:
+        parser.error("--incremental et --since sont incompatibles")
+    return args
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+    since = load_watermark(args.watermark) if args.incremental else args.since
+    client, db = connect_db()
+    try:
+        print(f"⏱️  Recalcul de readTime / excerpt{f' (modifiés depuis {since.isoformat()})' if since else ''}...")
+        started = time.perf_counter()
+        read_times, excerpts, watermark = backfill_posts(db.posts, since, args.chunk_size, args.dry_run)
+        verb = "à corriger" if args.dry_run else "corrigés"
+        print(f"✅ {read_times} readTime et {excerpts} excerpts {verb} en {time.perf_counter() - started:.1f}s")
+        if args.incremental and watermark is not None and not args.dry_run:
+            save_watermark(args.watermark, watermark)
+            print(f"🔖 Prochain passage incrémental à partir de {watermark.isoformat()}")
+    except Exception as e:
+        print(f"❌ Erreur lors du recalcul: {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+        print("🔌 Connexion MongoDB fermée")
+
+if __name__ == "__main__":
+    main()
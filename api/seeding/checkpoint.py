@@ -0,0 +1,100 @@
+"""
+Journal de reprise du seed synthétique et manifeste du jeu de données généré
+"""
+
+import os
+import json
+import hashlib
+
+from .config import COLLECTIONS
+
+class SeedCheckpoint:
+    """Journal (JSON lines) des lots d'un seed synthétique, pour la reprise après incident
+
+    La première ligne décrit l'exécution (préfixe des _id, volumes, taille de lot) ;
+    chaque lot ajoute ensuite une ligne « started » avant son écriture et une ligne
+    « done » après. Les lignes sont ajoutées en mode append par chaque worker.
+    À la reprise, les lots « done » sont sautés et les lots « started » sans « done »
+    (éventuellement écrits en partie) sont rejoués en upsert.
+    Avec --write-concern 0, un lot « done » a seulement été envoyé : l'en-tête le
+    signale (`unacknowledged`) et un tel journal ne peut pas servir à une reprise.
+    """
+
+    def __init__(self, path, header, done=None, started=()):
+        self.path = path
+        self.header = header
+        # (collection, début du lot) -> empreinte SHA-256 des documents du lot
+        self.done = dict(done or {})
+        self.started = set(started) - set(self.done)
+
+    @classmethod
+    def create(cls, path, run, params, unacknowledged=False):
+        """Démarrer un nouveau journal (l'ancien est écrasé) ; `run` est None hors seed synthétique"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        header = {**(run.header() if run is not None else {}), "params": params}
+        if unacknowledged:
+            header["unacknowledged"] = True
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header) + "\n")
+        return cls(path, header)
+
+    @classmethod
+    def load(cls, path):
+        """Relire un journal existant (une dernière ligne tronquée est ignorée)"""
+        done, started = {}, set()
+        with open(path, encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                batch = (entry["collection"], entry["start"])
+                if entry["state"] == "done":
+                    done[batch] = entry.get("digest")
+                else:
+                    started.add(batch)
+        return cls(path, header, done, started)
+
+    def is_done(self, collection, start):
+        return (collection, start) in self.done
+
+    def needs_upsert(self, collection, start):
+        return (collection, start) in self.started
+
+    def mark(self, state, collection, start, stop, digest=None):
+        """Ajouter une ligne au journal (écriture append, vidée immédiatement)"""
+        entry = {"state": state, "collection": collection, "start": start, "stop": stop}
+        if digest is not None:
+            entry["digest"] = digest
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+
+def write_manifest(path, checkpoint):
+    """Écrire le manifeste du jeu de données à partir des empreintes de lots du journal
+
+    Deux exécutions ont généré exactement les mêmes documents si et seulement si
+    leurs empreintes globales (`digest`) sont identiques, quels que soient le
+    nombre de workers et la taille des lots.
+    """
+    collections = {}
+    total = hashlib.sha256()
+    for name in COLLECTIONS:
+        digests = [digest for (collection, _), digest in checkpoint.done.items() if collection == name and digest]
+        if not digests:
+            continue
+        digest = f"{sum(int(d, 16) for d in digests) % (1 << 256):064x}"
+        collections[name] = {"count": checkpoint.header["params"][name], "digest": digest}
+        total.update(f"{name}:{digest}\n".encode('ascii'))
+    manifest = {
+        "seed": checkpoint.header.get("seed"),
+        "referenceTime": checkpoint.header.get("referenceTime"),
+        "params": checkpoint.header["params"],
+        "collections": collections,
+        "digest": total.hexdigest()
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
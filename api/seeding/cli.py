@@ -0,0 +1,251 @@
+"""
+Ligne de commande du seed (python -m seeding, ou python seed_data.py)
+"""
+
+import os
+import sys
+import time
+import argparse
+import importlib.util
+from multiprocessing import Pool
+
+from .config import (
+    DEFAULT_BATCH_SIZE, BCRYPT_ROUNDS, DEFAULT_HASH_CACHE_PATH, DEFAULT_HASH_CACHE_SIZE, DEFAULT_CHECKPOINT_PATH,
+    DEFAULT_MANIFEST_PATH, TIME_PROFILES, DEFAULT_TIME_PROFILE, DEFAULT_TIME_SPAN_YEARS, DEFAULT_COMMENT_FANOUT,
+    DEFAULT_COMMENT_DEPTH, DEFAULT_LIKES_ALPHA, CONTENT_SOURCES, DEFAULT_CONTENT_SOURCE, CONTENT_MIN_BYTES,
+    DEFAULT_CONTENT_ALPHA, CONTENT_MAX_BYTES, DEFAULT_REPORT_PATH, GENERATION_PARAMS, WRITE_CONCERNS,
+    COMPRESSOR_MODULES, CONNECTION_PARAMS, DUMP_FORMATS, DEFAULT_DUMP_FORMAT, DEFAULT_GZIP_LEVEL,
+    DEFAULT_ESTIMATE_SAMPLE_SIZE, DEFAULT_HOT_FRACTION, DEFAULT_ESTIMATE_PATH, MAX_LIKES_PER_POST
+)
+from .corpus import sample_posts_data
+from .dump import dump_synthetic
+from .estimate import run_estimate
+from .hashing import PasswordHashCache
+from .metrics import SeedMetrics, print_report, write_report
+from .pipeline import seed_synthetic, seed_sharded
+from .profiles import SIZE_PROFILES, apply_profile
+from .sample import create_users, create_posts
+from .storage import connect_db
+
+def parse_args(argv=None):
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Seed de la base de données JGazette")
+    parser.add_argument('--profile', choices=SIZE_PROFILES,
+                        help="profil de volume : " + ", ".join(
+                            f"{name} ({p['users']:,} utilisateurs, {p['posts']:,} articles, {p['comments']:,} commentaires)"
+                            for name, p in SIZE_PROFILES.items()
+                        ))
+    parser.add_argument('--users', type=int, help="nombre d'utilisateurs synthétiques à générer")
+    parser.add_argument('--posts', type=int, help="nombre d'articles synthétiques à générer")
+    parser.add_argument('--comments', type=int, help="nombre de commentaires synthétiques à générer")
+    parser.add_argument('--comment-fanout', type=int, default=DEFAULT_COMMENT_FANOUT,
+                        help=f"nombre de réponses par commentaire (défaut: {DEFAULT_COMMENT_FANOUT})")
+    parser.add_argument('--comment-depth', type=int, default=DEFAULT_COMMENT_DEPTH,
+                        help=f"profondeur des fils de commentaires (défaut: {DEFAULT_COMMENT_DEPTH})")
+    parser.add_argument('--comment-posts', type=int, default=0,
+                        help="ne commenter que les N premiers articles (ex. 5 articles à 10k+ commentaires)")
+    parser.add_argument('--likes-alpha', type=float, default=DEFAULT_LIKES_ALPHA,
+                        help=f"exposant de Pareto du nombre de likes par article (défaut: {DEFAULT_LIKES_ALPHA}, "
+                             "plus petit = articles viraux plus nombreux, "
+                             f"au plus {MAX_LIKES_PER_POST} likes par article)")
+    parser.add_argument('--content', choices=CONTENT_SOURCES, default=DEFAULT_CONTENT_SOURCE,
+                        help="contenu des articles : copié du corpus d'exemple, ou synthétisé par une chaîne de Markov "
+                             f"(texte unique, taille à queue lourde) (défaut: {DEFAULT_CONTENT_SOURCE})")
+    parser.add_argument('--content-alpha', type=float, default=DEFAULT_CONTENT_ALPHA,
+                        help=f"exposant de Pareto de la taille du contenu synthétisé (défaut: {DEFAULT_CONTENT_ALPHA})")
+    parser.add_argument('--content-max-bytes', type=int, default=CONTENT_MAX_BYTES,
+                        help=f"taille maximale visée du contenu synthétisé (défaut: {CONTENT_MAX_BYTES}, "
+                             "sous la limite 10mb de express.json)")
+    parser.add_argument('--time-profile', choices=TIME_PROFILES, default=DEFAULT_TIME_PROFILE,
+                        help="répartition des dates de création : uniforme, cycles quotidiens avec pics, "
+                             f"ou croissance exponentielle (défaut: {DEFAULT_TIME_PROFILE})")
+    parser.add_argument('--time-span-years', type=float, default=DEFAULT_TIME_SPAN_YEARS,
+                        help=f"période couverte par les dates, en années (défaut: {DEFAULT_TIME_SPAN_YEARS:g})")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"taille des lots insert_many (défaut: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument('--insert-workers', type=int,
+                        help="lots en vol par processus : au-delà de 1, pipeline asyncio où génération et insertions "
+                             "se recouvrent (défaut: celui du profil, sinon 1)")
+    parser.add_argument('--write-concern', choices=WRITE_CONCERNS,
+                        help="write concern des insertions : 0 (non acquitté, bases jetables uniquement, sans reprise), 1 "
+                             "ou majority (défaut: celui du serveur)")
+    parser.add_argument('--journal', action=argparse.BooleanOptionalAction, default=None,
+                        help="attendre (--journal) ou non (--no-journal) l'écriture du journal de mongod")
+    parser.add_argument('--max-pool-size', type=int,
+                        help="taille maximale du pool de connexions de chaque processus (défaut: celle du driver)")
+    parser.add_argument('--compressors',
+                        help="compression réseau, par ordre de préférence (ex. zstd,snappy,zlib)")
+    parser.add_argument('--output',
+                        help="exporter le jeu synthétique dans ce dossier (fichiers gzip) au lieu de l'insérer en base")
+    parser.add_argument('--format', choices=DUMP_FORMATS, default=DEFAULT_DUMP_FORMAT,
+                        help="format de --output : bson (mongorestore --gzip) ou ndjson (Extended JSON pour "
+                             f"mongoimport) (défaut: {DEFAULT_DUMP_FORMAT})")
+    parser.add_argument('--gzip-level', type=int, default=DEFAULT_GZIP_LEVEL,
+                        help=f"niveau de compression gzip de --output, de 1 (rapide) à 9 (défaut: {DEFAULT_GZIP_LEVEL})")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="ne rien écrire : générer un échantillon de chaque collection, le contrôler et "
+                             "extrapoler la taille des données aux volumes demandés")
+    parser.add_argument('--estimate', action='store_true',
+                        help="avec --dry-run : estimer aussi la taille des index, le working set et le palier Atlas")
+    parser.add_argument('--sample-size', type=int, default=DEFAULT_ESTIMATE_SAMPLE_SIZE,
+                        help="documents échantillonnés par collection pour --dry-run "
+                             f"(défaut: {DEFAULT_ESTIMATE_SAMPLE_SIZE})")
+    parser.add_argument('--hot-fraction', type=float, default=DEFAULT_HOT_FRACTION,
+                        help="part des données lues régulièrement, comptée dans le working set "
+                             f"(défaut: {DEFAULT_HOT_FRACTION})")
+    parser.add_argument('--estimate-output', default=DEFAULT_ESTIMATE_PATH,
+                        help="fichier JSON de l'estimation de --dry-run")
+    parser.add_argument('--bcrypt-rounds', type=int,
+                        help=f"coût bcrypt des mots de passe (défaut: celui du profil, sinon {BCRYPT_ROUNDS} comme User.js)")
+    parser.add_argument('--workers', type=int,
+                        help="nombre de processus de seed, chacun avec son propre client MongoDB "
+                             "(défaut: celui du profil, sinon 1)")
+    parser.add_argument('--hash-workers', type=int, default=os.cpu_count() or 1,
+                        help="nombre total de processus de hachage bcrypt (défaut: nombre de cœurs)")
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT_PATH,
+                        help="journal des lots terminés, utilisé pour la reprise")
+    parser.add_argument('--resume', action='store_true',
+                        help="reprendre le seed synthétique interrompu décrit par --checkpoint")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="graine du générateur : jeu de données reproductible octet pour octet")
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST_PATH,
+                        help="fichier du manifeste (empreintes SHA-256) du jeu de données généré")
+    parser.add_argument('--report', default=DEFAULT_REPORT_PATH,
+                        help="rapport JSON de l'exécution (débits, latences des lots, temps par étape)")
+    parser.add_argument('--hash-cache', default=DEFAULT_HASH_CACHE_PATH,
+                        help="fichier du cache de hachés bcrypt pré-calculés")
+    parser.add_argument('--hash-cache-size', type=int, default=DEFAULT_HASH_CACHE_SIZE,
+                        help=f"nombre maximal de hachés conservés (défaut: {DEFAULT_HASH_CACHE_SIZE})")
+    parser.add_argument('--no-hash-cache', action='store_true', help="toujours recalculer les hachés bcrypt")
+    args = parser.parse_args(argv)
+    apply_profile(args, {
+        "users": 0, "posts": 0, "comments": 0, "bcrypt_rounds": BCRYPT_ROUNDS, "workers": 1, "insert_workers": 1
+    })
+    if min(args.users, args.posts, args.comments) < 0 or args.batch_size < 1:
+        parser.error("les nombres de documents doivent être positifs et --batch-size >= 1")
+    if args.comment_fanout < 1 or args.comment_depth < 0 or args.comment_posts < 0:
+        parser.error("--comment-fanout doit être >= 1, --comment-depth et --comment-posts >= 0")
+    if args.likes_alpha <= 0:
+        parser.error("--likes-alpha doit être > 0")
+    if args.content_alpha <= 0 or not CONTENT_MIN_BYTES <= args.content_max_bytes <= CONTENT_MAX_BYTES:
+        parser.error(f"--content-alpha doit être > 0 et --content-max-bytes entre {CONTENT_MIN_BYTES} et {CONTENT_MAX_BYTES}")
+    if args.time_span_years <= 0:
+        parser.error("--time-span-years doit être > 0")
+    if not 4 <= args.bcrypt_rounds <= 31:
+        parser.error("--bcrypt-rounds doit être compris entre 4 et 31")
+    if args.resume and not os.path.exists(args.checkpoint):
+        parser.error(f"aucun journal de reprise trouvé: {args.checkpoint}")
+    if args.write_concern == "0" and args.resume:
+        parser.error("--resume exige un write concern acquitté : avec --write-concern 0, les lots ne sont pas confirmés")
+    if args.write_concern == "0" and args.journal:
+        parser.error("--journal exige un write concern acquitté (--write-concern 1 ou majority)")
+    if args.max_pool_size is not None and args.max_pool_size < 1:
+        parser.error("--max-pool-size doit être >= 1")
+    if args.insert_workers < 1:
+        parser.error("--insert-workers doit être >= 1")
+    if args.compressors:
+        for compressor in args.compressors.split(','):
+            if compressor not in COMPRESSOR_MODULES:
+                parser.error(f"compresseur inconnu: {compressor} (choix: {', '.join(COMPRESSOR_MODULES)})")
+            module = COMPRESSOR_MODULES[compressor]
+            if module and importlib.util.find_spec(module) is None:
+                parser.error(f"le compresseur {compressor} nécessite le paquet Python {module}")
+    if args.hash_workers < 1 or args.workers < 1:
+        parser.error("--hash-workers et --workers doivent être >= 1")
+    if args.estimate and not args.dry_run:
+        parser.error("--estimate s'utilise avec --dry-run")
+    if args.dry_run:
+        if args.output or args.resume:
+            parser.error("--dry-run n'écrit rien : incompatible avec --output et --resume")
+        if not (args.users or args.posts or args.comments):
+            parser.error("--dry-run exige un profil ou des volumes (--users, --posts, --comments)")
+        if args.sample_size < 1 or not 0 <= args.hot_fraction <= 1:
+            parser.error("--sample-size doit être >= 1 et --hot-fraction compris entre 0 et 1")
+    if args.output and not (args.users or args.posts or args.comments):
+        parser.error("--output exige un profil ou des volumes (--users, --posts, --comments) : rien n'est écrit en base")
+    if args.output or args.dry_run:
+        if args.resume:
+            parser.error("--resume ne s'applique pas à --output : relancer l'export")
+        if (args.posts and not args.users) or (args.comments and not (args.users and args.posts)):
+            parser.error("--output et --dry-run exigent de générer les collections référencées (--users pour les articles, "
+                         "--users et --posts pour les commentaires)")
+        if not 1 <= args.gzip_level <= 9:
+            parser.error("--gzip-level doit être compris entre 1 et 9")
+    return args
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+    if args.dry_run:
+        run_estimate(args)
+        return
+    try:
+        print("🌱 Début de l'injection des données de test...")
+        
+        # Démarrer le pool de hachage avant d'ouvrir le client (pas de fork d'un MongoClient)
+        synthetic = args.resume or args.users or args.posts or args.comments
+        offline = bool(args.output)
+        sharded = (args.workers > 1 or offline) and synthetic
+        pool = None if sharded else Pool(args.hash_workers)
+        cache = None if args.no_hash_cache else PasswordHashCache(args.hash_cache, args.hash_cache_size)
+        
+        # Se connecter à la base de données (inutile pour un export hors ligne)
+        if not offline:
+            client, db = connect_db(args)
+
+        if synthetic:
+            # Mode synthétique à grande échelle
+            started = time.perf_counter()
+            metrics = SeedMetrics()
+            if offline:
+                summary = dump_synthetic(args, cache, metrics)
+            elif sharded:
+                summary = seed_sharded(db, args, cache, metrics)
+            else:
+                summary = seed_synthetic(db, pool, args, cache, metrics)
+            elapsed = time.perf_counter() - started
+            print("\n📊 Résumé des données créées :")
+            for name, count in summary.items():
+                print(f"   - {name}: {count}")
+            total = sum(summary.values())
+            print(f"⏱️  Durée: {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} docs/s au total)")
+            report = metrics.report(
+                elapsed, {name: getattr(args, name) for name in GENERATION_PARAMS}, args.workers,
+                {name: getattr(args, name) for name in CONNECTION_PARAMS}
+            )
+            print_report(report)
+            write_report(args.report, report)
+            print(f"🧾 Rapport d'exécution {args.report}")
+            if summary.get("users"):
+                print("🔑 Identifiants de test: jean.dupont / password123 (et userNNNNNNN / password123)")
+            return
+        
+        # Créer les utilisateurs
+        users = create_users(db, pool, args.bcrypt_rounds, cache)
+        
+        # Créer les posts
+        create_posts(db, users)
+        
+        # Afficher un résumé
+        print("\n📊 Résumé des données créées :")
+        print(f"👥 Utilisateurs: {len(users)}")
+        print(f"📝 Posts: {len(sample_posts_data)}")
+        
+        print("\n🎉 Injection des données terminée avec succès !")
+        print("🌐 Vous pouvez maintenant tester l'API sur http://localhost:5000")
+        print("🔑 Identifiants de test:")
+        for user in users:
+            print(f"   - {user['username']} / {user['password']}")
+        
+    except Exception as e:
+        print(f"❌ Erreur lors de l'injection des données: {e}")
+        sys.exit(1)
+    finally:
+        # Arrêter le pool de hachage et fermer la connexion
+        if locals().get('pool') is not None:
+            pool.terminate()
+        if locals().get('cache') is not None:
+            cache.close()
+        if 'client' in locals():
+            client.close()
+            print("🔌 Connexion MongoDB fermée")
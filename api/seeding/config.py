@@ -0,0 +1,133 @@
+"""
+Configuration du seed : connexion MongoDB, chemins et paramètres par défaut
+"""
+
+import os
+from datetime import datetime, timezone
+from dotenv import load_dotenv
+
+# Charger les variables d'environnement
+load_dotenv()
+
+# Configuration MongoDB
+MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/jgazette')
+DB_NAME = 'jgazette'
+# Cluster Atlas de destination des migrations (voir migrate.py)
+MONGODB_ATLAS_URI = os.getenv('MONGODB_ATLAS_URI')
+
+# Fichiers de travail du seed (cache de hachés, journal, manifeste)
+SEED_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.seed-cache')
+
+# Collections générées, dans l'ordre de génération
+COLLECTIONS = ("users", "posts", "comments")
+
+# Taille par défaut des lots insert_many en mode synthétique
+DEFAULT_BATCH_SIZE = 1000
+
+# Préfixes d'ObjectId par collection pour le mode synthétique
+ID_KIND_USER = 1
+ID_KIND_POST = 2
+ID_KIND_COMMENT = 3
+ID_KIND_THREAD = 4
+ID_KIND_REPORT = 5
+ID_KIND_MODERATION = 6
+
+# Coût bcrypt par défaut : identique à User.js (bcrypt.hash(password, 12))
+BCRYPT_ROUNDS = 12
+
+# Cache disque des hachés bcrypt pré-calculés (voir PasswordHashCache)
+DEFAULT_HASH_CACHE_PATH = os.path.join(SEED_CACHE_DIR, 'password-hashes.sqlite3')
+DEFAULT_HASH_CACHE_SIZE = 1_000_000
+
+# Journal de reprise du mode synthétique (voir SeedCheckpoint)
+DEFAULT_CHECKPOINT_PATH = os.path.join(SEED_CACHE_DIR, 'checkpoint.jsonl')
+
+# Suffixe des collections de chargement, renommées sur les collections live en fin de seed
+STAGING_SUFFIX = '__seed_staging'
+
+# Manifeste du jeu de données généré (empreinte SHA-256 des documents, voir write_manifest)
+DEFAULT_MANIFEST_PATH = os.path.join(SEED_CACHE_DIR, 'manifest.json')
+
+# Rapport JSON de l'exécution : débits, latences des lots, temps par étape (voir metrics.py)
+DEFAULT_REPORT_PATH = os.path.join(SEED_CACHE_DIR, 'report.json')
+
+# Date de référence des jeux reproductibles (--seed) : les dates sont réparties sur la période qui précède
+REFERENCE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Profils de répartition des dates de création (voir SyntheticRun.created_at)
+TIME_PROFILES = ("uniform", "daily", "growth")
+DEFAULT_TIME_PROFILE = "uniform"
+DEFAULT_TIME_SPAN_YEARS = 1.0
+# Profil « growth » : l'activité du dernier jour est GROWTH_FACTOR fois celle du premier
+GROWTH_FACTOR = 20.0
+# Profil « daily » : poids relatif de chaque heure (creux la nuit, pics le matin et en soirée)
+HOURLY_WEIGHTS = [1, 1, 1, 1, 1, 2, 4, 7, 9, 10, 9, 8, 8, 8, 7, 7, 7, 8, 9, 11, 12, 10, 6, 3]
+# Profil « daily » : environ BURST_DAYS_PERCENT % des jours sont des pics d'activité (x BURST_FACTOR)
+BURST_DAYS_PERCENT = 5
+BURST_FACTOR = 5
+
+# Clé d'unicité utilisée pour les upserts quand un lot a pu être partiellement écrit
+UPSERT_KEYS = {"users": "_id", "posts": "slug", "comments": "_id"}
+
+# Forme par défaut des fils de commentaires : 3 réponses par commentaire sur 2 niveaux,
+# soit les 3 niveaux peuplés par getCommentsByPost (commentaire, réponses, réponses aux réponses)
+DEFAULT_COMMENT_FANOUT = 3
+DEFAULT_COMMENT_DEPTH = 2
+
+# Exposant de la loi de Pareto du nombre de likes par article : avec 1.2, la moyenne est
+# de quelques likes et, sur un million d'articles, les plus viraux dépassent 100k likes
+DEFAULT_LIKES_ALPHA = 1.2
+
+# Contenu des articles synthétiques : copié du corpus, ou synthétisé (voir markov.py)
+CONTENT_SOURCES = ("corpus", "markov")
+DEFAULT_CONTENT_SOURCE = "corpus"
+# Taille du contenu synthétisé (octets UTF-8) : loi de Pareto de minimum CONTENT_MIN_BYTES, de
+# médiane proche de celle du corpus (2,4 ko) avec l'exposant par défaut, bornée sous la limite
+# de 10mb de express.json (src/server.js) en laissant de la place au reste du document JSON
+CONTENT_MIN_BYTES = 1500
+DEFAULT_CONTENT_ALPHA = 1.5
+CONTENT_MAX_BYTES = 10 * 1024 * 1024 - 64 * 1024
+
+# Les likes d'un article sont des ObjectId dans le document : environ 20 octets BSON par entrée
+# (type, index décimal, 12 octets). Leur nombre est plafonné pour que l'article le plus gros
+# (contenu de CONTENT_MAX_BYTES) reste sous la limite de 16 Mio d'un document MongoDB,
+# soit environ 314k likes : au-delà de ~840k utilisateurs, la loi de Pareto la dépasserait
+BSON_MAX_DOCUMENT_BYTES = 16 * 1024 * 1024
+LIKE_ENTRY_BYTES = 20
+MAX_LIKES_PER_POST = (BSON_MAX_DOCUMENT_BYTES - CONTENT_MAX_BYTES - 64 * 1024) // LIKE_ENTRY_BYTES
+
+# Réglages de connexion des chargements (--write-concern, --journal, --max-pool-size, --compressors),
+# repris dans le rapport d'exécution pour comparer les débits d'un environnement à l'autre
+WRITE_CONCERNS = ("0", "1", "majority")
+# Compresseur réseau -> paquet Python requis par pymongo (None : inclus dans Python)
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": None}
+CONNECTION_PARAMS = (
+    "write_concern", "journal", "max_pool_size", "compressors", "batch_size", "workers", "insert_workers"
+)
+
+# Export hors ligne (--output) : archives BSON pour mongorestore --gzip, ou Extended JSON
+# par lignes pour mongoimport, compressées en gzip (voir dump.py)
+DUMP_FORMATS = ("bson", "ndjson")
+DEFAULT_DUMP_FORMAT = "bson"
+DEFAULT_GZIP_LEVEL = 6
+
+# Estimation de capacité (--dry-run --estimate) : documents générés par collection pour
+# l'échantillon, et part des données lues régulièrement (articles récents et leurs fils)
+DEFAULT_ESTIMATE_SAMPLE_SIZE = 2000
+DEFAULT_HOT_FRACTION = 0.2
+DEFAULT_ESTIMATE_PATH = os.path.join(SEED_CACHE_DIR, 'estimate.json')
+# Paliers Atlas dédiés : nom, mémoire et stockage par défaut (octets)
+ATLAS_TIERS = (
+    ("M10", 2 << 30, 10 << 30), ("M20", 4 << 30, 20 << 30), ("M30", 8 << 30, 40 << 30),
+    ("M40", 16 << 30, 80 << 30), ("M50", 32 << 30, 160 << 30), ("M60", 64 << 30, 320 << 30),
+    ("M80", 128 << 30, 750 << 30)
+)
+
+# Paramètres de génération enregistrés dans le journal et restaurés par --resume
+GENERATION_PARAMS = (
+    "users", "posts", "comments", "batch_size", "comment_fanout", "comment_depth", "comment_posts", "likes_alpha",
+    "time_profile", "time_span_years", "profile", "bcrypt_rounds", "content", "content_alpha", "content_max_bytes"
+)
+
+# Un utilisateur synthétique sur PUBLISHER_EVERY est publieur (et auteur d'articles)
+PUBLISHER_EVERY = 10
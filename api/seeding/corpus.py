@@ -0,0 +1,175 @@
+"""
+Corpus d'exemple du seed : utilisateurs, articles et commentaires
+
+Les articles sont stockés dans data/posts.corpus, compressés un par un et lus à
+la demande par ArticleCorpus : importer ce module ne décode aucun article.
+Pour modifier le corpus :
+    python -m seeding.corpus export > posts.jsonl   # un article JSON par ligne
+    python -m seeding.corpus build posts.jsonl      # recompresser data/posts.corpus
+"""
+
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+from math import ceil
+from functools import lru_cache
+
+# Fichier du corpus d'articles (voir ArticleCorpus)
+POSTS_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'posts.corpus')
+CORPUS_MAGIC = b'JGCORP01'
+# En-tête : signature, nombre d'articles ; puis n + 1 positions (fin du dernier article incluse)
+CORPUS_HEADER = struct.Struct('<8sI')
+CORPUS_OFFSET = struct.Struct('<Q')
+# Articles décodés gardés en mémoire par processus
+CORPUS_CACHE_SIZE = 256
+
+# Utilisateurs d'exemple (publieurs : ils signent les articles du jeu d'exemple)
+sample_users = [
+    {
+        "username": "jean.dupont",
+        "email": "jean.dupont@example.com",
+        "password": "password123",
+        "role": "publisher",
+        "profile": {
+            "firstName": "Jean",
+            "lastName": "Dupont"
+        }
+    },
+    {
+        "username": "marie.martin",
+        "email": "marie.martin@example.com",
+        "password": "password123",
+        "role": "publisher",
+        "profile": {
+            "firstName": "Marie",
+            "lastName": "Martin"
+        }
+    },
+    {
+        "username": "pierre.durand",
+        "email": "pierre.durand@example.com",
+        "password": "password123",
+        "role": "publisher",
+        "profile": {
+            "firstName": "Pierre",
+            "lastName": "Durand"
+        }
+    },
+    {
+        "username": "sophie.bernard",
+        "email": "sophie.bernard@example.com",
+        "password": "password123",
+        "role": "publisher",
+        "profile": {
+            "firstName": "Sophie",
+            "lastName": "Bernard"
+        }
+    },
+    {
+        "username": "lucas.moreau",
+        "email": "lucas.moreau@example.com",
+        "password": "password123",
+        "role": "publisher",
+        "profile": {
+            "firstName": "Lucas",
+            "lastName": "Moreau"
+        }
+    }
+]
+
+def read_time(content):
+    """Temps de lecture en minutes, calculé comme Post.calculateReadTime (200 mots par minute)
+
+    content.split(' ').length en JavaScript vaut le nombre d'espaces + 1 : on compte
+    les espaces sans découper la chaîne.
+    """
+    return max(1, ceil((content.count(' ') + 1) / 200))
+
+class ArticleCorpus:
+    """Articles d'exemple (sans author ni dates), projetés en mémoire et décodés un par un
+
+    Chaque article est un objet JSON compressé séparément (zlib) : lire l'article i
+    ne décompresse que lui. Le fichier n'est ouvert qu'au premier accès, dans chaque
+    processus, et les derniers articles décodés sont gardés en cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = None
+        self.offsets = None
+        self.article = lru_cache(maxsize=CORPUS_CACHE_SIZE)(self.decode)
+
+    def open(self):
+        if self.data is None:
+            with open(self.path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, count = CORPUS_HEADER.unpack_from(data)
+            if magic != CORPUS_MAGIC:
+                raise ValueError(f"Corpus d'articles invalide: {self.path}")
+            self.offsets = struct.unpack_from(f'<{count + 1}Q', data, CORPUS_HEADER.size)
+            self.data = data
+        return self
+
+    def decode(self, index):
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return json.loads(zlib.decompress(self.data[start:stop]))
+
+    def __len__(self):
+        return len(self.open().offsets) - 1
+
+    def __getitem__(self, index):
+        """Article `index` (un nouveau dict à chaque appel : l'appelant peut le modifier)"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return dict(self.article(index))
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+def build_corpus(articles, path=POSTS_CORPUS_PATH):
+    """Écrire un fichier de corpus à partir d'articles (readTime recalculé)"""
+    chunks = []
+    for article in articles:
+        article = {**article, "readTime": read_time(article["content"])}
+        chunks.append(zlib.compress(json.dumps(article, ensure_ascii=False).encode('utf-8'), 9))
+    position = CORPUS_HEADER.size + CORPUS_OFFSET.size * (len(chunks) + 1)
+    offsets = []
+    for chunk in chunks:
+        offsets.append(position)
+        position += len(chunk)
+    offsets.append(position)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(CORPUS_HEADER.pack(CORPUS_MAGIC, len(chunks)))
+        f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        for chunk in chunks:
+            f.write(chunk)
+    return len(chunks)
+
+sample_posts_data = ArticleCorpus(POSTS_CORPUS_PATH)
+
+sample_comments = [
+    "Excellent article ! Merci pour ce guide détaillé.",
+    "Très utile, je vais essayer ça sur mon projet.",
+    "Super clair, les exemples de code aident beaucoup.",
+    "J'ai une question sur la configuration. Une idée ?",
+    "Merci pour le partage, j'attends la suite avec impatience !"
+]
+
+report_reasons = ['spam', 'inappropriate', 'harassment', 'offensive', 'other']
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["export"]:
+        for article in sample_posts_data:
+            article.pop("readTime", None)
+            print(json.dumps(article, ensure_ascii=False))
+    elif sys.argv[1:2] == ["build"] and len(sys.argv) == 3:
+        with open(sys.argv[2], encoding='utf-8') as f:
+            count = build_corpus(json.loads(line) for line in f if line.strip())
+        print(f"✅ {count} articles écrits dans {POSTS_CORPUS_PATH}")
+    else:
+        print("Usage : python -m seeding.corpus export > posts.jsonl | build posts.jsonl")
+        sys.exit(1)
@@ -0,0 +1,282 @@
+"""
+Comparaison de deux bases JGazette (locale et Atlas) par arbre de hachage sur les plages de _id
+
+scripts/check-local-data.js et check-atlas-data.js ne donnent que des nombres de
+documents. Ici, l'espace des ObjectId [plus petit _id, plus grand _id] est découpé
+en --fanout plages ; pour chaque plage, les deux serveurs calculent en parallèle le
+nombre de documents et une somme d'empreintes ($toHashedIndexKey de chaque
+document, agrégé par $group). Seules les plages qui diffèrent sont redécoupées,
+jusqu'à des feuilles de --leaf-size documents au plus, dont on compare les
+empreintes document par document : seuls des compteurs et des empreintes de
+8 octets transitent sur le réseau.
+
+Si l'un des serveurs ne connaît pas $toHashedIndexKey, les deux collections sont
+lues en entier par ordre de _id et comparées par fusion (SHA-256 de chaque document).
+
+Un document est « modifié » si ses champs, leur ordre ou leurs valeurs diffèrent,
+avec la règle des index hachés pour les nombres : $toHashedIndexKey ramène chaque
+nombre à un entier 64 bits (troncature). Int32, Int64 et double de même valeur
+entière sont donc égaux, et un changement de la seule partie décimale (2.2 -> 2.3)
+n'est pas détecté. La lecture complète applique la même réduction avant le SHA-256 :
+les deux modes donnent le même résultat.
+
+Usage (depuis api/) :
+    python -m seeding.diff                       # MONGODB_URI contre MONGODB_ATLAS_URI
+    python -m seeding.diff --source mongodb://localhost:27017/jgazette --target mongodb+srv://...
+    python -m seeding.diff --collections posts --fanout 32 --leaf-size 5000
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+from decimal import Decimal
+from bson import ObjectId, Int64, Decimal128, encode as bson_encode
+
+from .config import MONGODB_URI, MONGODB_ATLAS_URI, DB_NAME, COLLECTIONS, SEED_CACHE_DIR
+
+DEFAULT_DIFF_REPORT_PATH = os.path.join(SEED_CACHE_DIR, 'diff.json')
+DEFAULT_FANOUT = 16
+DEFAULT_LEAF_SIZE = 1000
+# Les ObjectId sont des entiers de 96 bits : les plages sont des intervalles [début, fin)
+ID_SPACE = 1 << 96
+# Empreintes réduites modulo 2^32 avant la somme : pas de dépassement sur 64 bits
+HASH_MODULUS = 1 << 32
+# Identifiants affichés par catégorie (le rapport JSON les contient tous)
+PRINTED_IDS = 10
+# Bornes des entiers 64 bits auxquels $toHashedIndexKey ramène les nombres
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+def id_number(object_id):
+    return int.from_bytes(object_id.binary, 'big')
+
+def range_match(start, stop):
+    """Filtre des _id de l'intervalle d'entiers [start, stop)"""
+    bounds = {"$gte": ObjectId(start.to_bytes(12, 'big'))}
+    if stop < ID_SPACE:
+        bounds["$lt"] = ObjectId(stop.to_bytes(12, 'big'))
+    return {"_id": bounds}
+
+def range_summary(collection, start, stop):
+    """(nombre de documents, somme des empreintes) d'une plage, calculés par le serveur"""
+    result = list(collection.aggregate([
+        {"$match": range_match(start, stop)},
+        {"$group": {"_id": None, "n": {"$sum": 1}, "h": {"$sum": {"$mod": [{"$toHashedIndexKey": "$$ROOT"}, HASH_MODULUS]}}}}
+    ]))
+    return (result[0]["n"], result[0]["h"]) if result else (0, 0)
+
+def range_hashes(collection, start, stop):
+    """Empreinte de chaque document d'une plage (feuille de l'arbre) : _id -> empreinte"""
+    return {
+        doc["_id"]: doc["h"]
+        for doc in collection.aggregate([
+            {"$match": range_match(start, stop)},
+            {"$project": {"h": {"$toHashedIndexKey": "$$ROOT"}}}
+        ])
+    }
+
+def supports_server_hashing(collection):
+    try:
+        list(collection.aggregate([{"$limit": 1}, {"$project": {"h": {"$toHashedIndexKey": "$$ROOT"}}}]))
+        return True
+    except OperationFailure:
+        return False
+
+def id_bounds(source, target):
+    """Intervalle [plus petit _id, plus grand _id + 1) couvrant les deux collections, None si elles sont vides"""
+    ids = []
+    for collection in (source, target):
+        for direction in (ASCENDING, DESCENDING):
+            doc = collection.find_one({}, {"_id": 1}, sort=[("_id", direction)])
+            if doc is not None:
+                if not isinstance(doc["_id"], ObjectId):
+                    raise ValueError(f"{collection.name}: _id {doc['_id']!r} n'est pas un ObjectId")
+                ids.append(id_number(doc["_id"]))
+    return (min(ids), max(ids) + 1) if ids else None
+
+def split(start, stop, fanout):
+    """Découper [start, stop) en au plus `fanout` intervalles contigus"""
+    step = -(-(stop - start) // fanout)
+    return [(low, min(low + step, stop)) for low in range(start, stop, step)]
+
+def compare_leaf(source_hashes, target_hashes, result):
+    """Classer les _id d'une feuille : absents de la cible, en trop dans la cible, modifiés"""
+    for _id, digest in source_hashes.items():
+        if _id not in target_hashes:
+            result["missing"].append(_id)
+        elif target_hashes[_id] != digest:
+            result["changed"].append(_id)
+    result["extra"].extend(_id for _id in target_hashes if _id not in source_hashes)
+
+def merkle_diff(source, target, executor, fanout, leaf_size):
+    """Descendre l'arbre des plages de _id en ne suivant que les plages différentes"""
+    result = {"missing": [], "extra": [], "changed": [], "queries": 0, "leaves": 0}
+    bounds = id_bounds(source, target)
+    level = [bounds] if bounds else []
+    while level:
+        summaries = [
+            (executor.submit(range_summary, source, *node), executor.submit(range_summary, target, *node))
+            for node in level
+        ]
+        result["queries"] += 2 * len(level)
+        differing, leaves = [], []
+        for (start, stop), (source_summary, target_summary) in zip(level, summaries):
+            source_summary, target_summary = source_summary.result(), target_summary.result()
+            if source_summary == target_summary:
+                continue
+            if max(source_summary[0], target_summary[0]) <= leaf_size or stop - start <= fanout:
+                leaves.append((start, stop))
+            else:
+                differing.extend(split(start, stop, fanout))
+        hashes = [
+            (executor.submit(range_hashes, source, *leaf), executor.submit(range_hashes, target, *leaf))
+            for leaf in leaves
+        ]
+        result["queries"] += 2 * len(leaves)
+        result["leaves"] += len(leaves)
+        for source_hashes, target_hashes in hashes:
+            compare_leaf(source_hashes.result(), target_hashes.result(), result)
+        level = differing
+    return result
+
+def hashed_number(value):
+    """Entier 64 bits d'un nombre, comme pour un index haché : troncature, bornes saturées, NaN -> 0"""
+    if isinstance(value, Decimal128):
+        value = value.to_decimal()
+    if isinstance(value, (float, Decimal)):
+        if value != value:
+            return 0
+        if value >= 1 << 63:
+            return INT64_MAX
+        if value < INT64_MIN:
+            return INT64_MIN
+    return int(value)
+
+def hashed_form(value):
+    """Valeur où chaque nombre est remplacé par son Int64 haché (les booléens ne sont pas des nombres)"""
+    if isinstance(value, dict):
+        return {key: hashed_form(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [hashed_form(item) for item in value]
+    if isinstance(value, (int, float, Decimal128)) and not isinstance(value, bool):
+        return Int64(hashed_number(value))
+    return value
+
+def client_hashes(collection):
+    """(_id, SHA-256 du document ramené à sa forme hachée) de toute la collection, par ordre de _id"""
+    for doc in collection.find({}, sort=[("_id", ASCENDING)], batch_size=10_000):
+        yield doc["_id"], hashlib.sha256(bson_encode(hashed_form(doc))).digest()
+
+def streaming_diff(source, target):
+    """Comparaison sans hachage côté serveur : fusion des deux collections lues par ordre de _id"""
+    result = {"missing": [], "extra": [], "changed": [], "queries": 2, "leaves": 0}
+    source_docs, target_docs = client_hashes(source), client_hashes(target)
+    left, right = next(source_docs, None), next(target_docs, None)
+    while left is not None or right is not None:
+        if right is None or (left is not None and left[0] < right[0]):
+            result["missing"].append(left[0])
+            left = next(source_docs, None)
+        elif left is None or right[0] < left[0]:
+            result["extra"].append(right[0])
+            right = next(target_docs, None)
+        else:
+            if left[1] != right[1]:
+                result["changed"].append(left[0])
+            left, right = next(source_docs, None), next(target_docs, None)
+    return result
+
+def diff_collection(source, target, args, executor):
+    """Comparer une collection des deux bases ; retourne les _id différents et le coût de la comparaison"""
+    started = time.perf_counter()
+    server = args.mode == "server" or (
+        args.mode == "auto" and supports_server_hashing(source) and supports_server_hashing(target)
+    )
+    if server:
+        result = merkle_diff(source, target, executor, args.fanout, args.leaf_size)
+    else:
+        result = streaming_diff(source, target)
+    for key in ("missing", "extra", "changed"):
+        result[key] = sorted(result[key])
+    return {
+        "mode": "server" if server else "client",
+        "sourceCount": source.estimated_document_count(),
+        "targetCount": target.estimated_document_count(),
+        **result,
+        "identical": not (result["missing"] or result["extra"] or result["changed"]),
+        "elapsedSeconds": round(time.perf_counter() - started, 3)
+    }
+
+def print_diff(name, entry):
+    icon = "✅" if entry["identical"] else "❌"
+    print(f"  {icon} {name} ({entry['mode']}, {entry['queries']} requêtes, {entry['elapsedSeconds']:.1f}s): "
+          f"{entry['sourceCount']} / {entry['targetCount']} documents, {len(entry['missing'])} absents de la cible, "
+          f"{len(entry['extra'])} en trop, {len(entry['changed'])} modifiés")
+    for key, label in (("missing", "absents"), ("extra", "en trop"), ("changed", "modifiés")):
+        if entry[key]:
+            shown = ", ".join(str(_id) for _id in entry[key][:PRINTED_IDS])
+            more = f" (+{len(entry[key]) - PRINTED_IDS})" if len(entry[key]) > PRINTED_IDS else ""
+            print(f"     - {label}: {shown}{more}")
+
+def parse_args(argv=None):
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Comparaison de deux bases JGazette par plages de _id")
+    parser.add_argument('--source', default=MONGODB_URI, help="base de référence (défaut: MONGODB_URI)")
+    parser.add_argument('--target', default=MONGODB_ATLAS_URI, help="base comparée (défaut: MONGODB_ATLAS_URI)")
+    parser.add_argument('--collections', nargs='+', choices=COLLECTIONS, default=list(COLLECTIONS),
+                        help="collections à comparer (défaut: toutes)")
+    parser.add_argument('--workers', type=int, default=8, help="requêtes en parallèle sur chaque serveur (défaut: 8)")
+    parser.add_argument('--fanout', type=int, default=DEFAULT_FANOUT,
+                        help=f"sous-plages par plage différente (défaut: {DEFAULT_FANOUT})")
+    parser.add_argument('--leaf-size', type=int, default=DEFAULT_LEAF_SIZE,
+                        help=f"documents au plus d'une plage comparée document par document (défaut: {DEFAULT_LEAF_SIZE})")
+    parser.add_argument('--mode', choices=("auto", "server", "client"), default="auto",
+                        help="hachage côté serveur ($toHashedIndexKey), lecture complète, ou auto (défaut) : "
+                             "même résultat, nombres comparés par leur partie entière")
+    parser.add_argument('--report', default=DEFAULT_DIFF_REPORT_PATH, help="rapport JSON des _id différents")
+    args = parser.parse_args(argv)
+    if not args.target:
+        parser.error("MONGODB_ATLAS_URI n'est pas définie dans les variables d'environnement (ou passer --target)")
+    if args.workers < 1 or args.fanout < 2 or args.leaf_size < 1:
+        parser.error("--workers et --leaf-size doivent être >= 1, --fanout >= 2")
+    return args
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+    clients = []
+    try:
+        clients = [MongoClient(args.source, maxPoolSize=args.workers), MongoClient(args.target, maxPoolSize=args.workers)]
+        source_db, target_db = (client.get_default_database(DB_NAME) for client in clients)
+        print(f"🔍 Comparaison de {source_db.name} (source) et {target_db.name} (cible)...")
+        report = {"source": source_db.name, "target": target_db.name, "collections": {}}
+        with ThreadPoolExecutor(args.workers * 2) as executor:
+            for name in args.collections:
+                entry = diff_collection(source_db[name], target_db[name], args, executor)
+                print_diff(name, entry)
+                report["collections"][name] = {
+                    key: [str(_id) for _id in value] if key in ("missing", "extra", "changed") else value
+                    for key, value in entry.items()
+                }
+        report["identical"] = all(entry["identical"] for entry in report["collections"].values())
+        os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"🧾 Rapport {args.report}")
+        if not report["identical"]:
+            sys.exit(1)
+        print("✅ Les deux bases sont identiques")
+    except Exception as e:
+        print(f"❌ Erreur lors de la comparaison: {e}")
+        sys.exit(1)
+    finally:
+        for client in clients:
+            client.close()
+        print("🔌 Connexions fermées")
+
+if __name__ == "__main__":
+    main()
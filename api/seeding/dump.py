@@ -0,0 +1,228 @@
+"""
+Export hors ligne du seed synthétique : fichiers compressés à restaurer autant de fois que nécessaire
+
+Au lieu d'insérer dans un serveur, chaque processus écrit les documents de ses
+plages dans ses propres fichiers gzip, sans aller-retour réseau :
+
+- bson : `<output>/jgazette/<collection>.bson.gz` et `.metadata.json.gz` (index des
+  modèles), l'arborescence de mongodump --gzip. Les parts des workers sont des
+  membres gzip concaténés en fin d'export : un flux gzip valide, dans l'ordre des index.
+      mongorestore --gzip --dir <output> --drop --numInsertionWorkersPerCollection 8
+- ndjson : `<output>/jgazette/<collection>.<worker>.json.gz`, Extended JSON (relaxed)
+  à raison d'un document par ligne. Les index sont créés par Mongoose au démarrage de l'API.
+      gunzip -c <output>/jgazette/posts.*.json.gz | mongoimport --db jgazette --collection posts --numInsertionWorkers 8
+
+Les compteurs `stats` des utilisateurs ne peuvent pas être recalculés côté serveur :
+les articles et commentaires sont générés d'abord, en comptant auteurs et likes,
+puis les utilisateurs, avec leurs compteurs. L'empreinte d'un lot est calculée avant
+l'ajout des compteurs, comme en ligne : le manifeste est celui d'un seed en base.
+"""
+
+import os
+import glob
+import gzip
+import json
+import time
+import shutil
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import Pool
+from bson import encode as bson_encode, json_util
+
+from .config import DB_NAME, COLLECTIONS, GENERATION_PARAMS
+from .checkpoint import SeedCheckpoint, write_manifest
+from .generators import GENERATORS, SeedContext, reference_resolvers
+from .hashing import PasswordHashCache
+from .metrics import SeedMetrics
+from .pipeline import split_range
+from .run import SyntheticRun
+from .schema import validate_document
+from .storage import MODEL_INDEXES, pending_batches, encoded_digest
+
+# Compteurs des utilisateurs, mêmes règles que recompute_user_stats
+STATS_FIELDS = ("postsCount", "commentsCount", "likesGiven", "likesReceived")
+
+# Suffixe des fichiers par format
+EXTENSIONS = {"bson": ".bson.gz", "ndjson": ".json.gz"}
+
+def dump_directory(output):
+    return os.path.join(output, DB_NAME)
+
+def part_path(output, dump_format, name, worker):
+    """Fichier écrit par un worker : part à concaténer (bson) ou fichier final (ndjson)"""
+    if dump_format == "bson":
+        return os.path.join(dump_directory(output), ".parts", f"{name}.{worker:04d}{EXTENSIONS['bson']}")
+    return os.path.join(dump_directory(output), f"{name}.{worker:04d}{EXTENSIONS['ndjson']}")
+
+def collection_metadata(name):
+    """Métadonnées lues par mongorestore : options et index à construire après le chargement"""
+    indexes = [{"v": 2, "key": {"_id": 1}, "name": "_id_"}]
+    for index in MODEL_INDEXES[name]:
+        document = index.document
+        indexes.append({"v": 2, **document, "key": dict(document["key"])})
+    return {"options": {}, "indexes": indexes, "collectionName": name, "type": "collection"}
+
+def count_references(name, batch, counters):
+    """Ajouter aux compteurs des utilisateurs les articles, commentaires et likes d'un lot"""
+    for doc in batch:
+        counters["likesGiven"].update(doc["likes"])
+        counters["likesReceived"][doc["author"]] += len(doc["likes"])
+        counters["postsCount" if name == "posts" else "commentsCount"][doc["author"]] += 1
+
+def apply_stats(user, stats):
+    for field in STATS_FIELDS:
+        user["stats"][field] = stats[field].get(user["_id"], 0)
+
+def dump_batches(name, batches, documents, path, args, checkpoint, metrics, counters=None, stats=None):
+    """Écrire un flux de documents lot par lot dans un fichier gzip
+
+    Même contrôle et même empreinte par lot que storage.write_batches ; l'étape
+    « insert » des mesures est ici l'encodage et la compression du lot.
+    """
+    written = 0
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=args.gzip_level, mtime=0) as out:
+        for start, stop in batches:
+            produce_started = time.perf_counter()
+            batch = list(islice(documents, stop - start))
+            checksum_started = time.perf_counter()
+            if batch:
+                validate_document(name, batch[0])
+            encoded = [bson_encode(doc) for doc in batch]
+            digest, size = encoded_digest(encoded)
+            write_started = time.perf_counter()
+            if counters is not None:
+                count_references(name, batch, counters)
+            if stats is not None:
+                for user in batch:
+                    apply_stats(user, stats)
+                encoded = [bson_encode(user) for user in batch]
+            if args.format == "bson":
+                out.write(b''.join(encoded))
+            else:
+                out.write(''.join(json_util.dumps(doc) + '\n' for doc in batch).encode('utf-8'))
+            checkpoint.mark("done", name, start, stop, digest)
+            finished = time.perf_counter()
+            metrics.record_batch(
+                name, len(batch), size, checksum_started - produce_started,
+                write_started - checksum_started, finished - write_started
+            )
+            written += len(batch)
+    return written
+
+def dump_worker(worker_index, args, run, ranges, names, stats=None, cache_snapshot=None):
+    """Worker de l'export : génère et écrit les collections `names` de ses plages
+
+    Sans `stats` (articles, commentaires), renvoie aussi les compteurs des utilisateurs
+    référencés ; avec `stats` (utilisateurs), les applique aux documents.
+    """
+    pool = cache = None
+    if "users" in names:
+        pool = Pool(max(1, args.hash_workers // args.workers))
+        if not args.no_hash_cache:
+            cache = PasswordHashCache(
+                args.hash_cache, args.hash_cache_size, partition=(worker_index, args.workers),
+                snapshot_id=cache_snapshot
+            )
+    try:
+        metrics = SeedMetrics()
+        context = SeedContext(run, args, pool, cache, reference_resolvers(None, args, run), metrics)
+        checkpoint = SeedCheckpoint.load(args.checkpoint)
+        counters = None if stats is not None else {field: Counter() for field in STATS_FIELDS}
+        summary = {}
+        for name in names:
+            generate = GENERATORS[name][2]
+            batches = pending_batches(name, *ranges[name], args.batch_size)
+            if not batches:
+                continue
+            summary[name] = dump_batches(
+                name, batches, generate(batches, context), part_path(args.output, args.format, name, worker_index),
+                args, checkpoint, metrics, counters if name != "users" else None, stats if name == "users" else None
+            )
+        return {"worker": worker_index, "documents": summary, "counters": counters, "metrics": metrics.to_dict()}
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if cache is not None:
+            cache.close(evict=False)
+
+def clear_previous_dump(args):
+    """Supprimer les fichiers d'un export précédent des collections regénérées"""
+    directory = dump_directory(args.output)
+    shutil.rmtree(os.path.join(directory, ".parts"), ignore_errors=True)
+    for name in COLLECTIONS:
+        if getattr(args, name):
+            for path in glob.glob(os.path.join(directory, f"{name}.*")):
+                os.remove(path)
+
+def assemble_bson(args, workers):
+    """Concaténer les parts de chaque collection et écrire ses métadonnées (format mongodump --gzip)"""
+    directory = dump_directory(args.output)
+    for name in COLLECTIONS:
+        parts = [path for path in (part_path(args.output, "bson", name, w) for w in range(workers)) if os.path.exists(path)]
+        if not parts:
+            continue
+        with open(os.path.join(directory, name + EXTENSIONS["bson"]), 'wb') as out:
+            for path in parts:
+                with open(path, 'rb') as part:
+                    shutil.copyfileobj(part, out, 16 * 1024 * 1024)
+                os.remove(path)
+        metadata_path = os.path.join(directory, f"{name}.metadata.json.gz")
+        with open(metadata_path, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as out:
+            out.write(json.dumps(collection_metadata(name)).encode('utf-8'))
+    shutil.rmtree(os.path.join(directory, ".parts"), ignore_errors=True)
+
+def run_phase(args, run, shards, names, stats=None, cache_snapshot=None):
+    """Lancer un worker par plage pour les collections `names` et rassembler leurs résultats"""
+    # spawn : mêmes processus que seed_sharded (pas de fork du pool de hachage)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(args.workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                dump_worker, worker, args, run, {name: shards[name][worker] for name in shards}, names, stats,
+                cache_snapshot
+            )
+            for worker in range(args.workers)
+        ]
+        return [future.result() for future in futures]
+
+def dump_synthetic(args, cache=None, metrics=None):
+    """Mode hors ligne : générer le jeu de données synthétique dans `args.output` sur `args.workers` processus"""
+    run = SyntheticRun.create(args)
+    SeedCheckpoint.create(args.checkpoint, run, {name: getattr(args, name) for name in GENERATION_PARAMS})
+    clear_previous_dump(args)
+    shards = {name: split_range(getattr(args, name), args.workers, args.batch_size) for name in COLLECTIONS}
+    cache_snapshot = cache.snapshot_id if cache is not None else None
+
+    print(f"📦 Export hors ligne ({args.format}, gzip {args.gzip_level}) sur {args.workers} processus vers {args.output}...")
+    reports = run_phase(args, run, shards, [name for name in GENERATORS if name != "users"])
+    stats = {field: Counter() for field in STATS_FIELDS}
+    for report in reports:
+        for field in STATS_FIELDS:
+            stats[field].update(report["counters"][field])
+    if args.users:
+        reports += run_phase(args, run, shards, ["users"], stats, cache_snapshot)
+
+    summary = {name: 0 for name in COLLECTIONS if getattr(args, name)}
+    for report in reports:
+        for name, count in report["documents"].items():
+            summary[name] += count
+        if metrics is not None:
+            metrics.merge(report["metrics"])
+    if args.format == "bson":
+        started = time.perf_counter()
+        assemble_bson(args, args.workers)
+        if metrics is not None:
+            metrics.record_phase("assemble", time.perf_counter() - started)
+
+    manifest = write_manifest(args.manifest, SeedCheckpoint.load(args.checkpoint))
+    shutil.copyfile(args.manifest, os.path.join(args.output, "manifest.json"))
+    print(f"🧾 Manifeste {args.manifest} (empreinte {manifest['digest'][:16]}…)")
+    if args.format == "bson":
+        print(f"💡 Restauration : mongorestore --gzip --dir {args.output} --drop --numInsertionWorkersPerCollection 8")
+    else:
+        print(f"💡 Import : gunzip -c {dump_directory(args.output)}/<collection>.*.json.gz | "
+              f"mongoimport --db {DB_NAME} --collection <collection> --numInsertionWorkers 8")
+    return summary
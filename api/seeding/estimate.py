@@ -0,0 +1,217 @@
+"""
+Estimation de capacité (--dry-run [--estimate]) : volumes extrapolés d'un échantillon de documents
+
+Un échantillon aléatoire d'index de chaque collection est généré exactement comme
+par le seed (mêmes générateurs, même profil), puis encodé en BSON, sans aucune
+connexion à MongoDB. Les tailles moyennes sont extrapolées aux volumes demandés :
+
+- données : taille BSON (dataSize), et stockage après compression par blocs de
+  WiredTiger, approchée par zlib niveau 1 sur des blocs de 32 Kio ;
+- index : une entrée par document, ou par élément de tableau pour les index
+  multikey (tags, reports.status), clé encodée + RecordId. La compression de
+  préfixe de WiredTiger n'est pas comptée : c'est un majorant. Les tableaux `likes`
+  ne sont pas indexés par les modèles ; leur index est estimé à titre indicatif ;
+- working set : tous les index et la part « chaude » des données (--hot-fraction)
+  doivent tenir dans le cache WiredTiger, soit 50 % de (RAM - 1 Gio).
+"""
+
+import os
+import json
+import zlib
+import random
+import argparse
+from math import prod
+from multiprocessing import Pool
+from pymongo import IndexModel, ASCENDING
+from bson import encode as bson_encode
+
+from .config import COLLECTIONS, ATLAS_TIERS
+from .generators import GENERATORS, SeedContext, reference_resolvers
+from .run import SyntheticRun
+from .schema import validate_document
+from .storage import MODEL_INDEXES
+
+# Index non déclarés dans les modèles, estimés pour savoir ce qu'ils coûteraient
+CANDIDATE_INDEXES = {
+    "posts": [IndexModel([("likes", ASCENDING)])],
+    "comments": [IndexModel([("likes", ASCENDING)])]
+}
+
+# Octets par entrée d'index en plus de la clé : RecordId (8) et en-têtes de cellule WiredTiger
+INDEX_ENTRY_OVERHEAD = 12
+# Taille des blocs compressés par WiredTiger (leaf_page_max des collections)
+STORAGE_BLOCK_SIZE = 32 * 1024
+# Le cache WiredTiger occupe 50 % de (RAM - 1 Gio)
+CACHE_SHARE = 0.5
+RESERVED_MEMORY = 1 << 30
+
+def sample_indexes(count, sample_size, seed=0):
+    """Index tirés uniformément dans range(count), triés (tous si count <= sample_size)"""
+    if count <= sample_size:
+        return list(range(count))
+    return sorted(random.Random(seed).sample(range(count), sample_size))
+
+def sample_documents(name, indexes, context):
+    """Générer les documents d'index donnés, un lot d'un document par index"""
+    generate = GENERATORS[name][2]
+    return list(generate([(index, index + 1) for index in indexes], context))
+
+def value_size(value):
+    """Taille de l'encodage BSON d'une valeur (hors type et nom de champ)"""
+    return len(bson_encode({"": value})) - 7
+
+def field_values(doc, path):
+    """Valeurs d'un chemin pointé ; un tableau donne un élément par valeur (index multikey)"""
+    values = [doc]
+    for part in path.split('.'):
+        found = []
+        for value in values:
+            value = value.get(part) if isinstance(value, dict) else None
+            if isinstance(value, list):
+                found.extend(value)
+            else:
+                found.append(value)
+        values = found
+    # Un tableau vide est indexé par une seule entrée (undefined)
+    return values or [None]
+
+def index_entries(doc, keys):
+    """(nombre d'entrées, octets des clés) d'un document pour un index
+
+    MongoDB n'accepte qu'un champ tableau par index composé : chaque élément du
+    tableau donne une entrée, combinée aux valeurs des autres champs.
+    """
+    values = [field_values(doc, field) for field in keys]
+    entries = prod(len(field) for field in values)
+    size = sum(sum(value_size(value) for value in field) * (entries // len(field)) for field in values)
+    return entries, size
+
+def compressed_size(encoded):
+    """Taille des documents compressés par blocs de STORAGE_BLOCK_SIZE (zlib niveau 1)"""
+    total, block = 0, bytearray()
+    for document in encoded:
+        block += document
+        if len(block) >= STORAGE_BLOCK_SIZE:
+            total += len(zlib.compress(bytes(block), 1))
+            block.clear()
+    if block:
+        total += len(zlib.compress(bytes(block), 1))
+    return total
+
+def estimate_collection(name, count, documents):
+    """Extrapoler à `count` documents les tailles mesurées sur l'échantillon"""
+    for doc in documents[:1]:
+        validate_document(name, doc)
+    encoded = [bson_encode(doc) for doc in documents]
+    scale = count / len(documents)
+    indexes = {"_id_": {"entries": count, "bytes": round(count * (value_size(documents[0]["_id"]) + INDEX_ENTRY_OVERHEAD)),
+                        "multikey": False, "declared": True}}
+    for declared, models in ((True, MODEL_INDEXES.get(name, [])), (False, CANDIDATE_INDEXES.get(name, []))):
+        for model in models:
+            keys = list(model.document["key"])
+            entries = size = 0
+            for doc in documents:
+                doc_entries, doc_size = index_entries(doc, keys)
+                entries += doc_entries
+                size += doc_size
+            indexes[model.document["name"]] = {
+                "entries": round(entries * scale),
+                "bytes": round((size + entries * INDEX_ENTRY_OVERHEAD) * scale),
+                "multikey": entries > len(documents),
+                "declared": declared
+            }
+    data_size = sum(len(document) for document in encoded)
+    return {
+        "count": count,
+        "sampled": len(documents),
+        "avgObjSize": round(data_size / len(documents)),
+        "maxObjSize": max(len(document) for document in encoded),
+        "dataSize": round(data_size * scale),
+        "storageSize": round(compressed_size(encoded) * scale),
+        "indexes": indexes,
+        "totalIndexSize": sum(index["bytes"] for index in indexes.values() if index["declared"])
+    }
+
+def atlas_tier(memory, storage):
+    """Plus petit palier Atlas dont la mémoire et le stockage par défaut suffisent (None au-delà)"""
+    for tier, tier_memory, tier_storage in ATLAS_TIERS:
+        if tier_memory >= memory and tier_storage >= storage:
+            return tier
+    return None
+
+def estimate_capacity(args, pool=None):
+    """Générer un échantillon de chaque collection et extrapoler stockage, index et working set"""
+    run = SyntheticRun.create(args)
+    # Le coût bcrypt ne change pas la taille d'un haché (60 caractères) : l'échantillon est haché au coût minimal
+    sample_args = argparse.Namespace(**{**vars(args), "bcrypt_rounds": 4})
+    context = SeedContext(run, sample_args, pool, None, reference_resolvers(None, args, run))
+    collections = {}
+    for name in COLLECTIONS:
+        count = getattr(args, name)
+        if count:
+            documents = sample_documents(name, sample_indexes(count, args.sample_size, args.seed or 0), context)
+            collections[name] = estimate_collection(name, count, documents)
+
+    data_size = sum(entry["dataSize"] for entry in collections.values())
+    index_size = sum(entry["totalIndexSize"] for entry in collections.values())
+    storage = sum(entry["storageSize"] for entry in collections.values()) + index_size
+    working_set = round(index_size + args.hot_fraction * data_size)
+    memory = round(working_set / CACHE_SHARE + RESERVED_MEMORY)
+    return {
+        "params": {name: getattr(args, name) for name in ("profile", "users", "posts", "comments", "content")},
+        "sampleSize": args.sample_size,
+        "collections": collections,
+        "dataSize": data_size,
+        "totalIndexSize": index_size,
+        "storageSize": storage,
+        "hotFraction": args.hot_fraction,
+        "workingSet": working_set,
+        "recommendedMemory": memory,
+        "atlasTier": atlas_tier(memory, storage)
+    }
+
+def size_label(size):
+    for unit in ("o", "Kio", "Mio", "Gio"):
+        if size < 1024:
+            return f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} Tio"
+
+def print_estimate(estimate, detailed=True):
+    """Afficher l'estimation par collection, puis (detailed) les index et les besoins globaux"""
+    for name, entry in estimate["collections"].items():
+        print(f"   📦 {name}: {entry['count']:,} documents (échantillon {entry['sampled']:,}), "
+              f"{size_label(entry['avgObjSize'])} en moyenne, données {size_label(entry['dataSize'])}, "
+              f"stockage ≈ {size_label(entry['storageSize'])}")
+        if not detailed:
+            continue
+        for index_name, index in entry["indexes"].items():
+            flags = (" multikey" if index["multikey"] else "") + ("" if index["declared"] else " (non déclaré)")
+            print(f"      🔑 {index_name}{flags}: {index['entries']:,} entrées, {size_label(index['bytes'])}")
+    if not detailed:
+        return
+    print(f"   💾 Stockage ≈ {size_label(estimate['storageSize'])} (données compressées + index), "
+          f"données non compressées {size_label(estimate['dataSize'])}")
+    print(f"   🧠 Working set ≈ {size_label(estimate['workingSet'])} (index + {estimate['hotFraction']:.0%} des données), "
+          f"mémoire recommandée {size_label(estimate['recommendedMemory'])}")
+    tier = estimate["atlasTier"] or f"au-delà de {ATLAS_TIERS[-1][0]} (sharding ou palier sur mesure)"
+    print(f"   ☁️  Palier Atlas suggéré : {tier}")
+
+def write_estimate(path, estimate):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(estimate, f, indent=2)
+
+def run_estimate(args):
+    """Mode --dry-run : échantillon contrôlé et mesuré sans base de données ; --estimate ajoute index et working set"""
+    pool = Pool(min(4, args.hash_workers)) if args.users else None
+    try:
+        print(f"📐 Estimation de capacité sur un échantillon de {args.sample_size:,} documents par collection...")
+        estimate = estimate_capacity(args, pool)
+    finally:
+        if pool is not None:
+            pool.terminate()
+    print_estimate(estimate, args.estimate)
+    write_estimate(args.estimate_output, estimate)
+    print(f"🧾 Estimation {args.estimate_output}")
+    return estimate
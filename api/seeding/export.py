@@ -0,0 +1,432 @@
+"""
+Export parallèle des collections en NDJSON compressé, par plages de _id
+
+Remplace scripts/export-data-nodejs.js pour les grosses bases, qui charge chaque
+collection entière en mémoire (find().lean()) pour l'écrire en un seul tableau JSON.
+Ici, chaque collection est découpée en plages de _id d'environ --chunk-docs documents
+(bornes tirées d'un échantillon $sample) ; les plages sont lues par des curseurs
+parallèles, un processus par worker, et écrites en flux, une plage par fichier.
+La mémoire reste bornée à un lot de curseur par worker.
+
+Export incrémental (--incremental) : chaque export enregistre dans metadata.json,
+par collection, le plus grand couple (updatedAt, _id) lu avant l'export (le
+« watermark ») et la liste triée des _id présents (`ids.bin.gz`). L'export suivant
+n'écrit que les documents modifiés depuis ce couple (index updatedAt_1__id_1 des
+modèles) et, par différence des deux listes, les _id supprimés
+(`<collection>-deleted.ndjson.gz`) et les documents apparus depuis l'export de base
+dont l'updatedAt est antérieur au watermark (`<collection>-inserted.ndjson.gz`) :
+seed regénéré, données importées ou migrées. Un document modifié pendant un export
+peut être réécrit par le suivant : à l'import, les suppressions s'appliquent
+d'abord, puis les documents en upsert.
+
+Arborescence (même dossier et même metadata.json que l'export Node.js) :
+    mongodb-export/jgazette-export-<horodatage>/
+        metadata.json
+        users/users-00000.ndjson.gz
+        posts/posts-00000.ndjson.gz, posts-00001.ndjson.gz, ..., posts/ids.bin.gz
+
+Un document par ligne, en Extended JSON relaxed : ObjectId et dates sont conservés.
+Les plages sont lues à des instants différents : l'export n'est cohérent que sur
+une base au repos.
+
+Usage (depuis api/) :
+    python -m seeding.export
+    python -m seeding.export --workers 8 --compression zstd
+    python -m seeding.export --collections posts --chunk-docs 500000
+    python -m seeding.export --incremental       # changements depuis le dernier export de --output
+"""
+
+import io
+import os
+import sys
+import gzip
+import json
+import time
+import argparse
+import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from itertools import islice
+from pymongo import MongoClient, ASCENDING, DESCENDING
+from bson import ObjectId, json_util
+
+from .config import MONGODB_URI, DB_NAME, COLLECTIONS
+from .storage import connect_db
+
+# Dossier des exports, comme scripts/export-data-nodejs.js (relatif au dossier courant, api/)
+EXPORT_DIR = './mongodb-export'
+DEFAULT_CHUNK_DOCS = 100_000
+# Compression -> (extension, paquet Python requis, niveau par défaut)
+COMPRESSIONS = {"gzip": (".ndjson.gz", None, 6), "zstd": (".ndjson.zst", "zstandard", 3)}
+# _id échantillonnés par plage pour placer les bornes
+SAMPLES_PER_RANGE = 20
+# Documents sérialisés avant chaque écriture dans le fichier compressé
+WRITE_BATCH = 1000
+# Liste des _id d'un export : ObjectId bruts de 12 octets, triés, compressés en gzip
+IDS_FILE = "ids.bin.gz"
+# _id présents mais absents de l'export de base, dont les documents sont exportés après la fusion
+INSERTED_IDS_FILE = "ids-inserted.bin.gz"
+ID_BYTES = 12
+# Ordre de lecture : plages de _id (export complet), ou index updatedAt_1__id_1 (incrémental)
+ID_ORDER = [("_id", ASCENDING)]
+CHANGES_ORDER = [("updatedAt", ASCENDING), ("_id", ASCENDING)]
+
+def export_timestamp(now=None):
+    """Horodatage du dossier d'export, au format de l'export Node.js (toISOString, ':' et '.' remplacés)"""
+    now = now or datetime.now(timezone.utc)
+    return now.strftime('%Y-%m-%dT%H-%M-%S-') + f"{now.microsecond // 1000:03d}Z"
+
+def open_compressed(path, compression, level):
+    """Fichier binaire en écriture compressé en gzip ou zstd"""
+    if compression == "zstd":
+        import zstandard
+        return zstandard.ZstdCompressor(level=level).stream_writer(open(path, 'wb'))
+    return gzip.open(path, 'wb', compresslevel=level)
+
+def open_decompressed(path):
+    """Lignes (texte) d'un fichier NDJSON compressé en gzip ou zstd, lues en flux"""
+    if path.endswith('.zst'):
+        import zstandard
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True), encoding='utf-8')
+    return gzip.open(path, 'rt', encoding='utf-8')
+
+def latest_export(output):
+    """Chemin de l'export le plus récent de `output` (dossiers jgazette-export-<horodatage>)"""
+    exports = sorted(
+        folder for folder in (os.listdir(output) if os.path.isdir(output) else ())
+        if folder.startswith('jgazette-export-') and os.path.exists(os.path.join(output, folder, 'metadata.json'))
+    )
+    if not exports:
+        raise RuntimeError(f"Aucun export dans {output} : faire d'abord un export complet")
+    return os.path.join(output, exports[-1])
+
+def range_boundaries(collection, count, chunk_docs):
+    """Plages [début, fin) de _id d'environ `chunk_docs` documents (None : non bornée)
+
+    Les bornes sont les quantiles d'un échantillon $sample des _id : une seule
+    passe aléatoire côté serveur, sans parcourir l'index.
+    """
+    ranges = -(-count // chunk_docs)
+    if ranges <= 1:
+        return [(None, None)]
+    sample = min(count, ranges * SAMPLES_PER_RANGE)
+    ids = sorted(doc["_id"] for doc in collection.aggregate([{"$sample": {"size": sample}}, {"$project": {"_id": 1}}]))
+    bounds = []
+    for i in range(1, ranges):
+        bound = ids[len(ids) * i // ranges]
+        if not bounds or bound > bounds[-1]:
+            bounds.append(bound)
+    edges = [None] + bounds + [None]
+    return list(zip(edges, edges[1:]))
+
+def collection_watermark(collection):
+    """Plus grand couple (updatedAt, _id) de la collection, None si elle est vide"""
+    doc = collection.find_one({}, {"updatedAt": 1}, sort=[("updatedAt", DESCENDING), ("_id", DESCENDING)])
+    if doc is None or doc.get("updatedAt") is None:
+        return None
+    return {"updatedAt": doc["updatedAt"], "_id": doc["_id"]}
+
+def changes_query(watermark):
+    """Documents modifiés après le couple (updatedAt, _id) `watermark` (tous s'il est None)"""
+    if watermark is None:
+        return {}
+    updated_at, last_id = watermark["updatedAt"], watermark["_id"]
+    return {"$or": [{"updatedAt": {"$gt": updated_at}}, {"updatedAt": updated_at, "_id": {"$gt": last_id}}]}
+
+def range_query(start, stop):
+    query = {}
+    if start is not None:
+        query["$gte"] = start
+    if stop is not None:
+        query["$lt"] = stop
+    return {"_id": query} if query else {}
+
+_client = None
+
+def open_worker_client():
+    """Initialisation d'un processus d'export : un client MongoDB par processus"""
+    global _client
+    _client = MongoClient(MONGODB_URI)
+
+def write_ndjson(documents, path, compression, level):
+    """Écrire en flux un itérable de documents dans un fichier NDJSON compressé"""
+    written = 0
+    lines = []
+    with open_compressed(path, compression, level) as out:
+        for doc in documents:
+            lines.append(json_util.dumps(doc))
+            if len(lines) == WRITE_BATCH:
+                out.write(('\n'.join(lines) + '\n').encode('utf-8'))
+                written += len(lines)
+                lines.clear()
+        if lines:
+            out.write(('\n'.join(lines) + '\n').encode('utf-8'))
+            written += len(lines)
+    return {"documents": written, "bytes": os.path.getsize(path)}
+
+def export_range(name, query, order, path, compression, level, batch_size):
+    """Écrire en flux les documents d'une plage de _id (ou les documents modifiés) dans un fichier NDJSON compressé"""
+    collection = _client[DB_NAME][name]
+    return write_ndjson(collection.find(query, batch_size=batch_size).sort(order), path, compression, level)
+
+def export_inserted(name, ids_path, watermark, path, compression, level, batch_size):
+    """Écrire les documents des _id apparus depuis l'export de base que changes_query ne voit pas
+
+    Leur updatedAt est antérieur au watermark : ils sont relus par lots de _id
+    ({_id: {$in: ...}}), sans ceux déjà écrits dans le fichier des modifications.
+    """
+    collection = _client[DB_NAME][name]
+
+    def documents():
+        ids = read_ids(ids_path)
+        while chunk := [ObjectId(raw) for raw in islice(ids, batch_size)]:
+            query = {"_id": {"$in": chunk}, "$nor": [changes_query(watermark)]}
+            yield from collection.find(query, batch_size=batch_size).sort(ID_ORDER)
+
+    return write_ndjson(documents(), path, compression, level)
+
+def read_ids(path):
+    """_id bruts (12 octets) d'un fichier d'identifiants, dans l'ordre croissant, en flux"""
+    buffer = b''
+    with gzip.open(path, 'rb') as f:
+        while chunk := f.read(ID_BYTES * 65536):
+            buffer += chunk
+            usable = len(buffer) - len(buffer) % ID_BYTES
+            for offset in range(0, usable, ID_BYTES):
+                yield buffer[offset:offset + ID_BYTES]
+            buffer = buffer[usable:]
+
+def current_ids(collection):
+    """_id bruts de la collection dans l'ordre croissant (requête couverte par l'index _id)"""
+    for doc in collection.find({}, {"_id": 1}, batch_size=10_000).sort("_id", ASCENDING):
+        if not isinstance(doc["_id"], ObjectId):
+            raise ValueError(f"{collection.name}: _id {doc['_id']!r} n'est pas un ObjectId")
+        yield doc["_id"].binary
+
+def scan_ids(name, ids_path, previous_path, deleted_path, inserted_path, compression, level):
+    """Écrire la liste triée des _id de la collection et, avec la liste de l'export de base, les _id supprimés et nouveaux
+
+    Les deux listes sont triées : leur différence se calcule par fusion, en flux.
+    Les _id nouveaux sont écrits dans `inserted_path` (même format que `ids_path`).
+    """
+    ids, deleted, inserted, buffer = 0, 0, 0, bytearray()
+    previous = read_ids(previous_path) if previous_path else iter(())
+    tombstones = open_compressed(deleted_path, compression, level) if deleted_path else None
+    additions = gzip.open(inserted_path, 'wb', compresslevel=1) if inserted_path else None
+
+    def tombstone(raw):
+        tombstones.write((json_util.dumps({"_id": ObjectId(raw)}) + '\n').encode('utf-8'))
+
+    try:
+        with gzip.open(ids_path, 'wb', compresslevel=1) as out:
+            old = next(previous, None)
+            for raw in current_ids(_client[DB_NAME][name]):
+                buffer += raw
+                ids += 1
+                if len(buffer) >= 1 << 20:
+                    out.write(buffer)
+                    buffer.clear()
+                while old is not None and old < raw:
+                    tombstone(old)
+                    deleted += 1
+                    old = next(previous, None)
+                if old == raw:
+                    old = next(previous, None)
+                elif additions is not None:
+                    additions.write(raw)
+                    inserted += 1
+            out.write(buffer)
+            while old is not None:
+                tombstone(old)
+                deleted += 1
+                old = next(previous, None)
+    finally:
+        if tombstones is not None:
+            tombstones.close()
+        if additions is not None:
+            additions.close()
+    return {"ids": ids, "deleted": deleted, "inserted": inserted}
+
+def encode_watermark(watermark):
+    return None if watermark is None else json.loads(json_util.dumps(watermark))
+
+def decode_watermark(watermark):
+    return None if watermark is None else json_util.loads(json.dumps(watermark))
+
+def find_base_export(output, base=None):
+    """Export de référence de --incremental : `base`, sinon le plus récent de `output` ; (chemin, métadonnées)"""
+    if base is None:
+        base = latest_export(output)
+    with open(os.path.join(base, 'metadata.json'), encoding='utf-8') as f:
+        metadata = json.load(f)
+    if "watermarks" not in metadata:
+        raise RuntimeError(f"L'export {base} n'a pas de watermark (export Node.js ?) : faire un export complet")
+    return base, metadata
+
+def export_database(db, args, export_path, base=None):
+    """Exporter les collections demandées sur `args.workers` processus
+
+    Sans `base`, export complet par plages de _id ; avec `base` (chemin, métadonnées
+    de l'export précédent), documents modifiés depuis son watermark, documents apparus
+    depuis et _id supprimés. Retourne (fichiers par collection, watermarks, listes
+    d'_id, suppressions).
+    """
+    extension = COMPRESSIONS[args.compression][0]
+    tasks, id_tasks, watermarks, base_watermarks = [], [], {}, {}
+    for name in args.collections:
+        collection = db[name]
+        # Lu avant les documents : ce qui est modifié pendant l'export sera repris par le suivant
+        watermarks[name] = encode_watermark(collection_watermark(collection))
+        os.makedirs(os.path.join(export_path, name), exist_ok=True)
+        ids_path = os.path.join(name, IDS_FILE)
+        if base is None:
+            count = collection.estimated_document_count()
+            ranges = range_boundaries(collection, count, args.chunk_docs)
+            print(f"📤 {name}: ~{count:,} documents en {len(ranges)} plage(s) de _id")
+            for number, (start, stop) in enumerate(ranges):
+                tasks.append((name, range_query(start, stop), ID_ORDER, os.path.join(name, f"{name}-{number:05d}{extension}")))
+            id_tasks.append((name, ids_path, None, None, None))
+        else:
+            base_path, base_metadata = base
+            if name not in base_metadata["watermarks"]:
+                raise RuntimeError(f"L'export {base_path} ne contient pas {name} : faire un export complet")
+            watermark = base_watermarks[name] = decode_watermark(base_metadata["watermarks"][name])
+            since = watermark["updatedAt"].isoformat() if watermark else "le début"
+            print(f"📤 {name}: documents modifiés depuis {since}")
+            tasks.append((name, changes_query(watermark), CHANGES_ORDER, os.path.join(name, f"{name}-changes{extension}")))
+            id_tasks.append((
+                name, ids_path, os.path.join(base_path, name, IDS_FILE), os.path.join(name, f"{name}-deleted{extension}"),
+                os.path.join(name, INSERTED_IDS_FILE)
+            ))
+
+    files = {name: [] for name in args.collections}
+    ids, deleted = {}, {}
+    exported, started = 0, time.perf_counter()
+    absolute = lambda relative: relative and os.path.join(export_path, relative)
+    # spawn : aucun processus n'hérite du MongoClient du coordinateur
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(args.workers, mp_context=context, initializer=open_worker_client) as executor:
+        id_futures = {
+            executor.submit(
+                scan_ids, name, absolute(ids_path), previous_path, absolute(deleted_path), absolute(inserted_path),
+                args.compression, args.level
+            ): (name, ids_path, deleted_path, inserted_path)
+            for name, ids_path, previous_path, deleted_path, inserted_path in id_tasks
+        }
+        futures = {
+            executor.submit(
+                export_range, name, query, order, absolute(relative), args.compression, args.level, args.batch_size
+            ): (name, relative)
+            for name, query, order, relative in tasks
+        }
+        for future in as_completed(id_futures):
+            name, ids_path, deleted_path, inserted_path = id_futures[future]
+            result = future.result()
+            ids[name] = {"file": ids_path, "documents": result["ids"]}
+            if deleted_path:
+                deleted[name] = {"file": deleted_path, "documents": result["deleted"]}
+            # Sans watermark de base, le fichier des modifications contient déjà toute la collection
+            if result.get("inserted") and base_watermarks.get(name) is not None:
+                relative = os.path.join(name, f"{name}-inserted{extension}")
+                print(f"📤 {name}: {result['inserted']:,} document(s) apparu(s) depuis l'export de base")
+                futures[executor.submit(
+                    export_inserted, name, absolute(inserted_path), base_watermarks[name], absolute(relative),
+                    args.compression, args.level, args.batch_size
+                )] = (name, relative)
+        for future in as_completed(futures):
+            name, relative = futures[future]
+            result = future.result()
+            files[name].append({"file": relative, **result})
+            exported += result["documents"]
+            rate = exported / (time.perf_counter() - started)
+            print(f"   … {exported:,} documents exportés ({rate:,.0f} docs/s)", end='\r')
+    if tasks:
+        print()
+    for entries in files.values():
+        entries.sort(key=lambda entry: entry["file"])
+    ordered = lambda results: {name: results[name] for name in args.collections if name in results}
+    return files, watermarks, ordered(ids), ordered(deleted)
+
+def parse_args(argv=None):
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Export parallèle des collections JGazette en NDJSON compressé")
+    parser.add_argument('--output', default=EXPORT_DIR, help=f"dossier des exports (défaut: {EXPORT_DIR})")
+    parser.add_argument('--collections', nargs='+', choices=COLLECTIONS, default=list(COLLECTIONS),
+                        help="collections à exporter (défaut: toutes)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="processus d'export, chacun avec son curseur et son client (défaut: nombre de cœurs)")
+    parser.add_argument('--chunk-docs', type=int, default=DEFAULT_CHUNK_DOCS,
+                        help=f"documents visés par plage de _id, donc par fichier (défaut: {DEFAULT_CHUNK_DOCS})")
+    parser.add_argument('--batch-size', type=int, default=1000, help="taille des lots de curseur (défaut: 1000)")
+    parser.add_argument('--compression', choices=COMPRESSIONS, default="gzip",
+                        help="compression des fichiers : gzip, ou zstd (paquet zstandard) (défaut: gzip)")
+    parser.add_argument('--level', type=int, help="niveau de compression (défaut: 6 en gzip, 3 en zstd)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="n'exporter que les documents modifiés et les _id supprimés depuis le dernier export de --output")
+    parser.add_argument('--base', help="export de référence de --incremental (défaut: le plus récent de --output)")
+    args = parser.parse_args(argv)
+    if args.base:
+        args.incremental = True
+    if args.workers < 1 or args.chunk_docs < 1 or args.batch_size < 1:
+        parser.error("--workers, --chunk-docs et --batch-size doivent être >= 1")
+    _, module, default_level = COMPRESSIONS[args.compression]
+    if module and importlib.util.find_spec(module) is None:
+        parser.error(f"la compression {args.compression} nécessite le paquet Python {module}")
+    if args.level is None:
+        args.level = default_level
+    return args
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+    client, db = connect_db()
+    try:
+        base = find_base_export(args.output, args.base) if args.incremental else None
+        print(f"🚀 Début de l'export {'incrémental ' if base else ''}des données MongoDB (Python)...")
+        if base:
+            print(f"📎 Export de référence: {base[0]}")
+        export_path = os.path.join(args.output, f"jgazette-export-{export_timestamp()}")
+        os.makedirs(export_path, exist_ok=True)
+        print(f"📁 Dossier d'export: {export_path}")
+        started = time.perf_counter()
+        files, watermarks, ids, deleted = export_database(db, args, export_path, base)
+        elapsed = time.perf_counter() - started
+
+        counts = {name: sum(entry["documents"] for entry in entries) for name, entries in files.items()}
+        metadata = {
+            "exportDate": datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            "database": db.name,
+            "collections": counts,
+            "totalDocuments": sum(counts.values()),
+            "format": "ndjson",
+            "compression": args.compression,
+            "files": files,
+            "mode": "incremental" if base else "full",
+            "watermarks": watermarks,
+            "ids": ids
+        }
+        if base:
+            metadata["baseExport"] = os.path.basename(os.path.normpath(base[0]))
+            metadata["deleted"] = deleted
+        metadata_path = os.path.join(export_path, 'metadata.json')
+        with open(metadata_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+        print("\n📊 Résumé de l'export:")
+        for name, count in counts.items():
+            removed = f", {deleted[name]['documents']} supprimé(s)" if name in deleted else ""
+            print(f"  - {name}: {count} documents ({len(files[name])} fichier(s)){removed}")
+        total = metadata["totalDocuments"]
+        print(f"⏱️  Durée: {elapsed:.1f}s ({total / elapsed if elapsed else 0:,.0f} docs/s)")
+        print(f"✅ Export terminé : {export_path}")
+        print(f"📄 Métadonnées: {metadata_path}")
+    except Exception as e:
+        print(f"❌ Erreur lors de l'export: {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+        print("🔌 Connexion MongoDB fermée")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+Générateurs de documents synthétiques, enregistrés par collection
+
+Un générateur reçoit les lots [début, fin) qui lui reviennent et un SeedContext ;
+il produit paresseusement les documents de ces lots, dans l'ordre des index. Pour
+ajouter une collection au seed, il suffit de décorer sa fonction avec @generator
+(et de déclarer ses index dans storage.MODEL_INDEXES).
+"""
+
+import time
+from math import gcd
+from datetime import datetime, timezone, timedelta
+
+from .config import (
+    ID_KIND_USER, ID_KIND_POST, ID_KIND_COMMENT, ID_KIND_THREAD, ID_KIND_REPORT, ID_KIND_MODERATION, PUBLISHER_EVERY,
+    MAX_LIKES_PER_POST
+)
+from .corpus import sample_users, sample_posts_data, sample_comments, report_reasons
+from .hashing import hash_passwords_async
+from .markov import synthesize_post
+from .metrics import SeedMetrics
+from .slugs import series_slugs
+from .storage import existing_ids
+
+# Générateurs par collection, dans l'ordre de génération : nom -> (icône, libellé, fonction)
+GENERATORS = {}
+
+def generator(name, icon, label):
+    """Enregistrer `generate(batches, context)` comme générateur de la collection `name`"""
+    def register(generate):
+        GENERATORS[name] = (icon, label, generate)
+        return generate
+    return register
+
+class SeedContext:
+    """Ce que partagent les générateurs d'un processus : run, options, hachage, références et mesures"""
+
+    def __init__(self, run, args, pool=None, cache=None, resolvers=(None, None, None, None), metrics=None):
+        self.run = run
+        self.args = args
+        self.pool = pool
+        self.cache = cache
+        self.metrics = metrics or SeedMetrics()
+        self.author_for, self.commenter_for, self.likers_for, self.post_for = resolvers
+
+def build_user(user_data, hashed_password, now=None):
+    """Construire un document utilisateur conforme au modèle User"""
+    now = now or datetime.now(timezone.utc)
+    return {
+        "username": user_data["username"],
+        "email": user_data["email"],
+        "password": hashed_password,
+        "role": user_data["role"],
+        "profile": user_data["profile"],
+        "stats": {
+            "postsCount": 0,
+            "commentsCount": 0,
+            "likesGiven": 0,
+            "likesReceived": 0,
+            "lastActivity": now
+        },
+        "preferences": {
+            "emailNotifications": True,
+            "theme": "light",
+            "language": "fr"
+        },
+        "isActive": True,
+        "isBanned": False,
+        "banInfo": {
+            "isBanned": False,
+            "reason": None,
+            "bannedBy": None,
+            "bannedAt": None,
+            "bannedUntil": None,
+            "duration": None
+        },
+        "createdAt": now,
+        "updatedAt": now
+    }
+
+def synthetic_user_data(index):
+    """Données brutes du i-ème utilisateur (d'abord les utilisateurs d'exemple)"""
+    if index < len(sample_users):
+        return sample_users[index]
+    sample = sample_users[index % len(sample_users)]
+    return {
+        "username": f"user{index:07d}",
+        "email": f"user{index:07d}@example.com",
+        "password": sample["password"],
+        "role": "publisher" if index % PUBLISHER_EVERY == 0 else "user",
+        "profile": sample["profile"]
+    }
+
+@generator("users", "👥", "utilisateurs")
+def generate_users(batches, context):
+    """Générer paresseusement les utilisateurs des lots [début, fin) avec des _id déterministes
+
+    Les mots de passe sont hachés par lots dans le pool : le lot suivant est
+    haché pendant que le lot courant est consommé (et inséré) par l'appelant.
+    """
+    run = context.run
+    def submit(position):
+        start, stop = batches[position]
+        users_data = [synthetic_user_data(i) for i in range(start, stop)]
+        salts = [run.salt(i) for i in range(start, stop)] if run.seed is not None else None
+        pending = hash_passwords_async(
+            context.pool, [u["password"] for u in users_data], context.args.bcrypt_rounds, context.cache, salts
+        )
+        return position, users_data, pending
+
+    batch = submit(0) if batches else None
+    while batch:
+        position, users_data, pending = batch
+        batch = submit(position + 1) if position + 1 < len(batches) else None
+        start = batches[position][0]
+        waiting = time.perf_counter()
+        hashed_passwords = pending.get()
+        context.metrics.add_hash_wait(time.perf_counter() - waiting)
+        for offset, (user_data, hashed_password) in enumerate(zip(users_data, hashed_passwords)):
+            index = start + offset
+            user = build_user(user_data, hashed_password, run.created_at(ID_KIND_USER, index))
+            user["_id"] = run.id(ID_KIND_USER, index)
+            yield user
+
+@generator("posts", "📝", "articles")
+def generate_posts(batches, context):
+    """Générer paresseusement les articles des lots [début, fin) à partir du corpus d'exemple
+
+    Avec --content markov, le contenu, l'extrait et le temps de lecture sont
+    synthétisés (voir markov.py) : chaque article est unique.
+
+    Le nombre de likes suit une loi de Pareto (--likes-alpha) : la plupart des
+    articles ont quelques likes, une poignée devient virale, dans la limite de
+    MAX_LIKES_PER_POST (document sous 16 Mio).
+    """
+    run, args = context.run, context.args
+    # Le i-ème article reprend l'article d'exemple i % n, numéroté au-delà du premier tour
+    slugs = series_slugs(sample["slug"] for sample in sample_posts_data)
+    for start, stop in batches:
+        for index in range(start, stop):
+            rng = run.rng(ID_KIND_POST, index)
+            sample = sample_posts_data[index % len(sample_posts_data)]
+            round_number = index // len(sample_posts_data)
+            created_at = run.created_at(ID_KIND_POST, index)
+            updated_at = created_at
+            if rng.random() < 0.1:
+                # Environ 10 % des articles ont été modifiés après publication
+                updated_at = run.clamp(created_at + timedelta(days=rng.expovariate(1 / 7)))
+            author = context.author_for(rng)
+            likes = context.likers_for(rng, min(int(rng.paretovariate(args.likes_alpha)) - 1, MAX_LIKES_PER_POST))
+            post = {
+                **sample,
+                "_id": run.id(ID_KIND_POST, index),
+                "author": author,
+                "likes": likes,
+                "likesCount": len(likes),
+                "createdAt": created_at,
+                "updatedAt": updated_at
+            }
+            post["slug"] = slugs[index % len(sample_posts_data)]
+            if round_number:
+                post["title"] = f"{sample['title']} (#{round_number})"
+                post["slug"] = f"{post['slug']}-{round_number}"
+            if args.content == "markov":
+                post.update(synthesize_post(
+                    run.rng(ID_KIND_POST, index, "content"), post["title"], args.content_alpha, args.content_max_bytes
+                ))
+            yield post
+
+def comment_thread_size(fanout, depth):
+    """Nombre de commentaires d'un fil complet (racine + `depth` niveaux de `fanout` réponses)"""
+    return sum(fanout ** level for level in range(depth + 1))
+
+def distinct_picks(rng, pick, count):
+    """Tirer `count` valeurs distinctes avec `pick(rng)` (count doit rester petit devant l'ensemble)"""
+    picked = []
+    for _ in range(count * 4):
+        if len(picked) == count:
+            break
+        value = pick(rng)
+        if value not in picked:
+            picked.append(value)
+    return picked
+
+@generator("comments", "💬", "commentaires")
+def generate_comments(batches, context):
+    """Générer paresseusement les commentaires des lots [début, fin), organisés en fils imbriqués
+
+    Les commentaires sont numérotés fil par fil, chaque fil étant un arbre complet
+    parcouru en largeur : le parent du nœud p est (p - 1) // fanout et ses réponses
+    sont fanout * p + 1 … fanout * p + fanout. `parentComment` et `replies` se
+    calculent donc à partir de l'index seul, sans garder d'état entre les lots.
+    Le dernier fil est tronqué pour produire exactement `args.comments` commentaires.
+    """
+    run, args = context.run, context.args
+    post_for, author_for, moderator_for = context.post_for, context.commenter_for, context.author_for
+    fanout, total = args.comment_fanout, args.comments
+    thread_size = comment_thread_size(fanout, args.comment_depth)
+    thread = None
+    for start, stop in batches:
+        for index in range(start, stop):
+            thread_index, position = divmod(index, thread_size)
+            root = thread_index * thread_size
+            if thread_index != thread:
+                # Article et date de création communs à tout le fil
+                thread = thread_index
+                thread_rng = run.rng(ID_KIND_THREAD, thread_index)
+                thread_post, post_created_at = post_for(thread_rng)
+                if post_created_at is None:
+                    thread_started = run.created_at(ID_KIND_THREAD, thread_index)
+                else:
+                    # Les discussions démarrent peu après la publication (quelques jours en moyenne)
+                    thread_started = post_created_at + timedelta(days=thread_rng.expovariate(1 / 3))
+                # Le fil entier (une heure par niveau) reste antérieur à la date de référence
+                latest_start = run.reference_time - timedelta(hours=args.comment_depth + 1)
+                thread_started = max(min(thread_started, latest_start), post_created_at or thread_started)
+
+            rng = run.rng(ID_KIND_COMMENT, index)
+            depth, first = 0, 0
+            while position >= first + fanout ** depth:
+                first += fanout ** depth
+                depth += 1
+            # Une réponse est toujours postérieure à son parent (une heure par niveau au plus)
+            created_at = thread_started + timedelta(hours=depth, milliseconds=rng.randrange(3_600_000))
+            parent = None if position == 0 else run.id(ID_KIND_COMMENT, root + (position - 1) // fanout)
+            replies = [
+                run.id(ID_KIND_COMMENT, root + child)
+                for child in range(fanout * position + 1, fanout * position + fanout + 1)
+                if child < thread_size and root + child < total
+            ]
+            likes = distinct_picks(rng, author_for, min(int(rng.paretovariate(1.5)) - 1, 50))
+
+            comment = {
+                "_id": run.id(ID_KIND_COMMENT, index),
+                "content": rng.choice(sample_comments),
+                "author": author_for(rng),
+                "post": thread_post,
+                "parentComment": parent,
+                "replies": replies,
+                "likes": likes,
+                "isApproved": True,
+                "approvedBy": None,
+                "approvedAt": None,
+                "reports": [],
+                "moderationHistory": [],
+                "isEdited": rng.random() < 0.05,
+                "createdAt": created_at,
+                "updatedAt": created_at
+            }
+
+            # Environ 3 % des commentaires sont signalés, une partie est traitée par un modérateur
+            if rng.random() < 0.03:
+                for k in range(rng.randint(1, 3)):
+                    status = rng.choice(['pending', 'pending', 'resolved', 'dismissed'])
+                    reported_at = created_at + timedelta(minutes=rng.randrange(1, 2880))
+                    comment["reports"].append({
+                        "_id": run.id(ID_KIND_REPORT, index * 8 + k),
+                        "reportedBy": author_for(rng),
+                        "reason": rng.choice(report_reasons),
+                        "description": "",
+                        "reportedAt": reported_at,
+                        "status": status
+                    })
+                    if status != 'pending':
+                        comment["moderationHistory"].append({
+                            "_id": run.id(ID_KIND_MODERATION, index * 8 + k),
+                            "action": "reported",
+                            "moderator": moderator_for(rng),
+                            "reason": f"Signalement {'rejeté' if status == 'dismissed' else 'résolu'}",
+                            "timestamp": reported_at + timedelta(hours=1)
+                        })
+                        comment["updatedAt"] = max(comment["updatedAt"], reported_at + timedelta(hours=1))
+
+            # Environ 2 % sont rejetés, 10 % approuvés explicitement par un modérateur
+            moderation = rng.random()
+            if moderation < 0.12:
+                moderator = moderator_for(rng)
+                moderated_at = created_at + timedelta(minutes=rng.randrange(1, 600))
+                approved = moderation >= 0.02
+                comment["isApproved"] = approved
+                if approved:
+                    comment["approvedBy"] = moderator
+                    comment["approvedAt"] = moderated_at
+                else:
+                    comment["rejectionReason"] = "Contenu non conforme à la charte"
+                comment["moderationHistory"].append({
+                    "_id": run.id(ID_KIND_MODERATION, index * 8 + 7),
+                    "action": "approved" if approved else "rejected",
+                    "moderator": moderator,
+                    "reason": None if approved else comment["rejectionReason"],
+                    "timestamp": moderated_at
+                })
+                comment["updatedAt"] = max(comment["updatedAt"], moderated_at)
+
+            yield comment
+
+def affine_sample(rng, population, count):
+    """Tirer `count` index distincts de range(population) en O(count)
+
+    k -> (a * k + b) mod population est une permutation quand a est premier avec
+    population : ses `count` premières valeurs sont distinctes, même pour 100k+ likes.
+    """
+    count = min(count, population)
+    if count <= 0:
+        return []
+    a = rng.randrange(1, population) if population > 1 else 1
+    while gcd(a, population) != 1:
+        a = rng.randrange(1, population)
+    b = rng.randrange(population)
+    return [(a * k + b) % population for k in range(count)]
+
+def reference_resolvers(db, args, run):
+    """Fonctions rng -> _id des auteurs, commentateurs, likeurs et articles référencés
+
+    `post_for` renvoie (_id, date de création) ; la date est None pour un article existant.
+    """
+    author_for = commenter_for = likers_for = post_for = None
+    if args.users:
+        user_count = args.users
+        publisher_count = (user_count + PUBLISHER_EVERY - 1) // PUBLISHER_EVERY
+        author_for = lambda rng: run.id(ID_KIND_USER, rng.randrange(publisher_count) * PUBLISHER_EVERY)
+        commenter_for = lambda rng: run.id(ID_KIND_USER, rng.randrange(user_count))
+        likers_for = lambda rng, count: [run.id(ID_KIND_USER, i) for i in affine_sample(rng, user_count, count)]
+    elif args.posts or args.comments:
+        user_ids = existing_ids(db.users)
+        author_for = commenter_for = lambda rng: rng.choice(user_ids)
+        likers_for = lambda rng, count: [user_ids[i] for i in affine_sample(rng, len(user_ids), count)]
+
+    # --comment-posts concentre les fils sur les K premiers articles (articles très commentés)
+    if args.posts:
+        post_count = min(args.comment_posts or args.posts, args.posts)
+        def generated_post(rng):
+            index = rng.randrange(post_count)
+            return run.id(ID_KIND_POST, index), run.created_at(ID_KIND_POST, index)
+        post_for = generated_post
+    elif args.comments:
+        post_ids = existing_ids(db.posts)
+        if args.comment_posts:
+            post_ids = post_ids[:args.comment_posts]
+        post_for = lambda rng: (rng.choice(post_ids), None)
+
+    return author_for, commenter_for, likers_for, post_for
@@ -0,0 +1,190 @@
+"""
+Hachage bcrypt des mots de passe : pool de processus et cache disque de hachés pré-calculés
+"""
+
+import os
+import time
+import base64
+import hashlib
+import sqlite3
+import threading
+import bcrypt
+
+from .config import DEFAULT_HASH_CACHE_SIZE
+
+def bcrypt_salt(rounds, salt_bytes):
+    """Sel bcrypt `$2b$` construit à partir de 16 octets (base64 à l'alphabet bcrypt)"""
+    encoded = base64.b64encode(salt_bytes).decode('ascii')[:22]
+    encoded = encoded.translate(str.maketrans(
+        'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/',
+        './ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+    ))
+    return f"$2b${rounds:02d}${encoded}".encode('ascii')
+
+def hash_password(task):
+    """Hasher un mot de passe avec bcrypt (exécuté dans un processus du pool)
+
+    `salt_bytes` fixe le sel (jeux reproductibles) ; sinon un sel aléatoire est tiré.
+    """
+    password, rounds, salt_bytes = task
+    salt = bcrypt.gensalt(rounds) if salt_bytes is None else bcrypt_salt(rounds, salt_bytes)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+class PasswordHashCache:
+    """Cache disque (SQLite) de hachés bcrypt pré-calculés par (mot de passe, coût)
+
+    Chaque haché n'est distribué qu'une fois par exécution : tous les utilisateurs
+    d'un même seed reçoivent donc des hachés distincts (sels différents). Les hachés
+    calculés pendant l'exécution sont ajoutés au cache pour les seeds suivants.
+    Éviction LRU : au-delà de `max_entries` hachés, les couples (mot de passe, coût)
+    utilisés le moins récemment sont supprimés en premier.
+
+    En mode multi-processus, chaque worker ouvre le cache avec sa `partition`
+    (index, nombre de workers) et le `snapshot_id` du coordinateur : les workers
+    se partagent les hachés existants sans jamais distribuer deux fois le même.
+
+    Le pipeline asyncio (--insert-workers > 1) génère les utilisateurs dans des
+    threads : la connexion est partagée entre threads et protégée par un verrou.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_HASH_CACHE_SIZE, partition=(0, 1), snapshot_id=None):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.max_entries = max_entries
+        self.partition = partition
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS hashes (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL,
+                rounds INTEGER NOT NULL,
+                hash TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS hashes_key ON hashes (key, rounds, id);
+            CREATE TABLE IF NOT EXISTS usage (
+                key TEXT NOT NULL,
+                rounds INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (key, rounds)
+            );
+        """)
+        # Les hachés ajoutés pendant l'exécution (id > snapshot_id) ne sont pas redistribués
+        if snapshot_id is None:
+            (snapshot_id,) = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM hashes").fetchone()
+        self.snapshot_id = snapshot_id
+        # (clé, coût) -> dernier id distribué
+        self.cursors = {}
+
+    @staticmethod
+    def key(password):
+        """Clé de cache : empreinte SHA-256, le mot de passe en clair n'est pas stocké"""
+        return hashlib.sha256(password.encode('utf-8')).hexdigest()
+
+    def take(self, password, rounds, count):
+        """Retirer jusqu'à `count` hachés encore inutilisés pendant cette exécution"""
+        key = self.key(password)
+        with self.lock:
+            return self._take(key, rounds, count)
+
+    def _take(self, key, rounds, count):
+        if (key, rounds) not in self.cursors:
+            self.cursors[(key, rounds)] = 0
+            self.conn.execute(
+                "INSERT OR REPLACE INTO usage (key, rounds, last_used) VALUES (?, ?, ?)", (key, rounds, time.time())
+            )
+        worker, workers = self.partition
+        rows = self.conn.execute(
+            "SELECT id, hash FROM hashes WHERE key = ? AND rounds = ? AND id > ? AND id <= ? AND id % ? = ? "
+            "ORDER BY id LIMIT ?",
+            (key, rounds, self.cursors[(key, rounds)], self.snapshot_id, workers, worker, count)
+        ).fetchall()
+        if rows:
+            self.cursors[(key, rounds)] = rows[-1][0]
+        return [hashed for _, hashed in rows]
+
+    def add(self, rounds, entries):
+        """Ajouter des couples (mot de passe, haché) calculés pendant l'exécution"""
+        with self.lock:
+            self.conn.executemany(
+                "INSERT INTO hashes (key, rounds, hash) VALUES (?, ?, ?)",
+                [(self.key(password), rounds, hashed) for password, hashed in entries]
+            )
+            self.conn.commit()
+
+    def evict(self):
+        """Ramener le cache sous `max_entries` en supprimant les clés les moins récemment utilisées"""
+        (total,) = self.conn.execute("SELECT COUNT(*) FROM hashes").fetchone()
+        excess = total - self.max_entries
+        groups = self.conn.execute("""
+            SELECT h.key, h.rounds, COUNT(*) FROM hashes h
+            LEFT JOIN usage u ON u.key = h.key AND u.rounds = h.rounds
+            GROUP BY h.key, h.rounds ORDER BY COALESCE(u.last_used, 0)
+        """).fetchall()
+        for key, rounds, size in groups:
+            if excess <= 0:
+                break
+            if size <= excess:
+                self.conn.execute("DELETE FROM hashes WHERE key = ? AND rounds = ?", (key, rounds))
+                self.conn.execute("DELETE FROM usage WHERE key = ? AND rounds = ?", (key, rounds))
+            else:
+                self.conn.execute("""
+                    DELETE FROM hashes WHERE id IN (
+                        SELECT id FROM hashes WHERE key = ? AND rounds = ? ORDER BY id DESC LIMIT ?
+                    )
+                """, (key, rounds, excess))
+            excess -= size
+        self.conn.commit()
+
+    def close(self, evict=True):
+        """Appliquer la politique d'éviction (coordinateur uniquement) puis fermer la base"""
+        with self.lock:
+            if evict:
+                self.evict()
+            self.conn.commit()
+            self.conn.close()
+
+class PendingHashes:
+    """Lot de hachés en cours : hachés tirés du cache + calculs en attente dans le pool"""
+
+    def __init__(self, hashes, missing, pending, rounds, cache):
+        self.hashes = hashes
+        self.missing = missing
+        self.pending = pending
+        self.rounds = rounds
+        self.cache = cache
+
+    def get(self):
+        """Attendre la fin du hachage et renvoyer les hachés dans l'ordre des mots de passe"""
+        if self.pending is not None:
+            computed = self.pending.get()
+            for (position, _), hashed in zip(self.missing, computed):
+                self.hashes[position] = hashed
+            if self.cache is not None:
+                self.cache.add(self.rounds, [(password, hashed) for (_, password), hashed in zip(self.missing, computed)])
+            self.pending = None
+        return self.hashes
+
+def hash_passwords_async(pool, passwords, rounds, cache=None, salts=None):
+    """Soumettre un lot de mots de passe au pool de hachage sans attendre le résultat
+
+    Les hachés disponibles dans le cache sont utilisés directement ; seuls les
+    manquants sont calculés par le pool. Avec des `salts` imposés (jeux
+    reproductibles), le cache n'est pas utilisé.
+    """
+    hashes = [None] * len(passwords)
+    if salts is not None:
+        cache = None
+    if cache is not None:
+        positions = {}
+        for position, password in enumerate(passwords):
+            positions.setdefault(password, []).append(position)
+        for password, password_positions in positions.items():
+            for position, hashed in zip(password_positions, cache.take(password, rounds, len(password_positions))):
+                hashes[position] = hashed
+    missing = [(position, password) for position, password in enumerate(passwords) if hashes[position] is None]
+    pending = None
+    if missing:
+        tasks = [(password, rounds, salts[position] if salts else None) for position, password in missing]
+        chunksize = max(1, len(tasks) // 64)
+        pending = pool.map_async(hash_password, tasks, chunksize)
+    return PendingHashes(hashes, missing, pending, rounds, cache)
@@ -0,0 +1,105 @@
+"""
+Synthèse de contenu d'articles : chaîne de Markov entraînée sur le corpus d'exemple
+
+Le texte est généré mot à mot par une chaîne d'ordre 2 apprise sur la prose des
+articles du corpus ; les titres de section et les blocs de code (avec leur langage)
+sont tirés parmi ceux du corpus. Chaque article est unique, en français, au format
+markdown, et sa taille suit une loi de Pareto bornée par la limite de express.json.
+"""
+
+import re
+
+from .config import CONTENT_MIN_BYTES, DEFAULT_CONTENT_ALPHA, CONTENT_MAX_BYTES
+from .corpus import sample_posts_data, read_time
+
+START = ""
+SENTENCE_END = ('.', '!', '?')
+CODE_FENCE = re.compile(r'^```(\w*)\n(.*?)^```', re.M | re.S)
+LIST_MARKER = re.compile(r'^\s*(?:[-*]|\d+\.)\s+')
+
+class MarkovContent:
+    """Générateur de contenu markdown entraîné sur une liste de textes markdown"""
+
+    def __init__(self, documents):
+        # (mot, mot) -> mots suivants (avec répétitions : elles portent les probabilités)
+        self.chain = {}
+        self.headings = []
+        self.code_blocks = []
+        for document in documents:
+            for language, code in CODE_FENCE.findall(document):
+                self.code_blocks.append(f"```{language}\n{code}```")
+            for line in CODE_FENCE.sub('', document).splitlines():
+                if line.startswith('## ') or line.startswith('### '):
+                    self.headings.append(line.lstrip('#').strip())
+                elif line.strip() and not line.startswith(('#', '|', '>', ' ', '\t')) and '`' * 3 not in line:
+                    self.train(LIST_MARKER.sub('', line).split())
+
+    def train(self, words):
+        """Ajouter une ligne de prose à la chaîne (chaque ligne est une suite de phrases)"""
+        state = (START, START)
+        for word in words:
+            self.chain.setdefault(state, []).append(word)
+            state = (START, START) if word.endswith(SENTENCE_END) else (state[1], word)
+        if state != (START, START):
+            self.chain.setdefault(state, []).append(None)
+
+    def sentence(self, rng, max_words=40):
+        """Une phrase : on part d'un début de phrase jusqu'à une ponctuation finale"""
+        words, state = [], (START, START)
+        while len(words) < max_words:
+            word = rng.choice(self.chain.get(state) or [None])
+            if word is None:
+                break
+            words.append(word)
+            if word.endswith(SENTENCE_END):
+                break
+            state = (state[1], word)
+        text = ' '.join(words).rstrip(' :')
+        return text if text.endswith(SENTENCE_END) else text + '.'
+
+    def paragraph(self, rng):
+        return ' '.join(self.sentence(rng) for _ in range(rng.randint(2, 6)))
+
+    def target_size(self, rng, alpha=DEFAULT_CONTENT_ALPHA, max_bytes=CONTENT_MAX_BYTES):
+        """Taille visée du contenu en octets (Pareto : quelques articles très longs)"""
+        return min(max_bytes, int(CONTENT_MIN_BYTES * rng.paretovariate(alpha)))
+
+    def article(self, rng, title, size):
+        """Contenu markdown d'environ `size` octets : titre, introduction, sections et blocs de code
+
+        La dernière section dépasse au plus de quelques ko (jamais un bloc de code coupé).
+        Renvoie (contenu, extrait) ; l'extrait est le début de l'introduction.
+        """
+        introduction = self.paragraph(rng)
+        parts = [f"# {title}", introduction]
+        written = sum(len(part.encode('utf-8')) + 2 for part in parts)
+        while written < size:
+            section = [f"## {rng.choice(self.headings)}"] if self.headings else []
+            for _ in range(rng.randint(1, 3)):
+                section.append(self.paragraph(rng))
+            if self.code_blocks and rng.random() < 0.6:
+                section.append(rng.choice(self.code_blocks))
+            parts += section
+            written += sum(len(part.encode('utf-8')) + 2 for part in section)
+        return '\n\n'.join(parts), excerpt(introduction)
+
+def excerpt(text, max_length=300):
+    """Extrait conforme au modèle Post (300 caractères au plus), coupé sur un mot"""
+    if len(text) <= max_length:
+        return text
+    return text[:max_length - 1].rsplit(' ', 1)[0] + '…'
+
+_model = None
+
+def content_model():
+    """Modèle entraîné sur le corpus d'articles, construit une fois par processus"""
+    global _model
+    if _model is None:
+        _model = MarkovContent(article["content"] for article in sample_posts_data)
+    return _model
+
+def synthesize_post(rng, title, alpha=DEFAULT_CONTENT_ALPHA, max_bytes=CONTENT_MAX_BYTES):
+    """Champs content, excerpt et readTime d'un article synthétique"""
+    model = content_model()
+    content, summary = model.article(rng, title, model.target_size(rng, alpha, max_bytes))
+    return {"content": content, "excerpt": summary, "readTime": read_time(content)}
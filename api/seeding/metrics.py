@@ -0,0 +1,153 @@
+"""
+Mesures de débit du seed : durée de chaque étape par lot, volumes, latences et rapport JSON
+"""
+
+import os
+import json
+from datetime import datetime, timezone
+
+# Étapes mesurées pour chaque lot :
+# - generate : construction des documents (hors attente du hachage)
+# - hash     : attente des hachés bcrypt du pool (CPU des processus de hachage)
+# - checksum : encodage BSON et empreinte SHA-256 du lot
+# - insert   : insert_many / bulk_write (réseau et mongod), ou écriture gzip en export hors ligne
+STAGES = ("generate", "hash", "checksum", "insert")
+PERCENTILES = (50, 95, 99)
+
+def percentile(sorted_values, p):
+    """Percentile par rang le plus proche d'une liste triée (0 si vide)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-p * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+class SeedMetrics:
+    """Mesures accumulées par un processus de seed, fusionnables entre workers"""
+
+    def __init__(self):
+        # collection -> documents, lots, octets BSON, secondes par étape, latences par lot
+        self.collections = {}
+        # Phases hors lots (index, compteurs des utilisateurs) -> secondes
+        self.phases = {}
+        # Attente du hachage accumulée depuis le dernier lot enregistré
+        self.hash_wait = 0.0
+
+    def collection(self, name):
+        if name not in self.collections:
+            self.collections[name] = {
+                "documents": 0, "batches": 0, "bytes": 0,
+                "seconds": {stage: 0.0 for stage in STAGES},
+                "batchLatencies": [], "insertLatencies": []
+            }
+        return self.collections[name]
+
+    def add_hash_wait(self, seconds):
+        self.hash_wait += seconds
+
+    def take_hash_wait(self):
+        """Attente du hachage depuis le dernier appel (à relever juste après la production d'un lot)"""
+        waited, self.hash_wait = self.hash_wait, 0.0
+        return waited
+
+    def record_batch(self, name, documents, size, produced, checksum, insert, hashing=None):
+        """Enregistrer un lot : `produced` est la durée de production des documents, attente du hachage comprise"""
+        stats = self.collection(name)
+        hashing = min(self.take_hash_wait() if hashing is None else hashing, produced)
+        timings = {"generate": produced - hashing, "hash": hashing, "checksum": checksum, "insert": insert}
+        for stage, seconds in timings.items():
+            stats["seconds"][stage] += seconds
+        stats["documents"] += documents
+        stats["batches"] += 1
+        stats["bytes"] += size
+        stats["batchLatencies"].append(produced + checksum + insert)
+        stats["insertLatencies"].append(insert)
+
+    def record_phase(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self):
+        return {"collections": self.collections, "phases": self.phases}
+
+    def merge(self, data):
+        """Ajouter les mesures d'un worker (résultat de to_dict)"""
+        for name, other in data["collections"].items():
+            stats = self.collection(name)
+            for key in ("documents", "batches", "bytes"):
+                stats[key] += other[key]
+            for stage in STAGES:
+                stats["seconds"][stage] += other["seconds"][stage]
+            stats["batchLatencies"] += other["batchLatencies"]
+            stats["insertLatencies"] += other["insertLatencies"]
+        for phase, seconds in data["phases"].items():
+            self.record_phase(phase, seconds)
+
+    def report(self, elapsed, params=None, workers=1, connection=None):
+        """Rapport de l'exécution : débits, répartition du temps par étape, percentiles des latences
+
+        En multi-processus, les secondes par étape sont additionnées sur les workers
+        (temps de worker, d'où les débits par seconde de worker) ; `elapsed` et
+        `docsPerSecond` restent mesurés sur la durée réelle de l'exécution.
+        """
+        collections, totals = {}, {stage: 0.0 for stage in STAGES}
+        for name, stats in self.collections.items():
+            busy = sum(stats["seconds"].values())
+            entry = {
+                "documents": stats["documents"],
+                "batches": stats["batches"],
+                "bytes": stats["bytes"],
+                "docsPerWorkerSecond": stats["documents"] / busy if busy else 0,
+                "bytesPerWorkerSecond": stats["bytes"] / busy if busy else 0,
+                "seconds": {stage: round(seconds, 3) for stage, seconds in stats["seconds"].items()}
+            }
+            for key, latencies in (("batchLatencyMs", stats["batchLatencies"]), ("insertLatencyMs", stats["insertLatencies"])):
+                ordered = sorted(latencies)
+                entry[key] = {f"p{p}": round(percentile(ordered, p) * 1000, 2) for p in PERCENTILES}
+            collections[name] = entry
+            for stage in STAGES:
+                totals[stage] += stats["seconds"][stage]
+        busy = sum(totals.values())
+        documents = sum(entry["documents"] for entry in collections.values())
+        bottleneck = max(totals, key=totals.get) if busy else None
+        return {
+            "finishedAt": datetime.now(timezone.utc).isoformat(),
+            "elapsedSeconds": round(elapsed, 3),
+            "workers": workers,
+            "params": params or {},
+            "connection": connection or {},
+            "documents": documents,
+            "bytes": sum(entry["bytes"] for entry in collections.values()),
+            "docsPerSecond": documents / elapsed if elapsed else 0,
+            "stageShare": {stage: round(seconds / busy, 4) if busy else 0 for stage, seconds in totals.items()},
+            "bottleneck": bottleneck,
+            "phases": {phase: round(seconds, 3) for phase, seconds in self.phases.items()},
+            "collections": collections
+        }
+
+def write_report(path, report):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+# Interprétation de l'étape dominante, affichée en fin de seed
+BOTTLENECK_HINTS = {
+    "generate": "CPU (génération des documents) : ajouter des --workers",
+    "hash": "CPU (bcrypt) : augmenter --hash-workers, baisser --bcrypt-rounds ou garder le cache de hachés",
+    "checksum": "CPU (encodage BSON et empreintes) : ajouter des --workers",
+    "insert": "E/S : mongod ou le réseau limite le débit (en export --output : la compression, voir --gzip-level)"
+}
+
+def print_report(report):
+    """Afficher le résumé du rapport"""
+    for name, entry in report["collections"].items():
+        latency = entry["insertLatencyMs"]
+        per_worker = " par worker" if report["workers"] > 1 else ""
+        print(f"   📈 {name}: {entry['documents']} documents, {entry['bytes'] / 1e6:,.1f} Mo, "
+              f"{entry['docsPerWorkerSecond']:,.0f} docs/s{per_worker}, insert p50 {latency['p50']} ms / "
+              f"p95 {latency['p95']} ms / p99 {latency['p99']} ms")
+    if report.get("connection"):
+        settings = ", ".join(f"{name}={value}" for name, value in report["connection"].items() if value is not None)
+        print(f"   🔧 Réglages : {settings}")
+    share = ", ".join(f"{stage} {value:.0%}" for stage, value in report["stageShare"].items())
+    print(f"   ⏳ Répartition du temps : {share}")
+    if report["bottleneck"]:
+        print(f"   🔎 Étape dominante : {BOTTLENECK_HINTS[report['bottleneck']]}")
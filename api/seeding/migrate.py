@@ -0,0 +1,522 @@
+"""
+Migration d'un export vers MongoDB Atlas : par lots, en parallèle, avec reprise et vérification
+
+Remplace scripts/import-atlas-data-nodejs.js, qui lit chaque fichier d'export en
+entier, vide la collection (deleteMany) puis l'insère en un seul insertMany : une
+coupure réseau en cours de route laisse Atlas à moitié vide, et les gros fichiers
+dépassent les limites de taille des messages.
+
+Ici, les fichiers NDJSON d'un export complet (python -m seeding.export) sont lus en
+flux et insérés par lots de --batch-size dans des collections de chargement, par
+--workers processus. Chaque lot est journalisé (SeedCheckpoint) : --resume saute
+les lots terminés et rejoue en upsert ceux qui étaient en cours. Une fois tout
+chargé, chaque collection est vérifiée (nombre de documents et empreinte des
+documents lus dans l'export et relus dans Atlas, voir storage.documents_digest) ;
+les collections live ne sont remplacées (index des modèles, puis renommage) que
+si toutes les vérifications réussissent. Le résultat est écrit dans
+import-report.json, dans le dossier de l'export.
+
+--sync met à jour les collections live sans les réécrire : les _id des fichiers de
+suppression d'un export incrémental sont d'abord supprimés, puis chaque lot de
+l'export est envoyé à Atlas ($documents), joint aux documents de même _id ($lookup)
+et comparé par le serveur, document entier contre document entier ($ne, ordre des
+champs compris) ; seuls les _id des documents nouveaux ou modifiés reviennent.
+Seuls ceux-là sont écrits (ReplaceOne upsert, bulk_write non ordonné). Index et
+oplog ne voient que les changements. La comparaison du serveur distingue toute valeur
+différente (2.2 et 2.3 aussi) mais tient pour égaux des nombres de même valeur et de
+types différents : un Int64 d'Atlas relu comme int dans l'export n'est pas réécrit.
+Un serveur antérieur à MongoDB 5.1 (sans $documents) renvoie les documents,
+comparés ici par SHA-256 de leur BSON : un changement de type numérique y compte
+comme une modification. Un export complet ne contient pas de suppressions : les
+documents absents de l'export restent dans Atlas.
+
+Usage (depuis api/, MONGODB_ATLAS_URI défini dans .env) :
+    python -m seeding.migrate                    # dernier export de mongodb-export/
+    python -m seeding.migrate --export mongodb-export/jgazette-export-<horodatage> --workers 8
+    python -m seeding.migrate --resume           # reprendre après une coupure
+    python -m seeding.migrate --sync --export mongodb-export/jgazette-export-<horodatage>  # export incrémental
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from itertools import islice
+from pymongo import MongoClient, ReplaceOne, DeleteOne, ASCENDING
+from pymongo.errors import ConnectionFailure, BulkWriteError, OperationFailure
+from bson import encode as bson_encode, json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from .config import MONGODB_ATLAS_URI, DB_NAME, COLLECTIONS, SEED_CACHE_DIR, DEFAULT_BATCH_SIZE
+from .checkpoint import SeedCheckpoint
+from .export import EXPORT_DIR, open_decompressed, latest_export
+from .slugs import SlugAllocator, slug_conflicts, slugify
+from .storage import MODEL_INDEXES, staging_collection, swap_staging, documents_digest
+
+# Journal de reprise de la migration (voir SeedCheckpoint)
+DEFAULT_MIGRATION_CHECKPOINT_PATH = os.path.join(SEED_CACHE_DIR, 'migration.jsonl')
+# Nouvelles tentatives d'un lot après une coupure réseau, avec attente croissante (secondes)
+WRITE_RETRIES = 5
+RETRY_DELAY = 2
+# Documents envoyés par agrégation de comparaison ($documents), sous la limite de 16 Mio d'une commande
+COMPARE_REQUEST_BYTES = 8 * 1024 * 1024
+# Clé des lots de suppression dans le journal : "<collection>-deleted"
+DELETED_SUFFIX = '-deleted'
+# Clé du renommage d'une collection vérifiée dans le journal : "<collection>-swapped" (empreinte vérifiée)
+SWAPPED_SUFFIX = '-swapped'
+
+def load_export(export_path, sync=False):
+    """Métadonnées d'un export au format NDJSON (complet, ou incrémental en mode --sync)"""
+    with open(os.path.join(export_path, 'metadata.json'), encoding='utf-8') as f:
+        metadata = json.load(f)
+    if "files" not in metadata:
+        raise RuntimeError("Export Node.js (tableaux JSON) : refaire l'export avec python -m seeding.export")
+    if metadata.get("mode") == "incremental" and not sync:
+        raise RuntimeError("Export incrémental : la migration importe un export complet (ou utiliser --sync)")
+    return metadata
+
+def export_tasks(metadata, collections):
+    """Fichiers à importer : (collection, fichier, rang de son premier document dans la collection)"""
+    tasks = []
+    for name in collections:
+        offset = 0
+        for entry in metadata["files"].get(name, []):
+            tasks.append((name, entry["file"], offset))
+            offset += entry["documents"]
+    return tasks
+
+def deletion_tasks(metadata, collections):
+    """Fichiers de suppression d'un export incrémental : (collection, fichier)"""
+    deleted = metadata.get("deleted", {})
+    return [(name, deleted[name]["file"]) for name in collections if name in deleted]
+
+_db = None
+_slugs = None
+# Faux dès qu'Atlas refuse $documents : comparaison sur le client pour la suite du processus
+_server_compare = True
+
+def open_target(uri):
+    """Initialisation d'un processus de migration : un client Atlas et un allocateur de slugs par processus"""
+    global _db, _slugs
+    _db = MongoClient(uri).get_default_database(DB_NAME)
+    _slugs = SlugAllocator()
+
+def with_retries(collection, write):
+    """Appeler write(retry), à nouveau après une coupure réseau, avec attente croissante"""
+    for attempt in range(WRITE_RETRIES + 1):
+        try:
+            return write(attempt > 0)
+        except ConnectionFailure as e:
+            if attempt == WRITE_RETRIES:
+                raise
+            print(f"⚠️  {collection.name}: {e} — nouvelle tentative dans {RETRY_DELAY * (attempt + 1)}s")
+            time.sleep(RETRY_DELAY * (attempt + 1))
+
+def write_batch(collection, documents, upsert):
+    """insert_many non ordonné, ou upsert par _id d'un lot peut-être écrit en partie
+
+    Après une coupure réseau, le lot est rejoué en upsert : les documents déjà
+    insérés sont remplacés à l'identique au lieu de provoquer des doublons de clé.
+    """
+    def write(retry):
+        if upsert or retry:
+            collection.bulk_write([ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in documents], ordered=False)
+        else:
+            collection.insert_many(documents, ordered=False)
+    with_retries(collection, write)
+
+def write_documents(collection, name, documents, upsert):
+    """write_batch, en réattribuant les slugs d'articles refusés par l'index unique ; retourne le nombre de slugs changés
+
+    Les slugs ne sont pas préchargés : seul un refus du serveur (collision réelle,
+    avec un article déjà en base ou du même lot) fait suffixer un slug par _slugs.
+    Les documents sont modifiés : l'empreinte du lot est celle des documents écrits.
+    """
+    if name != "posts":
+        write_batch(collection, documents, upsert)
+        return 0
+    originals = [doc.get("slug") or slugify(doc.get("title", '')) for doc in documents]
+    pending = list(range(len(documents)))
+    while pending:
+        try:
+            write_batch(collection, [documents[position] for position in pending], upsert)
+            pending = []
+        except BulkWriteError as e:
+            conflicts = slug_conflicts(e)
+            if conflicts is None:
+                raise
+            # Les autres documents du lot non ordonné sont écrits : seuls les refusés sont rejoués
+            pending = [pending[index] for index in conflicts]
+            for position in pending:
+                _slugs.taken.add(documents[position].get("slug"))
+                documents[position]["slug"] = _slugs.allocate(originals[position])
+    return sum(doc["slug"] != original for doc, original in zip(documents, originals))
+
+def import_file(name, path, offset, checkpoint_path, batch_size):
+    """Importer un fichier d'export par lots dans la collection de chargement
+
+    Le rang d'un lot dans la collection (offset + position dans le fichier) sert de
+    clé dans le journal ; les lots déjà terminés sont lus sans être décodés.
+    """
+    collection = staging_collection(_db, name)
+    checkpoint = SeedCheckpoint.load(checkpoint_path)
+    written = skipped = renamed = 0
+    with open_decompressed(path) as lines:
+        start = offset
+        while batch := list(islice(lines, batch_size)):
+            stop = start + len(batch)
+            if checkpoint.is_done(name, start):
+                skipped += len(batch)
+            else:
+                documents = [json_util.loads(line) for line in batch]
+                upsert = checkpoint.needs_upsert(name, start)
+                if not upsert:
+                    checkpoint.mark("started", name, start, stop)
+                renamed += write_documents(collection, name, documents, upsert)
+                digest, _ = documents_digest(documents)
+                checkpoint.mark("done", name, start, stop, digest)
+                written += len(batch)
+            start = stop
+    return {"written": written, "skipped": skipped, "renamed": renamed}
+
+def size_chunks(documents, max_bytes):
+    """Découper une liste de documents en tranches d'au plus `max_bytes` octets BSON (au moins un document)"""
+    chunk, size = [], 0
+    for doc in documents:
+        length = len(bson_encode(doc))
+        if chunk and size + length > max_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(doc)
+        size += length
+    if chunk:
+        yield chunk
+
+def changed_documents(collection, documents):
+    """_id des documents nouveaux ou modifiés -> déjà présent dans la cible, comparés par le serveur
+
+    Chaque document de l'export est envoyé sous `source`, à côté de son _id : le
+    $lookup ajoute le document de la cible, comparé en entier à `source`.
+    """
+    changed = {}
+    for chunk in size_chunks(documents, COMPARE_REQUEST_BYTES):
+        for doc in collection.database.aggregate([
+            {"$documents": [{"_id": doc["_id"], "source": doc} for doc in chunk]},
+            {"$lookup": {"from": collection.name, "localField": "_id", "foreignField": "_id", "as": "target"}},
+            {"$match": {"$expr": {"$ne": [{"$first": "$target"}, "$source"]}}},
+            {"$project": {"exists": {"$gt": [{"$size": "$target"}, 0]}}}
+        ]):
+            changed[doc["_id"]] = doc["exists"]
+    return changed
+
+def changed_documents_locally(collection, documents):
+    """Même résultat que changed_documents, en relisant les documents de la cible (serveur < 5.1)"""
+    raw = collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+    existing = {
+        doc["_id"]: hashlib.sha256(doc.raw).digest()
+        for doc in raw.find({"_id": {"$in": [doc["_id"] for doc in documents]}})
+    }
+    return {
+        doc["_id"]: doc["_id"] in existing
+        for doc in documents if existing.get(doc["_id"]) != hashlib.sha256(bson_encode(doc)).digest()
+    }
+
+def compare_batch(collection, documents):
+    """Comparaison par le serveur si possible, sinon (et pour la suite du processus) sur le client"""
+    global _server_compare
+    if _server_compare:
+        try:
+            return changed_documents(collection, documents)
+        except OperationFailure as e:
+            print(f"⚠️  {collection.name}: comparaison côté serveur indisponible ({e}), documents relus")
+            _server_compare = False
+    return changed_documents_locally(collection, documents)
+
+def sync_file(name, path, offset, checkpoint_path, batch_size):
+    """Synchroniser la collection live avec un fichier d'export : seuls les documents nouveaux ou modifiés sont écrits
+
+    Un lot rejoué après une reprise est comparé à nouveau : ses documents déjà
+    écrits sont identiques et ne sont pas renvoyés.
+    """
+    collection = _db[name]
+    checkpoint = SeedCheckpoint.load(checkpoint_path)
+    counts = {"inserted": 0, "replaced": 0, "unchanged": 0, "renamed": 0, "skipped": 0}
+    with open_decompressed(path) as lines:
+        start = offset
+        while batch := list(islice(lines, batch_size)):
+            stop = start + len(batch)
+            if checkpoint.is_done(name, start):
+                counts["skipped"] += len(batch)
+            else:
+                documents = [json_util.loads(line) for line in batch]
+                existing = compare_batch(collection, documents)
+                changed = [doc for doc in documents if doc["_id"] in existing]
+                replaced = sum(existing.values())
+                counts["inserted"] += len(changed) - replaced
+                counts["replaced"] += replaced
+                counts["unchanged"] += len(documents) - len(changed)
+                if changed:
+                    counts["renamed"] += write_documents(collection, name, changed, upsert=True)
+                digest, _ = documents_digest(documents)
+                checkpoint.mark("done", name, start, stop, digest)
+            start = stop
+    return counts
+
+def delete_file(name, path, checkpoint_path, batch_size):
+    """Supprimer de la collection live les _id d'un fichier de suppression (DeleteOne, bulk_write non ordonné)"""
+    collection = _db[name]
+    checkpoint = SeedCheckpoint.load(checkpoint_path)
+    key = name + DELETED_SUFFIX
+    counts = {"deleted": 0, "skipped": 0}
+    with open_decompressed(path) as lines:
+        start = 0
+        while batch := list(islice(lines, batch_size)):
+            stop = start + len(batch)
+            if checkpoint.is_done(key, start):
+                counts["skipped"] += len(batch)
+            else:
+                requests = [DeleteOne({"_id": json_util.loads(line)["_id"]}) for line in batch]
+                result = with_retries(collection, lambda retry: collection.bulk_write(requests, ordered=False))
+                counts["deleted"] += result.deleted_count
+                checkpoint.mark("done", key, start, stop)
+            start = stop
+    return counts
+
+def sync(db, args, export_path, metadata, collections):
+    """Mode --sync : supprimer les _id des fichiers de suppression, puis écrire les documents nouveaux ou modifiés"""
+    for name in collections:
+        db[name].create_indexes(MODEL_INDEXES[name])
+    totals = {name: {"inserted": 0, "replaced": 0, "unchanged": 0, "deleted": 0, "renamed": 0} for name in collections}
+    processed, started = 0, time.perf_counter()
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(args.workers, mp_context=context, initializer=open_target, initargs=(args.uri,)) as executor:
+        # Les suppressions d'abord : elles libèrent les slugs que des articles de l'export peuvent reprendre.
+        # Un _id supprimé n'est jamais aussi dans l'export (absent de la collection quand l'export l'a listé)
+        steps = ((delete_file, deletion_tasks(metadata, collections)), (sync_file, export_tasks(metadata, collections)))
+        for function, tasks in steps:
+            futures = {
+                executor.submit(
+                    function, name, os.path.join(export_path, relative), *rest, args.checkpoint, args.batch_size
+                ): name
+                for name, relative, *rest in tasks
+            }
+            for future in as_completed(futures):
+                result = future.result()
+                for key, count in result.items():
+                    if key != "skipped":
+                        totals[futures[future]][key] += count
+                processed += sum(count for key, count in result.items() if key != "renamed")
+                rate = processed / (time.perf_counter() - started)
+                print(f"   … {processed:,} documents synchronisés ({rate:,.0f} docs/s)", end='\r')
+        if processed:
+            print()
+    for name, entry in totals.items():
+        print(f"  🔄 {name}: {entry['inserted']} ajouté(s), {entry['replaced']} remplacé(s), "
+              f"{entry['deleted']} supprimé(s), {entry['unchanged']} inchangé(s)"
+              + (f", {entry['renamed']} slug(s) déjà pris suffixé(s)" if entry['renamed'] else ""))
+    return {
+        "importDate": datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+        "sourceExport": os.path.basename(os.path.normpath(export_path)),
+        "database": db.name,
+        "mode": "sync",
+        "collections": {name: db[name].estimated_document_count() for name in collections},
+        "sync": totals,
+        "writes": sum(entry["inserted"] + entry["replaced"] + entry["deleted"] for entry in totals.values()),
+        "elapsedSeconds": round(time.perf_counter() - started, 3)
+    }
+
+def collection_digest(name):
+    """Nombre de documents et empreinte de la collection de chargement, relue en BSON brut"""
+    collection = staging_collection(_db, name).with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+    count = total = 0
+    for doc in collection.find({}, batch_size=10_000):
+        count += 1
+        total += int.from_bytes(hashlib.sha256(doc.raw).digest(), 'big')
+    return count, f"{total % (1 << 256):064x}"
+
+def source_digest(checkpoint, name):
+    """Empreinte de la collection dans l'export : somme des empreintes des lots du journal"""
+    total = sum(int(digest, 16) for (collection, _), digest in checkpoint.done.items() if collection == name and digest)
+    return f"{total % (1 << 256):064x}"
+
+def migrate(db, args, export_path, metadata, collections):
+    """Importer, vérifier puis (si tout concorde) remplacer les collections live ; retourne le rapport
+
+    En reprise après un remplacement interrompu, les collections déjà renommées
+    (journalisées sous "<collection>-swapped") ne sont ni réimportées ni revérifiées :
+    leur collection de chargement n'existe plus.
+    """
+    checkpoint = SeedCheckpoint.load(args.checkpoint)
+    swapped = {
+        name: checkpoint.done[(name + SWAPPED_SUFFIX, 0)] for name in collections if checkpoint.is_done(name + SWAPPED_SUFFIX, 0)
+    }
+    pending = [name for name in collections if name not in swapped]
+    tasks = export_tasks(metadata, pending)
+    if "posts" in pending:
+        # Index unique des slugs dès le chargement : les doublons sont refusés lot par lot, pas au renommage
+        slug_index = [index for index in MODEL_INDEXES["posts"] if index.document["key"] == {"slug": ASCENDING}]
+        staging_collection(db, "posts").create_indexes(slug_index)
+    imported, started = 0, time.perf_counter()
+    renamed = {name: 0 for name in collections}
+    # spawn : aucun processus n'hérite du MongoClient du coordinateur
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(args.workers, mp_context=context, initializer=open_target, initargs=(args.uri,)) as executor:
+        futures = {
+            executor.submit(
+                import_file, name, os.path.join(export_path, relative), offset, args.checkpoint, args.batch_size
+            ): name
+            for name, relative, offset in tasks
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            imported += result["written"] + result["skipped"]
+            renamed[futures[future]] += result["renamed"]
+            rate = imported / (time.perf_counter() - started)
+            print(f"   … {imported:,} documents importés ({rate:,.0f} docs/s)", end='\r')
+        if tasks:
+            print()
+
+        print("🔍 Vérification des collections importées...")
+        targets = {name: executor.submit(collection_digest, name) for name in pending}
+        checkpoint = SeedCheckpoint.load(args.checkpoint)
+        verification = {}
+        for name in collections:
+            source = source_digest(checkpoint, name)
+            expected = metadata["collections"].get(name, 0)
+            if name in swapped:
+                verification[name] = {
+                    "expected": expected, "imported": expected, "sourceDigest": source, "targetDigest": swapped[name],
+                    "ok": swapped[name] == source, "swapped": True
+                }
+                print(f"  ✅ {name}: déjà vérifiée et remplacée (empreinte {swapped[name][:16]}…)")
+                continue
+            count, digest = targets[name].result()
+            verification[name] = {
+                "expected": expected,
+                "imported": count,
+                "sourceDigest": source,
+                "targetDigest": digest,
+                "ok": count == expected and digest == source
+            }
+            icon = "✅" if verification[name]["ok"] else "❌"
+            print(f"  {icon} {name}: {count}/{expected} documents, empreinte {digest[:16]}… (export {source[:16]}…)")
+            if renamed[name]:
+                print(f"  ⚠️  {name}: {renamed[name]} slug(s) en double suffixé(s)")
+
+    verified = all(entry["ok"] for entry in verification.values())
+    if verified:
+        for name in pending:
+            swap_staging(db, name)
+            checkpoint.mark("done", name + SWAPPED_SUFFIX, 0, verification[name]["imported"], verification[name]["targetDigest"])
+    return {
+        "importDate": datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+        "sourceExport": os.path.basename(os.path.normpath(export_path)),
+        "database": db.name,
+        "collections": {name: entry["imported"] for name, entry in verification.items()},
+        "totalDocuments": sum(entry["imported"] for entry in verification.values()),
+        "elapsedSeconds": round(time.perf_counter() - started, 3),
+        "verification": verification,
+        "renamedSlugs": renamed,
+        "verified": verified
+    }
+
+def parse_args(argv=None):
+    """Lire les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Migration d'un export JGazette vers MongoDB Atlas")
+    parser.add_argument('--export', help=f"dossier de l'export à importer (défaut: le plus récent de {EXPORT_DIR})")
+    parser.add_argument('--uri', default=MONGODB_ATLAS_URI, help="URI du cluster de destination (défaut: MONGODB_ATLAS_URI)")
+    parser.add_argument('--collections', nargs='+', choices=COLLECTIONS, default=list(COLLECTIONS),
+                        help="collections à importer (défaut: toutes)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="processus d'import, chacun avec son client (défaut: nombre de cœurs)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"documents par insert_many (défaut: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument('--checkpoint', default=DEFAULT_MIGRATION_CHECKPOINT_PATH,
+                        help="journal des lots importés, utilisé pour la reprise")
+    parser.add_argument('--resume', action='store_true', help="reprendre la migration interrompue décrite par --checkpoint")
+    parser.add_argument('--sync', action='store_true',
+                        help="écrire dans les collections live les seuls documents nouveaux, modifiés ou supprimés")
+    parser.add_argument('--yes', action='store_true', help="ne pas demander de confirmation")
+    args = parser.parse_args(argv)
+    if not args.uri:
+        parser.error("MONGODB_ATLAS_URI n'est pas définie dans les variables d'environnement (ou passer --uri)")
+    if args.workers < 1 or args.batch_size < 1:
+        parser.error("--workers et --batch-size doivent être >= 1")
+    if args.resume and not os.path.exists(args.checkpoint):
+        parser.error(f"aucun journal de reprise trouvé: {args.checkpoint}")
+    return args
+
+def main():
+    """Fonction principale"""
+    args = parse_args()
+    client = None
+    try:
+        if args.resume:
+            # Même export, mêmes collections et même taille de lot : les clés du journal restent valides
+            checkpoint = SeedCheckpoint.load(args.checkpoint)
+            params = checkpoint.header["params"]
+            args.export, args.collections, args.batch_size = params["export"], params["collections"], params["batch_size"]
+            args.sync = params.get("sync", False)
+            print(f"♻️  Reprise de la migration ({len(checkpoint.done)} lots déjà importés)")
+        export_path = args.export or latest_export(EXPORT_DIR)
+        metadata = load_export(export_path, args.sync)
+        print(f"📁 Utilisation de l'export: {export_path}")
+        print(f"📅 Export original: {metadata['exportDate']}")
+        print(f"📊 Documents à importer: {sum(metadata['collections'].get(name, 0) for name in args.collections)}")
+        if metadata.get("mode") == "incremental":
+            deleted = sum(entry['documents'] for name, entry in metadata['deleted'].items() if name in args.collections)
+            print(f"🗑️  Suppressions: {deleted}")
+
+        client = MongoClient(args.uri)
+        db = client.get_default_database(DB_NAME)
+        print(f"✅ Connexion réussie à {db.name}")
+        if not args.yes:
+            action = (
+                "modifier les collections existantes" if args.sync
+                else "remplacer les collections existantes (après vérification)"
+            )
+            answer = input(f"⚠️  Cette opération va {action}. Continuer ? (y/N): ")
+            if answer.lower() not in ('y', 'yes'):
+                print("❌ Import annulé par l'utilisateur")
+                return
+        if not args.resume:
+            if not args.sync:
+                for name in args.collections:
+                    staging_collection(db, name).drop()
+            SeedCheckpoint.create(args.checkpoint, None, {
+                "export": export_path, "collections": args.collections, "batch_size": args.batch_size, "sync": args.sync
+            })
+
+        report = (sync if args.sync else migrate)(db, args, export_path, metadata, args.collections)
+        report_path = os.path.join(export_path, 'import-report.json')
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+        print("\n📊 Résumé de l'import:")
+        for name, count in report["collections"].items():
+            print(f"  - {name}: {count} documents")
+        print(f"⏱️  Durée: {report['elapsedSeconds']:.1f}s")
+        print(f"📄 Rapport d'import: {report_path}")
+        if args.sync:
+            print(f"✅ Synchronisation terminée : {report['writes']} écriture(s) sur MongoDB Atlas")
+            return
+        if not report["verified"]:
+            print("❌ Vérification échouée : collections live inchangées, collections de chargement conservées")
+            sys.exit(1)
+        print("✅ Import vérifié, collections remplacées : vos données sont disponibles sur MongoDB Atlas")
+    except Exception as e:
+        print(f"❌ Erreur lors de l'import: {e} (relancer avec --resume)")
+        sys.exit(1)
+    finally:
+        if client is not None:
+            client.close()
+            print("🔌 Connexion fermée")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Orchestration du seed synthétique : démarrage ou reprise, génération par lots, multi-processus
+"""
+
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
+from pymongo import MongoClient, ASCENDING
+
+from .config import MONGODB_URI, DB_NAME, COLLECTIONS, GENERATION_PARAMS
+from .async_pipeline import write_staging_concurrently
+from .checkpoint import SeedCheckpoint, write_manifest
+from .generators import GENERATORS, SeedContext, reference_resolvers
+from .hashing import PasswordHashCache
+from .metrics import SeedMetrics
+from .run import SyntheticRun
+from .storage import (
+    MODEL_INDEXES, staging_collection, pending_batches, write_batches, reset_staging_collections,
+    swap_synthetic_collections, recompute_user_stats, client_options, load_write_concern, wait_for_unacknowledged
+)
+
+def split_range(total, parts, unit=1):
+    """Découper [0, total) en `parts` plages contiguës et disjointes, alignées sur `unit`"""
+    units = (total + unit - 1) // unit
+    size, remainder = divmod(units, parts)
+    ranges, start = [], 0
+    for part in range(parts):
+        stop = min(total, start + (size + (1 if part < remainder else 0)) * unit)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def start_run(db, args):
+    """Démarrer un seed synthétique ou reprendre celui décrit par le journal
+
+    Retourne le SyntheticRun. En reprise, les volumes, la taille de lot et la graine
+    sont relus depuis le journal : les _id et slugs regénérés sont identiques.
+    """
+    if args.resume:
+        checkpoint = SeedCheckpoint.load(args.checkpoint)
+        if checkpoint.header.get("unacknowledged"):
+            raise RuntimeError(
+                "le seed interrompu a été écrit avec --write-concern 0 : ses lots « terminés » n'ont peut-être "
+                "jamais été appliqués, relancer le seed sans --resume"
+            )
+        for name, value in checkpoint.header["params"].items():
+            setattr(args, name, value)
+        print(f"♻️  Reprise du seed ({len(checkpoint.done)} lots déjà terminés)")
+        if any(name == "posts" for name, _ in checkpoint.started):
+            # Les lots à rejouer sont des upserts par slug : éviter un scan complet par document
+            slug_index = [index for index in MODEL_INDEXES["posts"] if index.document["key"] == {"slug": ASCENDING}]
+            staging_collection(db, "posts").create_indexes(slug_index)
+        return SyntheticRun.from_header(checkpoint.header)
+
+    run = SyntheticRun.create(args)
+    reset_staging_collections(db, args)
+    params = {name: getattr(args, name) for name in GENERATION_PARAMS}
+    SeedCheckpoint.create(args.checkpoint, run, params, unacknowledged=args.write_concern == "0")
+    return run
+
+def finish_run(db, args, metrics=None):
+    """Fin de seed : recalculer les compteurs, remplacer les collections live et écrire le manifeste
+
+    En reprise après un remplacement interrompu, seules les collections de
+    chargement restantes sont renommées : les compteurs ont été recalculés avant
+    le premier renommage.
+    """
+    metrics = metrics or SeedMetrics()
+    existing = set(db.list_collection_names())
+    generated = [name for name in COLLECTIONS if getattr(args, name)]
+    staged = [name for name in generated if staging_collection(db, name).name in existing]
+    if not staged:
+        print("ℹ️  Collections de chargement déjà remplacées")
+    else:
+        if len(staged) == len(generated):
+            if args.write_concern == "0":
+                wait_for_unacknowledged(db, args)
+            started = time.perf_counter()
+            recompute_user_stats(db, args)
+            metrics.record_phase("userStats", time.perf_counter() - started)
+        else:
+            print(f"♻️  Remplacement interrompu : reste {', '.join(staged)}")
+        started = time.perf_counter()
+        swap_synthetic_collections(db, args)
+        metrics.record_phase("indexesAndSwap", time.perf_counter() - started)
+    manifest = write_manifest(args.manifest, SeedCheckpoint.load(args.checkpoint))
+    print(f"🧾 Manifeste {args.manifest} (empreinte {manifest['digest'][:16]}…)")
+
+def seed_ranges(db, pool, args, run, ranges, cache=None, progress=True, metrics=None):
+    """Générer et écrire, pour chaque collection, les lots restants de la plage [start, stop)"""
+    context = SeedContext(run, args, pool, cache, reference_resolvers(db, args, run), metrics)
+    checkpoint = SeedCheckpoint.load(args.checkpoint)
+    write_concern = load_write_concern(args)
+    summary = {}
+
+    for name, (icon, label, generate) in GENERATORS.items():
+        batches = pending_batches(name, *ranges[name], args.batch_size, checkpoint)
+        if not batches:
+            continue
+        if progress:
+            print(f"{icon} Génération de {sum(stop - start for start, stop in batches)} {label}...")
+        if args.insert_workers > 1:
+            summary[name] = write_staging_concurrently(
+                db, name, batches, generate(batches, context), args, checkpoint, progress, context.metrics
+            )
+        else:
+            summary[name] = write_batches(
+                staging_collection(db, name, write_concern), name, batches, generate(batches, context), checkpoint,
+                progress, context.metrics
+            )
+
+    return summary
+
+def seed_synthetic(db, pool, args, cache=None, metrics=None):
+    """Mode synthétique : générer et insérer un grand volume de documents en flux"""
+    run = start_run(db, args)
+    ranges = {name: (0, getattr(args, name)) for name in COLLECTIONS}
+    summary = seed_ranges(db, pool, args, run, ranges, cache, metrics=metrics)
+    finish_run(db, args, metrics)
+    return summary
+
+def seed_worker(worker_index, args, run, ranges, cache_snapshot):
+    """Worker du seed multi-processus : client, pool de connexions et pool de hachage propres"""
+    client = MongoClient(MONGODB_URI, **client_options(args))
+    pool = Pool(max(1, args.hash_workers // args.workers))
+    cache = None
+    if not args.no_hash_cache:
+        cache = PasswordHashCache(
+            args.hash_cache, args.hash_cache_size, partition=(worker_index, args.workers), snapshot_id=cache_snapshot
+        )
+    try:
+        started = time.perf_counter()
+        metrics = SeedMetrics()
+        summary = seed_ranges(client[DB_NAME], pool, args, run, ranges, cache, progress=False, metrics=metrics)
+        return {
+            "worker": worker_index, "documents": summary, "elapsed": time.perf_counter() - started,
+            "metrics": metrics.to_dict()
+        }
+    finally:
+        pool.terminate()
+        if cache is not None:
+            cache.close(evict=False)
+        client.close()
+
+def seed_sharded(db, args, cache=None, metrics=None):
+    """Coordinateur : répartir les lots d'index entre `args.workers` processus"""
+    run = start_run(db, args)
+    shards = {
+        name: split_range(getattr(args, name), args.workers, args.batch_size)
+        for name in COLLECTIONS
+    }
+    cache_snapshot = cache.snapshot_id if cache is not None else None
+
+    print(f"🚀 Seed réparti sur {args.workers} processus...")
+    # spawn : aucun processus n'hérite du MongoClient du coordinateur
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(args.workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                seed_worker, worker, args, run,
+                {name: shards[name][worker] for name in shards}, cache_snapshot
+            )
+            for worker in range(args.workers)
+        ]
+        reports = [future.result() for future in futures]
+
+    summary = {}
+    for report in reports:
+        docs = sum(report["documents"].values())
+        rate = docs / report["elapsed"] if report["elapsed"] else 0
+        print(f"   ⚙️  Worker {report['worker']}: {docs} documents en {report['elapsed']:.1f}s ({rate:,.0f} docs/s)")
+        for name, count in report["documents"].items():
+            summary[name] = summary.get(name, 0) + count
+        if metrics is not None:
+            metrics.merge(report["metrics"])
+    finish_run(db, args, metrics)
+    return summary
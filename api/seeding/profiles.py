@@ -0,0 +1,45 @@
+"""
+Profils de volume du seed synthétique (--profile)
+"""
+
+import os
+
+# Volumes, coût bcrypt, nombre de processus et de lots en vol par processus.
+# Les options explicites (--users, --bcrypt-rounds, --workers, ...) priment sur le profil.
+# Au-delà de « small », le coût bcrypt est abaissé : à 12, hacher 100k mots de passe
+# prend près d'une heure de CPU, alors que bcrypt.compare lit le coût dans le haché
+# et accepte donc les identifiants de test quel que soit le coût utilisé.
+SIZE_PROFILES = {
+    "small": {
+        "users": 1_000, "posts": 10_000, "comments": 20_000, "bcrypt_rounds": 12, "workers": 1, "insert_workers": 1
+    },
+    "medium": {
+        "users": 10_000, "posts": 200_000, "comments": 500_000, "bcrypt_rounds": 10, "workers": 4, "insert_workers": 2
+    },
+    "large": {
+        "users": 50_000, "posts": 2_000_000, "comments": 5_000_000, "bcrypt_rounds": 8, "workers": None,
+        "insert_workers": 4
+    },
+    "xl": {
+        "users": 100_000, "posts": 10_000_000, "comments": 30_000_000, "bcrypt_rounds": 8, "workers": None,
+        "insert_workers": 4
+    }
+}
+
+def apply_profile(args, defaults):
+    """Compléter les options laissées à None avec le profil choisi, puis avec `defaults`
+
+    `workers: None` dans un profil signifie un processus par cœur.
+    """
+    profile = SIZE_PROFILES.get(args.profile, {})
+    for name, default in defaults.items():
+        if getattr(args, name) is not None:
+            continue
+        if name in profile:
+            value = profile[name]
+            if name == "workers" and value is None:
+                value = os.cpu_count() or 1
+        else:
+            value = default
+        setattr(args, name, value)
+    return args
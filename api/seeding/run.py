@@ -0,0 +1,119 @@
+"""
+Paramètres d'un seed synthétique : _id déterministes, générateurs aléatoires et dates de création
+"""
+
+import time
+import random
+import hashlib
+from math import log, log1p
+from datetime import datetime, timezone, timedelta
+from bson import ObjectId
+
+from .config import (
+    REFERENCE_TIME, DEFAULT_TIME_PROFILE, DEFAULT_TIME_SPAN_YEARS, GROWTH_FACTOR, HOURLY_WEIGHTS,
+    BURST_DAYS_PERCENT, BURST_FACTOR
+)
+
+def synthetic_id(run_prefix, kind, index):
+    """Construire un ObjectId déterministe (horodatage du run + type + index)"""
+    return ObjectId(
+        run_prefix.to_bytes(4, 'big') + kind.to_bytes(1, 'big') + index.to_bytes(7, 'big')
+    )
+
+def uniform_profile(rng, start, span):
+    """Dates uniformément réparties sur la période"""
+    return start + span * rng.random()
+
+def growth_profile(rng, start, span):
+    """Activité en croissance exponentielle : GROWTH_FACTOR fois plus de documents à la fin qu'au début"""
+    k = log(GROWTH_FACTOR)
+    return start + span * (log1p(rng.random() * (GROWTH_FACTOR - 1)) / k)
+
+def daily_profile(rng, start, span):
+    """Cycles quotidiens (HOURLY_WEIGHTS, en UTC) avec quelques jours de pic d'activité"""
+    first_day = (start + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    days = max(1, span.days - 1)
+    while True:
+        day = rng.randrange(days)
+        burst = (day * 2654435761) % 100 < BURST_DAYS_PERCENT
+        if burst or rng.random() < 1 / BURST_FACTOR:
+            break
+    hour = rng.choices(range(24), weights=HOURLY_WEIGHTS)[0]
+    return first_day + timedelta(days=day, hours=hour, seconds=rng.random() * 3600)
+
+time_profiles = {"uniform": uniform_profile, "daily": daily_profile, "growth": growth_profile}
+
+class SyntheticRun:
+    """Paramètres partagés par tous les workers d'un seed synthétique
+
+    Chaque document tire ses valeurs aléatoires d'un générateur dérivé de
+    (graine, type, index) : un worker ou une reprise regénère exactement le même
+    document. Sans graine, le préfixe du run en tient lieu. Avec une graine
+    (`--seed`), les dates partent en plus de REFERENCE_TIME : le jeu de données est
+    identique octet pour octet d'une exécution à l'autre.
+    """
+
+    def __init__(self, run_prefix, seed=None, reference_time=None,
+                 time_profile=DEFAULT_TIME_PROFILE, time_span_years=DEFAULT_TIME_SPAN_YEARS):
+        self.run_prefix = run_prefix
+        self.seed = seed
+        self.reference_time = reference_time or datetime.now(timezone.utc)
+        self.time_profile = time_profile
+        self.time_span_years = time_span_years
+
+    @classmethod
+    def create(cls, args):
+        profile = (args.time_profile, args.time_span_years)
+        if args.seed is None:
+            return cls(int(time.time()), None, None, *profile)
+        return cls(int(REFERENCE_TIME.timestamp()), args.seed, REFERENCE_TIME, *profile)
+
+    @classmethod
+    def from_header(cls, header):
+        return cls(
+            header["runPrefix"], header.get("seed"), datetime.fromisoformat(header["referenceTime"]),
+            header.get("timeProfile", DEFAULT_TIME_PROFILE), header.get("timeSpanYears", DEFAULT_TIME_SPAN_YEARS)
+        )
+
+    def header(self):
+        return {
+            "runPrefix": self.run_prefix,
+            "seed": self.seed,
+            "referenceTime": self.reference_time.isoformat(),
+            "timeProfile": self.time_profile,
+            "timeSpanYears": self.time_span_years
+        }
+
+    def id(self, kind, index):
+        return synthetic_id(self.run_prefix, kind, index)
+
+    def rng(self, kind, index, stream=None):
+        """Générateur aléatoire propre au document (kind, index)
+
+        Un `stream` nommé donne un générateur indépendant pour le même document : ajouter
+        des tirages (le contenu synthétisé par exemple) ne décale pas les autres valeurs.
+        """
+        key = self.seed if self.seed is not None else f"run{self.run_prefix}"
+        return random.Random(f"{key}:{kind}:{index}" + (f":{stream}" if stream else ""))
+
+    def salt(self, index):
+        """16 octets de sel bcrypt déterministes pour l'utilisateur `index` (None sans graine)"""
+        if self.seed is None:
+            return None
+        return hashlib.sha256(f"{self.seed}:salt:{index}".encode('utf-8')).digest()[:16]
+
+    def created_at(self, kind, index):
+        """Date de création du document (kind, index) selon le profil temporel du run
+
+        Tirée d'un générateur dédié : elle peut être recalculée à partir de l'index
+        seul (par exemple la date d'un article depuis ses commentaires).
+        """
+        key = self.seed if self.seed is not None else f"run{self.run_prefix}"
+        rng = random.Random(f"{key}:{kind}:{index}:time")
+        span = timedelta(days=365.25 * self.time_span_years)
+        return self.clamp(time_profiles[self.time_profile](rng, self.reference_time - span, span))
+
+    def clamp(self, moment):
+        """Borner une date à la date de référence et la tronquer à la milliseconde (précision BSON)"""
+        moment = min(moment, self.reference_time)
+        return moment.replace(microsecond=moment.microsecond // 1000 * 1000)
@@ -0,0 +1,70 @@
+"""
+Jeu de données d'exemple : les utilisateurs et articles du corpus, sans génération synthétique
+"""
+
+from datetime import datetime, timezone
+
+from .config import BCRYPT_ROUNDS
+from .corpus import sample_users, sample_posts_data
+from .generators import build_user
+from .hashing import hash_passwords_async
+from .storage import staging_collection, swap_staging
+
+def create_users(db, pool, rounds=BCRYPT_ROUNDS, cache=None):
+    """Créer les utilisateurs de test"""
+    try:
+        print("👥 Création des utilisateurs de test...")
+        
+        # Repartir d'une collection de chargement vide (la collection live reste intacte)
+        staging = staging_collection(db, "users")
+        staging.drop()
+        
+        # Hasher les mots de passe en parallèle
+        hashed_passwords = hash_passwords_async(pool, [u["password"] for u in sample_users], rounds, cache).get()
+        
+        # Créer les utilisateurs avec les champs requis par le modèle
+        created_users = [
+            build_user(user_data, hashed_password)
+            for user_data, hashed_password in zip(sample_users, hashed_passwords)
+        ]
+        staging.insert_many(created_users)
+        swap_staging(db, "users")
+        for user in created_users:
+            print(f"✅ Utilisateur créé: {user['username']} ({user['profile']['firstName']} {user['profile']['lastName']})")
+        
+        return created_users
+    except Exception as e:
+        print(f"❌ Erreur lors de la création des utilisateurs: {e}")
+        raise
+
+def create_posts(db, users):
+    """Créer les posts de test"""
+    try:
+        print("📝 Création des posts de test...")
+        
+        # Repartir d'une collection de chargement vide (la collection live reste intacte)
+        staging = staging_collection(db, "posts")
+        staging.drop()
+        
+        # Créer les posts avec les ObjectIds des utilisateurs
+        posts_with_authors = []
+        for i, post_data in enumerate(sample_posts_data):
+            post = {
+                **post_data,
+                "author": users[i % len(users)]["_id"],  # Répartir les posts entre les utilisateurs
+                "likes": [],
+                "likesCount": 0,
+                "createdAt": datetime.now(timezone.utc),
+                "updatedAt": datetime.now(timezone.utc)
+            }
+            posts_with_authors.append(post)
+        
+        # Insérer les posts
+        result = staging.insert_many(posts_with_authors)
+        swap_staging(db, "posts")
+        print(f"✅ {len(result.inserted_ids)} articles insérés avec succès")
+        
+        return result.inserted_ids
+    except Exception as e:
+        print(f"❌ Erreur lors de la création des posts: {e}")
+        raise
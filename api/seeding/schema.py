@@ -0,0 +1,85 @@
+"""
+Contrôle des documents générés contre les contraintes des schémas Mongoose (src/models)
+"""
+
+from bson import ObjectId
+
+USER_ROLES = ('user', 'moderator', 'publisher', 'admin')
+THEMES = ('light', 'dark', 'auto')
+POST_STATUSES = ('draft', 'published')
+REPORT_REASONS = ('spam', 'inappropriate', 'harassment', 'offensive', 'other')
+REPORT_STATUSES = ('pending', 'resolved', 'dismissed')
+MODERATION_ACTIONS = ('approved', 'rejected', 'edited', 'deleted', 'reported')
+
+def text(min_length=1, max_length=None):
+    """Chaîne non vide de longueur bornée"""
+    return lambda value: isinstance(value, str) and min_length <= len(value) <= (max_length or len(value))
+
+def one_of(*values):
+    return lambda value: value in values
+
+def object_id(value):
+    return isinstance(value, ObjectId)
+
+def optional(check):
+    return lambda value: value is None or check(value)
+
+# Chemin (séparé par des points) -> contrainte, pour chaque collection
+SCHEMAS = {
+    "users": {
+        "username": text(3, 30),
+        "email": lambda value: text(3)(value) and "@" in value and value == value.lower(),
+        "password": text(6),
+        "role": one_of(*USER_ROLES),
+        "profile.bio": optional(text(0, 500)),
+        "preferences.theme": one_of(*THEMES)
+    },
+    "posts": {
+        "title": text(1, 200),
+        "content": text(),
+        "excerpt": text(1, 300),
+        "slug": lambda value: text()(value) and value == value.strip().lower(),
+        "author": object_id,
+        "status": one_of(*POST_STATUSES),
+        "readTime": optional(lambda value: isinstance(value, int) and value >= 1),
+        "likesCount": lambda value: isinstance(value, int) and value >= 0
+    },
+    "comments": {
+        "content": text(1, 1000),
+        "author": object_id,
+        "post": object_id,
+        "parentComment": optional(object_id),
+        "rejectionReason": optional(text(0, 200)),
+        "reports.reason": one_of(*REPORT_REASONS),
+        "reports.status": one_of(*REPORT_STATUSES),
+        "reports.description": optional(text(0, 500)),
+        "moderationHistory.action": one_of(*MODERATION_ACTIONS)
+    }
+}
+
+def values_at(document, path):
+    """Valeurs d'un chemin pointé, en parcourant les tableaux comme MongoDB"""
+    values = [document]
+    for key in path.split('.'):
+        found = []
+        for value in values:
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, dict) and key in item:
+                    found.append(item[key])
+        values = found
+    return values
+
+def validate_document(name, document):
+    """Lever ValueError si le document viole une contrainte du schéma de la collection `name`
+
+    Un chemin absent est ignoré pour les champs des sous-documents (tableaux vides)
+    et refusé pour les champs de premier niveau, requis par les modèles.
+    """
+    errors = []
+    for path, check in SCHEMAS.get(name, {}).items():
+        values = values_at(document, path)
+        if not values and '.' not in path and check(None) is False:
+            errors.append(f"{path} manquant")
+        errors += [f"{path}={value!r:.80}" for value in values if not check(value)]
+    if errors:
+        raise ValueError(f"Document {name} invalide ({document.get('_id')}): {', '.join(errors)}")
@@ -0,0 +1,79 @@
+"""
+Attribution de slugs uniques pour la génération et l'import en masse d'articles
+
+Post.slug porte un index unique : un doublon fait échouer l'écriture du lot entier.
+Les imports (migrate.py) ne préchargent pas les slugs de la cible : ils réattribuent
+seulement ceux refusés par l'index unique (slug_conflicts) avec un SlugAllocator,
+qui rend le premier `slug-N` libre connu. Un suffixe pris entre-temps par un autre
+processus est refusé à son tour et réattribué. Le générateur d'articles dérive ses
+slugs des bases rendues uniques par series_slugs.
+"""
+
+import re
+import unicodedata
+
+# Longueur maximale d'un slug produit par slugify (hors suffixe)
+SLUG_MAX_LENGTH = 80
+
+def slugify(text):
+    """Slug d'un titre : minuscules, sans accents, mots séparés par des tirets"""
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+    slug = re.sub(r'[^a-z0-9]+', '-', text).strip('-')
+    return slug[:SLUG_MAX_LENGTH].rstrip('-') or 'article'
+
+class SlugAllocator:
+    """Distributeur de slugs : les slugs connus comme pris sont suffixés par -2, -3…"""
+
+    def __init__(self, existing=()):
+        self.taken = set(existing)
+        # slug de base -> prochain suffixe à essayer (seulement pour les bases déjà prises)
+        self.next_suffix = {}
+
+    def allocate(self, slug):
+        """Réserver et renvoyer `slug` s'il est libre, sinon le premier `slug-N` libre"""
+        if slug not in self.taken:
+            self.taken.add(slug)
+            return slug
+        suffix = self.next_suffix.get(slug, 2)
+        candidate = f"{slug}-{suffix}"
+        while candidate in self.taken:
+            suffix += 1
+            candidate = f"{slug}-{suffix}"
+        self.next_suffix[slug] = suffix + 1
+        self.taken.add(candidate)
+        return candidate
+
+def numbered_base(slug):
+    """Base d'un slug numéroté `base-N`, None si le slug ne se termine pas par un nombre"""
+    base, _, number = slug.rpartition('-')
+    return base if base and number.isdigit() else None
+
+def series_slugs(slugs):
+    """Bases uniques des séries `base`, `base-1`, `base-2`… numérotées par le générateur d'articles
+
+    Deux séries se chevauchent si une base est en double, ou si elle a la forme
+    `autre-N` d'une autre base. Ces bases deviennent `base-2e`, `base-3e`… : un
+    suffixe qui ne se termine pas par un nombre ne peut pas prolonger une série.
+    """
+    bases, numbered, result = set(), set(), []
+    for slug in slugs:
+        candidate, edition = slug, 1
+        while candidate in bases or candidate in numbered or numbered_base(candidate) in bases:
+            edition += 1
+            candidate = f"{slug}-{edition}e"
+        bases.add(candidate)
+        if numbered_base(candidate) is not None:
+            numbered.add(numbered_base(candidate))
+        result.append(candidate)
+    return result
+
+def slug_conflicts(error):
+    """Positions des écritures d'un BulkWriteError refusées seulement pour un slug déjà pris, None sinon"""
+    errors = error.details.get("writeErrors", [])
+    conflicts = [
+        entry["index"] for entry in errors
+        if entry.get("code") == 11000 and ("slug" in entry.get("keyPattern", {}) or "slug_1" in entry.get("errmsg", ""))
+    ]
+    if not conflicts or len(conflicts) < len(errors) or error.details.get("writeConcernErrors"):
+        return None
+    return conflicts
@@ -0,0 +1,249 @@
+"""
+Écriture en base : collections de chargement, index des modèles, lots et compteurs des utilisateurs
+"""
+
+import sys
+import time
+import hashlib
+from itertools import islice
+from pymongo import MongoClient, ReplaceOne, IndexModel, WriteConcern, ASCENDING, DESCENDING
+from bson import encode as bson_encode
+
+from .config import MONGODB_URI, DB_NAME, COLLECTIONS, STAGING_SUFFIX, UPSERT_KEYS
+from .schema import validate_document
+
+# Index déclarés dans les schémas Mongoose (src/models), construits une seule fois après le chargement
+MODEL_INDEXES = {
+    "users": [
+        IndexModel([("username", ASCENDING)], unique=True),
+        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("role", ASCENDING), ("isActive", ASCENDING)]),
+        IndexModel([("banInfo.isBanned", ASCENDING), ("banInfo.bannedUntil", ASCENDING)]),
+        IndexModel([("updatedAt", ASCENDING), ("_id", ASCENDING)])
+    ],
+    "posts": [
+        IndexModel([("slug", ASCENDING)], unique=True),
+        IndexModel([("status", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("tags", ASCENDING)]),
+        IndexModel([("likesCount", DESCENDING)]),
+        IndexModel([("updatedAt", ASCENDING), ("_id", ASCENDING)])
+    ],
+    "comments": [
+        IndexModel([("post", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("author", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("parentComment", ASCENDING)]),
+        IndexModel([("isApproved", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("reports.status", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("updatedAt", ASCENDING), ("_id", ASCENDING)])
+    ]
+}
+
+def client_options(args=None):
+    """Options du MongoClient choisies en ligne de commande : taille du pool, compression réseau"""
+    options = {}
+    if getattr(args, "max_pool_size", None):
+        options["maxPoolSize"] = args.max_pool_size
+    if getattr(args, "compressors", None):
+        options["compressors"] = args.compressors
+    return options
+
+def load_write_concern(args=None):
+    """WriteConcern des écritures de chargement (--write-concern, --journal), None pour celui du serveur
+
+    Il ne s'applique qu'aux insertions dans les collections de chargement : les
+    agrégations, index et renommages gardent le write concern par défaut.
+    """
+    w, journal = getattr(args, "write_concern", None), getattr(args, "journal", None)
+    if w is None and journal is None:
+        return None
+    options = {} if journal is None else {"j": journal}
+    if w is not None:
+        options["w"] = int(w) if w.isdigit() else w
+    return WriteConcern(**options)
+
+def connect_db(args=None):
+    """Se connecter à MongoDB"""
+    try:
+        client = MongoClient(MONGODB_URI, **client_options(args))
+        db = client[DB_NAME]
+        print("✅ MongoDB connecté avec succès")
+        return client, db
+    except Exception as e:
+        print(f"❌ Erreur de connexion MongoDB: {e}")
+        sys.exit(1)
+
+def staging_collection(db, name, write_concern=None):
+    """Collection de chargement associée à une collection live"""
+    return db.get_collection(name + STAGING_SUFFIX, write_concern=write_concern)
+
+def wait_for_unacknowledged(db, args, timeout=120):
+    """Avec --write-concern 0, attendre que les collections de chargement aient tous leurs documents
+
+    Les écritures non acquittées peuvent encore être en cours côté serveur quand le
+    dernier lot est envoyé : les compteurs et le renommage doivent attendre. Si des
+    documents manquent encore après `timeout` secondes, RuntimeError : les collections
+    live ne sont pas remplacées et aucun manifeste n'est écrit.
+    """
+    deadline = time.monotonic() + timeout
+    missing = []
+    for name in COLLECTIONS:
+        expected = getattr(args, name)
+        if not expected:
+            continue
+        count = staging_collection(db, name).count_documents({})
+        while count < expected and time.monotonic() < deadline:
+            time.sleep(0.5)
+            count = staging_collection(db, name).count_documents({})
+        if count < expected:
+            missing.append(f"{name} {count}/{expected}")
+    if missing:
+        raise RuntimeError(
+            f"documents manquants après --write-concern 0 ({', '.join(missing)}) : écritures non acquittées perdues, "
+            "collections live conservées"
+        )
+
+def swap_staging(db, name):
+    """Construire les index du modèle sur la collection de chargement puis la renommer sur la live
+
+    renameCollection avec dropTarget remplace la collection live de façon atomique :
+    l'API ne lit jamais une collection à moitié remplie.
+    """
+    staging = staging_collection(db, name)
+    if staging.name not in db.list_collection_names():
+        return False
+    print(f"🔧 Construction des index de {name}...")
+    staging.create_indexes(MODEL_INDEXES[name])
+    staging.rename(name, dropTarget=True)
+    print(f"🔁 Collection {name} remplacée")
+    return True
+
+def pending_batches(collection, start, stop, batch_size, checkpoint=None):
+    """Lots [début, fin) de la plage [start, stop) restant à écrire"""
+    batches = []
+    for batch_start in range(start, stop, batch_size):
+        if checkpoint is None or not checkpoint.is_done(collection, batch_start):
+            batches.append((batch_start, min(batch_start + batch_size, stop)))
+    return batches
+
+def documents_digest(documents):
+    """Empreinte d'un ensemble de documents et taille totale de leur encodage BSON
+
+    L'empreinte est la somme (mod 2^256) des SHA-256 de l'encodage BSON de chaque
+    document : elle ne dépend ni de l'ordre ni du découpage en lots, et les empreintes
+    des lots écrits par des workers différents s'additionnent pour donner celle de la
+    collection. La taille est celle envoyée au serveur (hors enveloppe des commandes).
+    """
+    return encoded_digest(bson_encode(doc) for doc in documents)
+
+def encoded_digest(encoded_documents):
+    """documents_digest pour des documents déjà encodés en BSON"""
+    total = size = 0
+    for encoded in encoded_documents:
+        size += len(encoded)
+        total += int.from_bytes(hashlib.sha256(encoded).digest(), 'big')
+    return f"{total % (1 << 256):064x}", size
+
+def write_batches(collection, name, batches, documents, checkpoint=None, progress=True, metrics=None):
+    """Écrire un flux de documents lot par lot (insert_many non ordonné, ou upsert à la reprise)
+
+    Le premier document de chaque lot est contrôlé contre le schéma Mongoose de la
+    collection : un générateur invalide arrête le seed avant d'écrire son lot.
+    Avec `metrics`, la durée de chaque étape du lot est enregistrée (voir SeedMetrics).
+    """
+    written = 0
+    key = UPSERT_KEYS[name]
+    started = time.perf_counter()
+    for start, stop in batches:
+        produce_started = time.perf_counter()
+        batch = list(islice(documents, stop - start))
+        checksum_started = time.perf_counter()
+        if batch:
+            validate_document(name, batch[0])
+        digest, size = documents_digest(batch)
+        insert_started = time.perf_counter()
+        if checkpoint is not None and checkpoint.needs_upsert(name, start):
+            collection.bulk_write([ReplaceOne({key: doc[key]}, doc, upsert=True) for doc in batch], ordered=False)
+        else:
+            if checkpoint is not None:
+                checkpoint.mark("started", name, start, stop)
+            collection.insert_many(batch, ordered=False)
+        if checkpoint is not None:
+            checkpoint.mark("done", name, start, stop, digest)
+        finished = time.perf_counter()
+        if metrics is not None:
+            metrics.record_batch(
+                name, len(batch), size, checksum_started - produce_started,
+                insert_started - checksum_started, finished - insert_started
+            )
+        written += len(batch)
+        if progress:
+            rate = written / (finished - started)
+            print(f"   … {written} documents écrits dans {name} ({rate:,.0f} docs/s)", end='\r')
+    if progress and batches:
+        print()
+    return written
+
+def existing_ids(collection):
+    """Charger les _id existants d'une collection (utilisé quand elle n'est pas regénérée)"""
+    ids = [doc["_id"] for doc in collection.find({}, {"_id": 1}).sort("_id", ASCENDING)]
+    if not ids:
+        raise RuntimeError(f"La collection {collection.name} est vide : impossible d'y rattacher des documents")
+    return ids
+
+def reset_staging_collections(db, args):
+    """Repartir de collections de chargement vides pour les collections qui vont être regénérées"""
+    for name in COLLECTIONS:
+        if getattr(args, name):
+            staging_collection(db, name).drop()
+
+def swap_synthetic_collections(db, args):
+    """Fin de seed : remplacer les collections live par les collections de chargement"""
+    for name in COLLECTIONS:
+        if getattr(args, name):
+            swap_staging(db, name)
+
+def recompute_user_stats(db, args):
+    """Recalculer côté serveur les compteurs `stats` des utilisateurs à partir des articles et commentaires
+
+    Mêmes règles que postController/commentController : likesGiven compte les likes
+    donnés aux articles et aux commentaires, likesReceived ceux reçus par l'auteur.
+    Chaque compteur est calculé par une agrégation ($unionWith, $group) écrite en
+    bloc dans la collection des utilisateurs avec $merge (MongoDB 4.4+).
+    """
+    pick = lambda name: staging_collection(db, name) if getattr(args, name) else db[name]
+    users, posts, comments = pick("users"), pick("posts"), pick("comments")
+    if not args.users:
+        users.update_many({}, {"$set": {
+            "stats.postsCount": 0, "stats.commentsCount": 0, "stats.likesGiven": 0, "stats.likesReceived": 0
+        }})
+
+    print("🔢 Recalcul des compteurs des utilisateurs...")
+    counters = {
+        "stats.likesGiven": (
+            [{"$unwind": "$likes"}, {"$group": {"_id": "$likes", "n": {"$sum": 1}}}],
+            [{"$unwind": "$likes"}, {"$group": {"_id": "$likes", "n": {"$sum": 1}}}]
+        ),
+        "stats.likesReceived": (
+            [{"$group": {"_id": "$author", "n": {"$sum": "$likesCount"}}}],
+            [{"$group": {"_id": "$author", "n": {"$sum": {"$size": "$likes"}}}}]
+        ),
+        "stats.postsCount": ([{"$group": {"_id": "$author", "n": {"$sum": 1}}}], None),
+        "stats.commentsCount": (None, [{"$group": {"_id": "$author", "n": {"$sum": 1}}}])
+    }
+    for field, (from_posts, from_comments) in counters.items():
+        if from_posts is None:
+            source, pipeline = comments, list(from_comments)
+        else:
+            source, pipeline = posts, list(from_posts)
+            if from_comments is not None:
+                pipeline.append({"$unionWith": {"coll": comments.name, "pipeline": from_comments}})
+        pipeline += [
+            {"$group": {"_id": "$_id", "n": {"$sum": "$n"}}},
+            {"$merge": {
+                "into": users.name,
+                "on": "_id",
+                "whenMatched": [{"$set": {field: "$$new.n"}}],
+                "whenNotMatched": "discard"
+            }}
+        ]
+        source.aggregate(pipeline, allowDiskUse=True)
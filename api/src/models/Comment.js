@@ -113,6 +113,9 @@ commentSchema.index({ author: 1, createdAt: -1 });
 commentSchema.index({ isApproved: 1, createdAt: -1 });
 commentSchema.index({ 'reports.status': 1, createdAt: -1 });
 
+// Index pour l'export incrémental (documents modifiés depuis le dernier export)
+commentSchema.index({ updatedAt: 1, _id: 1 });
+
 // Méthode virtuelle pour compter les likes
 commentSchema.virtual('likesCount').get(function() {
   return this.likes.length;
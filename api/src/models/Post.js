@@ -64,6 +64,9 @@ postSchema.index({ status: 1, createdAt: -1 });
 postSchema.index({ tags: 1 });
 postSchema.index({ likesCount: -1 });
 
+// Index pour l'export incrémental (documents modifiés depuis le dernier export)
+postSchema.index({ updatedAt: 1, _id: 1 });
+
 // Méthode pour calculer le temps de lecture
 postSchema.methods.calculateReadTime = function() {
   const wordsPerMinute = 200;
@@ -152,6 +152,9 @@ userSchema.index({ 'banInfo.isBanned': 1, 'banInfo.bannedUntil': 1 });
 userSchema.index({ email: 1 });
 userSchema.index({ username: 1 });
 
+// Index pour l'export incrémental (documents modifiés depuis le dernier export)
+userSchema.index({ updatedAt: 1, _id: 1 });
+
 // Méthodes d'instance
 userSchema.methods.hasPermission = function(permission) {
   if (this.role === ROLES.ADMIN) return true;
@@ -0,0 +1,8 @@
+"""
+Tests du paquet seeding (depuis api/ : python -m pytest tests)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
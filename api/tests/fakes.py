@@ -0,0 +1,285 @@
+"""
+Collections MongoDB en mémoire pour les tests : requêtes, tris et écritures utilisés par le paquet seeding
+"""
+
+import re
+import random
+from math import ceil
+from datetime import datetime
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+from bson import Int64, encode
+from bson.raw_bson import RawBSONDocument
+from pymongo import ReplaceOne, DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+OPERATORS = {
+    "$gt": lambda value, bound: value is not None and value > bound,
+    "$gte": lambda value, bound: value is not None and value >= bound,
+    "$lt": lambda value, bound: value is not None and value < bound,
+    "$in": lambda value, values: value in values,
+    "$ne": lambda value, other: value != other,
+    "$not": lambda value, pattern: not (isinstance(value, str) and pattern.search(value))
+}
+
+def matches(doc, query):
+    """Vrai si `doc` satisfait le filtre (égalités, expressions rationnelles, $gt/$gte/$lt/$in/$ne/$not, $or/$nor, $expr)"""
+    for key, condition in query.items():
+        if key == "$expr":
+            if evaluate(condition, doc) is not True:
+                return False
+        elif key == "$or":
+            if not any(matches(doc, branch) for branch in condition):
+                return False
+        elif key == "$nor":
+            if any(matches(doc, branch) for branch in condition):
+                return False
+        elif isinstance(condition, dict) and condition and all(op.startswith("$") for op in condition):
+            if not all(OPERATORS[op](doc.get(key), bound) for op, bound in condition.items()):
+                return False
+        elif isinstance(condition, re.Pattern):
+            if not (isinstance(doc.get(key), str) and condition.search(doc[key])):
+                return False
+        elif doc.get(key) != condition:
+            return False
+    return True
+
+def same_value(left, right):
+    """Égalité du serveur : nombres comparés par valeur quel que soit leur type, documents dans l'ordre des champs"""
+    number = (int, float, Int64)
+    if isinstance(left, number) and isinstance(right, number) and not isinstance(left, bool) and not isinstance(right, bool):
+        return left == right
+    if isinstance(left, dict) and isinstance(right, dict):
+        return list(left) == list(right) and all(same_value(left[key], right[key]) for key in left)
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(same_value(a, b) for a, b in zip(left, right))
+    return type(left) is type(right) and left == right
+
+MISSING = object()
+
+EXPRESSIONS = {
+    "$first": lambda values: values[0] if values else MISSING,
+    "$size": len,
+    "$ne": lambda left, right: not same_value(left, right),
+    "$gt": lambda left, right: left > right,
+    "$max": max,
+    "$ceil": ceil,
+    "$divide": lambda left, right: left / right,
+    "$split": lambda text, separator: text.split(separator),
+    "$ifNull": lambda value, default: default if value in (None, MISSING) else value
+}
+
+def evaluate(expression, doc):
+    """Valeur d'une expression d'agrégation ($champ, $$NOW et opérateurs de EXPRESSIONS) pour `doc`"""
+    if expression == "$$NOW":
+        return datetime.utcnow()
+    if isinstance(expression, str) and expression.startswith("$"):
+        return doc.get(expression[1:], MISSING)
+    if isinstance(expression, dict) and len(expression) == 1 and next(iter(expression)) in EXPRESSIONS:
+        operator, arguments = next(iter(expression.items()))
+        arguments = arguments if isinstance(arguments, list) else [arguments]
+        return EXPRESSIONS[operator](*(evaluate(argument, doc) for argument in arguments))
+    return expression
+
+def sort_documents(documents, order):
+    """Tri stable sur plusieurs clés ; un champ absent se classe en premier, comme null sur le serveur"""
+    for key, direction in reversed(order):
+        documents.sort(key=lambda doc: (doc.get(key) is not None, doc.get(key)), reverse=direction < 0)
+    return documents
+
+class Cursor(list):
+    def sort(self, key, direction=None):
+        order = [(key, direction)] if isinstance(key, str) else key
+        return Cursor(sort_documents(list(self), order))
+
+    def limit(self, count):
+        return Cursor(self[:count])
+
+class MemoryCollection:
+    """Collection en mémoire : documents par _id, dans l'ordre d'insertion"""
+
+    def __init__(self, name, documents=(), database=None, raw=False, unique=()):
+        self.name = name
+        self.database = database
+        self.documents = {doc["_id"]: dict(doc) for doc in documents}
+        self.raw = raw
+        # Champs d'un index unique : un doublon est refusé comme par le serveur (E11000)
+        self.unique = unique
+
+    def output(self, doc):
+        return RawBSONDocument(encode(doc)) if self.raw else dict(doc)
+
+    def find(self, query=None, projection=None, batch_size=None, sort=None):
+        found = [self.output(doc) for doc in self.documents.values() if matches(doc, query or {})]
+        return Cursor(sort_documents(found, sort) if sort else found)
+
+    def find_one(self, query=None, projection=None, sort=None):
+        return next(iter(self.find(query, projection, sort=sort)), None)
+
+    def count_documents(self, query):
+        return len(self.find(query))
+
+    def estimated_document_count(self):
+        return len(self.documents)
+
+    def with_options(self, codec_options=None, write_concern=None):
+        view = MemoryCollection(self.name, database=self.database, raw=codec_options is not None, unique=self.unique)
+        view.documents = self.documents
+        return view
+
+    def duplicate(self, doc, replace):
+        """Erreur d'écriture E11000 du document, None s'il respecte les index uniques"""
+        if not replace and doc["_id"] in self.documents:
+            return {"code": 11000, "keyPattern": {"_id": 1}, "errmsg": "E11000 duplicate key error index: _id_"}
+        for field in self.unique:
+            if any(other.get(field) == doc.get(field) for _id, other in self.documents.items() if _id != doc["_id"]):
+                return {
+                    "code": 11000, "keyPattern": {field: 1},
+                    "errmsg": f"E11000 duplicate key error collection: {self.name} index: {field}_1"
+                }
+        return None
+
+    def write(self, documents, replace):
+        errors = []
+        for index, doc in enumerate(documents):
+            error = self.duplicate(doc, replace)
+            if error:
+                errors.append({"index": index, **error})
+            else:
+                self.documents[doc["_id"]] = dict(doc)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "writeConcernErrors": []})
+
+    def insert_many(self, documents, ordered=True):
+        self.write(documents, replace=False)
+
+    def update(self, query, update):
+        """Appliquer `update` (pipeline de $set, ou $set et $currentDate) aux documents du filtre"""
+        modified = 0
+        for doc in [doc for doc in self.documents.values() if matches(doc, query)]:
+            before = dict(doc)
+            if isinstance(update, list):
+                for stage in update:
+                    doc.update({field: evaluate(expression, doc) for field, expression in stage["$set"].items()})
+            else:
+                doc.update(update.get("$set", {}))
+                doc.update({field: datetime.utcnow() for field in update.get("$currentDate", {})})
+            modified += doc != before
+        return modified
+
+    def update_many(self, query, update):
+        return SimpleNamespace(modified_count=self.update(query, update))
+
+    def bulk_write(self, requests, ordered=True):
+        deleted = 0
+        for request in requests:
+            if isinstance(request, UpdateOne):
+                self.update(request._filter, request._doc)
+            elif isinstance(request, DeleteOne):
+                for _id in [_id for _id, doc in self.documents.items() if matches(doc, request._filter)][:1]:
+                    del self.documents[_id]
+                    deleted += 1
+        self.write([request._doc for request in requests if isinstance(request, ReplaceOne)], replace=True)
+        return SimpleNamespace(deleted_count=deleted)
+
+    def aggregate(self, pipeline):
+        """Agrégation sur la collection : $sample et $project de champs"""
+        documents = [dict(doc) for doc in self.documents.values()]
+        for stage in pipeline:
+            (operator, spec), = stage.items()
+            if operator == "$sample":
+                documents = random.sample(documents, min(spec["size"], len(documents)))
+            elif operator == "$project":
+                documents = [{field: doc[field] for field in spec if field in doc} for doc in documents]
+            else:
+                raise NotImplementedError(operator)
+        return iter(documents)
+
+    def create_indexes(self, indexes):
+        return []
+
+    def rename(self, new_name, dropTarget=False):
+        del self.database.collections[self.name]
+        self.database.collections[new_name] = self
+        self.name = new_name
+
+class MemoryDatabase:
+    """Base en mémoire : une MemoryCollection par nom"""
+
+    def __init__(self, name="jgazette", collections=None):
+        self.name = name
+        self.collections = {}
+        for collection, documents in (collections or {}).items():
+            self.collections[collection] = MemoryCollection(collection, documents, self)
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = MemoryCollection(name, database=self)
+        return self.collections[name]
+
+    def get_collection(self, name, write_concern=None):
+        return self[name]
+
+    def list_collection_names(self):
+        return [name for name, collection in self.collections.items() if collection.documents]
+
+    def aggregate(self, pipeline):
+        """Agrégation sur la base : $documents, $lookup par champ, $match $expr, $project d'expressions"""
+        documents = []
+        for stage in pipeline:
+            (operator, spec), = stage.items()
+            if operator == "$documents":
+                documents = [dict(doc) for doc in spec]
+            elif operator == "$lookup":
+                source = self[spec["from"]].documents.values()
+                for doc in documents:
+                    doc[spec["as"]] = [
+                        dict(other) for other in source if same_value(other.get(spec["foreignField"]), doc[spec["localField"]])
+                    ]
+            elif operator == "$match":
+                documents = [doc for doc in documents if evaluate(spec["$expr"], doc) is True]
+            elif operator == "$project":
+                documents = [
+                    {"_id": doc["_id"], **{field: evaluate(expression, doc) for field, expression in spec.items()}}
+                    for doc in documents
+                ]
+            else:
+                raise NotImplementedError(operator)
+        return iter(documents)
+
+class MemoryClient:
+    """Client dont toutes les bases sont la même MemoryDatabase"""
+
+    def __init__(self, database):
+        self.database = database
+
+    def __getitem__(self, name):
+        return self.database
+
+    def get_default_database(self, default=None):
+        return self.database
+
+    def close(self):
+        pass
+
+class InlineExecutor:
+    """ProcessPoolExecutor exécuté dans le processus de test, initialiseur compris"""
+
+    def __init__(self, workers=None, mp_context=None, initializer=None, initargs=()):
+        if initializer is not None:
+            initializer(*initargs)
+
+    def submit(self, function, *args):
+        future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
@@ -0,0 +1,49 @@
+"""
+Pipeline asyncio (--insert-workers > 1) : génération des utilisateurs avec le cache de hachés
+"""
+
+import asyncio
+from multiprocessing import Pool
+
+from seeding.async_pipeline import write_batches_async
+from seeding.cli import parse_args
+from seeding.generators import SeedContext, generate_users
+from seeding.hashing import PasswordHashCache
+from seeding.run import SyntheticRun
+from seeding.storage import pending_batches
+
+class MemoryCollection:
+    """Collection asynchrone en mémoire : les lots insérés, dans l'ordre d'arrivée"""
+
+    def __init__(self):
+        self.documents = []
+
+    async def insert_many(self, documents, **kwargs):
+        self.documents.extend(documents)
+
+def seed_users(args):
+    batches = pending_batches("users", 0, args.users, args.batch_size)
+    pool = Pool(2)
+    cache = PasswordHashCache(args.hash_cache, args.hash_cache_size)
+    try:
+        collection = MemoryCollection()
+        context = SeedContext(SyntheticRun.create(args), args, pool, cache)
+        written = asyncio.run(write_batches_async(
+            collection, "users", batches, generate_users(batches, context), progress=False,
+            insert_workers=args.insert_workers
+        ))
+    finally:
+        pool.terminate()
+        cache.close()
+    return written, collection.documents
+
+def test_users_with_insert_workers_and_hash_cache(tmp_path):
+    args = parse_args([
+        '--users', '40', '--batch-size', '10', '--insert-workers', '2', '--bcrypt-rounds', '4',
+        '--hash-cache', str(tmp_path / 'hashes.sqlite3')
+    ])
+    # Premier seed : hachés calculés puis ajoutés au cache ; second seed : hachés tirés du cache
+    for _ in range(2):
+        written, users = seed_users(args)
+        assert written == len(users) == 40
+        assert len({user["password"] for user in users}) == 40
@@ -0,0 +1,42 @@
+"""
+Recalcul readTime / excerpt : options, corrections et propagation par updatedAt
+"""
+
+from datetime import datetime
+
+from bson import ObjectId
+
+from fakes import MemoryCollection
+from seeding.backfill import backfill_posts, parse_args
+from seeding.export import changes_query
+
+def test_since_is_naive_utc():
+    # pymongo renvoie des dates UTC naïves : --since doit être comparable à updatedAt
+    assert parse_args(['--since', '2024-01-01T02:00+02:00']).since == datetime(2024, 1, 1)
+    assert parse_args(['--since', '2024-01-01']).since == datetime(2024, 1, 1)
+    assert datetime(2024, 1, 2) > parse_args(['--since', '2024-01-01T00:00Z']).since
+
+def test_backfill_bumps_updated_at_of_corrected_posts():
+    old = datetime(2024, 1, 1)
+    words = ' '.join(['mot'] * 450)
+    posts = MemoryCollection("posts", [
+        {"_id": ObjectId(), "content": words, "excerpt": "Déjà là", "readTime": 3, "updatedAt": old},
+        {"_id": ObjectId(), "content": words, "excerpt": "Déjà là", "readTime": 7, "updatedAt": old},
+        {"_id": ObjectId(), "content": "# Titre\n\nPremier *paragraphe*.", "excerpt": "  ", "readTime": 1, "updatedAt": old},
+        {"_id": ObjectId(), "content": "court", "excerpt": "x" * 400, "updatedAt": old}
+    ])
+    unchanged, stale_time, no_excerpt, long_excerpt = posts.documents.values()
+
+    assert backfill_posts(posts, progress=False, dry_run=True) == (2, 2, old)
+    assert stale_time["readTime"] == 7
+
+    assert backfill_posts(posts, progress=False) == (2, 2, old)
+    assert stale_time["readTime"] == 3 and long_excerpt["readTime"] == 1
+    assert no_excerpt["excerpt"] == "Premier paragraphe."
+    assert len(long_excerpt["excerpt"]) <= 300
+    # Les corrections sont vues par l'export incrémental ; un nouveau passage n'écrit rien
+    watermark = {"updatedAt": old, "_id": max(posts.documents)}
+    assert {doc["_id"] for doc in posts.find(changes_query(watermark))} == {
+        stale_time["_id"], no_excerpt["_id"], long_excerpt["_id"]
+    }
+    assert backfill_posts(posts, since=old, progress=False)[:2] == (0, 0)
@@ -0,0 +1,22 @@
+"""
+Validation des options du seed
+"""
+
+import pytest
+
+from seeding.cli import parse_args
+
+def test_output_requires_volumes(tmp_path):
+    # Sans volume, --output lancerait le seed d'exemple en base au lieu d'exporter
+    with pytest.raises(SystemExit):
+        parse_args(['--output', str(tmp_path / 'dump')])
+
+def test_output_with_profile(tmp_path):
+    args = parse_args(['--output', str(tmp_path / 'dump'), '--profile', 'small'])
+    assert args.output and args.users
+
+def test_resume_requires_acknowledged_writes(tmp_path):
+    checkpoint = tmp_path / 'seed.jsonl'
+    checkpoint.write_text('{}\n')
+    with pytest.raises(SystemExit):
+        parse_args(['--resume', '--checkpoint', str(checkpoint), '--write-concern', '0'])
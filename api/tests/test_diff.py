@@ -0,0 +1,58 @@
+"""
+Comparaison de deux bases : arbre de plages de _id, lecture complète, et accord des deux modes
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from bson import Int64, ObjectId, encode
+
+from fakes import MemoryCollection
+from seeding import diff
+
+def server_hash(doc):
+    """Empreinte 64 bits signée d'un document, comme $toHashedIndexKey (nombres ramenés à l'entier)"""
+    return int.from_bytes(hashlib.sha256(encode(diff.hashed_form(doc))).digest()[:8], 'big', signed=True)
+
+def emulate_server(monkeypatch):
+    def range_summary(collection, start, stop):
+        docs = collection.find(diff.range_match(start, stop))
+        return len(docs), sum(server_hash(doc) % diff.HASH_MODULUS for doc in docs)
+    def range_hashes(collection, start, stop):
+        return {doc["_id"]: server_hash(doc) for doc in collection.find(diff.range_match(start, stop))}
+    monkeypatch.setattr(diff, "range_summary", range_summary)
+    monkeypatch.setattr(diff, "range_hashes", range_hashes)
+
+def collections():
+    ids = sorted(ObjectId() for _ in range(60))
+    source = [{"_id": _id, "n": i, "score": 1.5} for i, _id in enumerate(ids)]
+    target = [dict(doc) for doc in source]
+    target[3]["n"] = -1                   # modifié
+    target[10]["n"] = Int64(10)           # même valeur, autre type : identique
+    target[20]["score"] = 1.9             # même partie entière : identique pour les deux modes
+    target[30] = {"score": 1.5, "_id": ids[30], "n": 30}    # ordre des champs : modifié
+    del target[40]                        # absent de la cible
+    target.append({"_id": ObjectId(), "n": 99})             # en trop
+    return ids, MemoryCollection("posts", source), MemoryCollection("posts", target)
+
+def test_compare_leaf():
+    result = {"missing": [], "extra": [], "changed": []}
+    diff.compare_leaf({1: "a", 2: "b", 3: "c"}, {2: "b", 3: "x", 4: "d"}, result)
+    assert result == {"missing": [1], "extra": [4], "changed": [3]}
+
+def test_hashed_form_squashes_numbers_like_a_hashed_index():
+    assert diff.hashed_form({"a": 2.9, "b": [-2.5, True], "c": float("nan")}) == {"a": 2, "b": [-2, True], "c": 0}
+    assert diff.hashed_form(1e30) == diff.INT64_MAX
+
+def test_server_and_client_modes_agree(monkeypatch):
+    ids, source, target = collections()
+    extra = target.find_one({"n": 99})["_id"]
+    client = diff.streaming_diff(source, target)
+    emulate_server(monkeypatch)
+    with ThreadPoolExecutor(4) as executor:
+        server = diff.merkle_diff(source, target, executor, fanout=4, leaf_size=5)
+    for result in (client, server):
+        assert sorted(result["missing"]) == [ids[40]]
+        assert sorted(result["extra"]) == [extra]
+        assert sorted(result["changed"]) == [ids[3], ids[30]]
+    assert server["leaves"] < len(ids)
@@ -0,0 +1,26 @@
+"""
+Export hors ligne : assemblage des parts au format mongodump --gzip
+"""
+
+import os
+import time
+from argparse import Namespace
+
+from seeding.dump import assemble_bson, dump_directory, part_path
+
+def assemble(output, now, monkeypatch):
+    """Écrire une part users, l'assembler à l'instant `now` et relire les fichiers produits"""
+    monkeypatch.setattr(time, "time", lambda: now)
+    path = part_path(str(output), "bson", "users", 0)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"part")
+    assemble_bson(Namespace(output=str(output)), 1)
+    directory = dump_directory(str(output))
+    return {name: open(os.path.join(directory, name), 'rb').read() for name in sorted(os.listdir(directory))}
+
+def test_assembled_dump_is_byte_identical(tmp_path, monkeypatch):
+    first = assemble(tmp_path, 1_000_000_000, monkeypatch)
+    second = assemble(tmp_path, 2_000_000_000, monkeypatch)
+    assert sorted(first) == ["users.bson.gz", "users.metadata.json.gz"]
+    assert first == second
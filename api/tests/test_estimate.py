@@ -0,0 +1,42 @@
+"""
+Estimation de capacité : entrées d'index, extrapolation de l'échantillon et palier Atlas
+"""
+
+import json
+from multiprocessing import Pool
+
+from seeding.cli import parse_args
+from seeding.estimate import atlas_tier, estimate_capacity, index_entries, sample_indexes
+
+def test_multikey_entries_combine_array_elements():
+    doc = {"author": "a", "tags": ["x", "yy", "zzz"], "reports": []}
+    assert index_entries(doc, ["author", "tags"])[0] == 3
+    assert index_entries(doc, ["reports.status"])[0] == 1
+    assert index_entries({"tags": []}, ["tags"])[0] == 1
+
+def test_sample_indexes():
+    assert sample_indexes(5, 10) == [0, 1, 2, 3, 4]
+    sample = sample_indexes(1000, 10, seed=3)
+    assert len(set(sample)) == 10 and sample == sorted(sample) and sample == sample_indexes(1000, 10, seed=3)
+
+def test_atlas_tier():
+    assert atlas_tier(1 << 30, 5 << 30) == "M10"
+    assert atlas_tier(3 << 30, 5 << 30) == "M20"
+    assert atlas_tier(1 << 40, 1 << 30) is None
+
+def test_estimate_extrapolates_the_sample():
+    args = parse_args(['--dry-run', '--estimate', '--users', '200', '--posts', '100', '--comments', '300',
+                       '--sample-size', '20', '--seed', '7'])
+    pool = Pool(2)
+    try:
+        estimate = estimate_capacity(args, pool)
+    finally:
+        pool.terminate()
+    posts = estimate["collections"]["posts"]
+    assert posts["sampled"] == 20 and posts["count"] == 100
+    # Moyenne arrondie à l'octet : l'extrapolation en diffère d'au plus un demi-octet par document
+    assert abs(posts["dataSize"] - posts["avgObjSize"] * 100) <= 50
+    assert posts["indexes"]["_id_"]["entries"] == 100
+    assert estimate["totalIndexSize"] == sum(entry["totalIndexSize"] for entry in estimate["collections"].values())
+    assert estimate["atlasTier"] == "M10"
+    assert json.loads(json.dumps(estimate)) == estimate
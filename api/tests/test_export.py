@@ -0,0 +1,69 @@
+"""
+Export par plages de _id, liste des _id, et export incrémental : documents modifiés,
+supprimés, et apparus avec un updatedAt ancien
+"""
+
+import os
+from datetime import datetime
+
+from bson import ObjectId, json_util
+
+from fakes import InlineExecutor, MemoryClient, MemoryCollection, MemoryDatabase
+from seeding import export
+
+def exported_ids(export_path, entries):
+    ids = []
+    for entry in entries:
+        with export.open_decompressed(os.path.join(export_path, entry["file"])) as f:
+            ids.extend(json_util.loads(line)["_id"] for line in f)
+    return ids
+
+def run_export(monkeypatch, db, export_path, base=None, options=()):
+    monkeypatch.setattr(export, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(export, "MongoClient", lambda uri: MemoryClient(db))
+    args = export.parse_args(['--collections', 'posts', '--workers', '1', *options])
+    return export.export_database(db, args, str(export_path), base)
+
+def test_range_boundaries_partition_the_collection():
+    posts = MemoryCollection("posts", [{"_id": ObjectId()} for _ in range(100)])
+    assert export.range_boundaries(posts, 100, 100) == [(None, None)]
+    ranges = export.range_boundaries(posts, 100, 25)
+    assert len(ranges) == 4 and ranges[0][0] is None and ranges[-1][1] is None
+    assert all(stop == start for (_, stop), (start, _) in zip(ranges, ranges[1:]))
+    assert sum(posts.count_documents(export.range_query(start, stop)) for start, stop in ranges) == 100
+
+def test_full_export_by_id_ranges(tmp_path, monkeypatch):
+    posts = [{"_id": ObjectId(), "n": i} for i in range(50)]
+    db = MemoryDatabase(collections={"posts": posts})
+    files, _, ids, deleted = run_export(monkeypatch, db, tmp_path, options=['--chunk-docs', '10'])
+    assert len(files["posts"]) > 1 and sum(entry["documents"] for entry in files["posts"]) == 50
+    assert sorted(exported_ids(tmp_path, files["posts"])) == sorted(doc["_id"] for doc in posts)
+    assert ids["posts"]["documents"] == 50 and deleted == {}
+    listed = list(export.read_ids(os.path.join(tmp_path, ids["posts"]["file"])))
+    assert listed == sorted(doc["_id"].binary for doc in posts)
+
+def test_changes_query_after_watermark():
+    watermark = {"updatedAt": datetime(2024, 1, 1), "_id": ObjectId("0" * 23 + "5")}
+    query = export.changes_query(watermark)
+    assert query["$or"][0] == {"updatedAt": {"$gt": watermark["updatedAt"]}}
+    assert export.changes_query(None) == {}
+
+def test_incremental_export_after_reseed(tmp_path, monkeypatch):
+    old = [{"_id": ObjectId(), "updatedAt": datetime(2024, 1, day), "n": day} for day in (1, 2, 3)]
+    db = MemoryDatabase(collections={"posts": old})
+    base = tmp_path / "base"
+    files, watermarks, ids, _ = run_export(monkeypatch, db, base)
+    assert sorted(exported_ids(base, files["posts"])) == [doc["_id"] for doc in old]
+
+    # Seed regénéré : nouveaux _id, dates antidatées comme celles des générateurs
+    backdated = {"_id": ObjectId(), "updatedAt": datetime(2023, 6, 1), "n": 10}
+    recent = {"_id": ObjectId(), "updatedAt": datetime(2025, 1, 1), "n": 11}
+    kept = dict(old[0])
+    db["posts"].documents = {doc["_id"]: doc for doc in (kept, backdated, recent)}
+    incremental = tmp_path / "incremental"
+    files, _, ids, deleted = run_export(monkeypatch, db, incremental, (str(base), {"watermarks": watermarks}))
+
+    assert sorted(exported_ids(incremental, files["posts"])) == [backdated["_id"], recent["_id"]]
+    assert [entry["file"] for entry in files["posts"]] == ["posts/posts-changes.ndjson.gz", "posts/posts-inserted.ndjson.gz"]
+    assert sorted(exported_ids(incremental, [deleted["posts"]])) == [old[1]["_id"], old[2]["_id"]]
+    assert ids["posts"]["documents"] == 3
@@ -0,0 +1,21 @@
+"""
+Likes des articles synthétiques : plafonnés sous la limite de 16 Mio d'un document
+"""
+
+from bson import encode
+
+from seeding.cli import parse_args
+from seeding.config import MAX_LIKES_PER_POST, BSON_MAX_DOCUMENT_BYTES, CONTENT_MAX_BYTES
+from seeding.generators import SeedContext, generate_posts, reference_resolvers
+from seeding.run import SyntheticRun
+
+def test_viral_posts_stay_under_document_limit():
+    args = parse_args(['--users', '10000000', '--posts', '3', '--likes-alpha', '0.01', '--seed', '1'])
+    run = SyntheticRun.create(args)
+    context = SeedContext(run, args, resolvers=reference_resolvers(None, args, run))
+    posts = list(generate_posts([(0, 3)], context))
+    assert max(post["likesCount"] for post in posts) == MAX_LIKES_PER_POST
+    for post in posts:
+        assert post["likesCount"] == len(post["likes"]) <= MAX_LIKES_PER_POST
+        post["content"] = "x" * CONTENT_MAX_BYTES
+        assert len(encode(post)) < BSON_MAX_DOCUMENT_BYTES
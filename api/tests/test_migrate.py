@@ -0,0 +1,108 @@
+"""
+Migration d'un export complet : import par lots, vérification des empreintes, reprise d'un import ou d'un remplacement interrompu
+"""
+
+import os
+
+import pytest
+from bson import ObjectId, json_util
+
+from fakes import InlineExecutor, MemoryClient, MemoryDatabase
+from seeding import migrate
+from seeding.checkpoint import SeedCheckpoint
+from seeding.config import STAGING_SUFFIX
+from seeding.export import open_compressed
+
+USERS = [{"_id": ObjectId(), "username": f"user{i}"} for i in range(5)]
+POSTS = [{"_id": ObjectId(), "slug": f"article-{i}", "likesCount": i} for i in range(7)]
+
+@pytest.fixture
+def export(tmp_path, monkeypatch):
+    """Export complet de USERS et POSTS, base cible vide et journal neuf"""
+    metadata = {"mode": "full", "collections": {"users": len(USERS), "posts": len(POSTS)}, "files": {}}
+    for name, documents in (("users", USERS), ("posts", POSTS)):
+        relative = f"{name}/{name}-00000.ndjson.gz"
+        os.makedirs(tmp_path / name)
+        with open_compressed(tmp_path / relative, "gzip", 6) as f:
+            f.write(''.join(json_util.dumps(doc) + '\n' for doc in documents).encode('utf-8'))
+        metadata["files"][name] = [{"file": relative, "documents": len(documents)}]
+    db = MemoryDatabase()
+    checkpoint = str(tmp_path / "migration.jsonl")
+    args = migrate.parse_args(['--uri', 'mongodb://atlas', '--workers', '1', '--batch-size', '3', '--checkpoint', checkpoint])
+    SeedCheckpoint.create(checkpoint, None, {"collections": ["users", "posts"], "batch_size": 3})
+    monkeypatch.setattr(migrate, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(migrate, "MongoClient", lambda uri: MemoryClient(db))
+    for name in ("_db", "_slugs"):
+        monkeypatch.setattr(migrate, name, getattr(migrate, name))
+    return db, args, str(tmp_path), metadata
+
+def run(export):
+    db, args, path, metadata = export
+    return migrate.migrate(db, args, path, metadata, ["users", "posts"])
+
+def test_verified_import_replaces_live_collections(export):
+    db = export[0]
+    report = run(export)
+    assert report["verified"]
+    assert sorted(db.list_collection_names()) == ["posts", "users"]
+    assert list(db["posts"].documents.values()) == POSTS
+
+def test_digest_mismatch_keeps_live_collections(export, monkeypatch):
+    db = export[0]
+    real_import = migrate.import_file
+    def corrupting_import(name, *rest):
+        result = real_import(name, *rest)
+        if name == "posts":
+            next(iter(db["posts" + STAGING_SUFFIX].documents.values()))["likesCount"] = 99
+        return result
+    monkeypatch.setattr(migrate, "import_file", corrupting_import)
+    report = run(export)
+    assert not report["verified"]
+    assert report["verification"]["users"]["ok"] and not report["verification"]["posts"]["ok"]
+    assert "posts" not in db.list_collection_names()
+
+def test_resume_after_interrupted_swap(export, monkeypatch):
+    db = export[0]
+    real_swap = migrate.swap_staging
+    def crashing_swap(db, name):
+        if name == "posts":
+            raise ConnectionError("coupure réseau")
+        return real_swap(db, name)
+    monkeypatch.setattr(migrate, "swap_staging", crashing_swap)
+    with pytest.raises(ConnectionError):
+        run(export)
+    assert "users" + STAGING_SUFFIX not in db.list_collection_names()
+
+    monkeypatch.setattr(migrate, "swap_staging", real_swap)
+    report = run(export)
+    assert report["verified"] and report["verification"]["users"]["swapped"]
+    assert sorted(db.list_collection_names()) == ["posts", "users"]
+    assert list(db["posts"].documents.values()) == POSTS
+
+def test_resume_after_interrupted_import(export, monkeypatch):
+    db = export[0]
+    real_write = migrate.write_batch
+    posts_batches = []
+    def crashing_write(collection, documents, upsert):
+        if collection.name.startswith("posts") and posts_batches:
+            # Coupure au milieu du deuxième lot : un seul de ses documents est écrit
+            real_write(collection, documents[:1], upsert)
+            raise RuntimeError("processus interrompu")
+        real_write(collection, documents, upsert)
+        if collection.name.startswith("posts"):
+            posts_batches.append(documents[0]["_id"])
+    monkeypatch.setattr(migrate, "write_batch", crashing_write)
+    with pytest.raises(RuntimeError):
+        run(export)
+
+    resumed = []
+    def recording_write(collection, documents, upsert):
+        if collection.name.startswith("posts"):
+            resumed.append((documents[0]["_id"], upsert))
+        real_write(collection, documents, upsert)
+    monkeypatch.setattr(migrate, "write_batch", recording_write)
+    report = run(export)
+    # Le premier lot n'est pas réécrit, le lot interrompu est rejoué en upsert
+    assert resumed == [(POSTS[3]["_id"], True), (POSTS[6]["_id"], False)]
+    assert report["verified"]
+    assert list(db["posts"].documents.values()) == POSTS
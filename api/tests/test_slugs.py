@@ -0,0 +1,87 @@
+"""
+Slugs uniques : allocateur, génération des articles et import d'un export
+"""
+
+from bson import ObjectId, json_util
+from pymongo.errors import BulkWriteError
+
+from seeding import generators, migrate
+from seeding.checkpoint import SeedCheckpoint
+from seeding.cli import parse_args
+from seeding.export import open_compressed
+from seeding.generators import SeedContext, generate_posts, reference_resolvers
+from seeding.run import SyntheticRun
+from seeding.slugs import SlugAllocator
+
+class UniqueSlugCollection:
+    """Collection en mémoire avec l'index unique slug_1, qui refuse les doublons comme le serveur"""
+
+    def __init__(self, documents=()):
+        self.documents = {doc["_id"]: doc for doc in documents}
+
+    def owner(self, slug):
+        return next((_id for _id, doc in self.documents.items() if doc["slug"] == slug), None)
+
+    def write(self, documents, replace):
+        errors = []
+        for index, doc in enumerate(documents):
+            owner = self.owner(doc["slug"])
+            if owner not in (None, doc["_id"]) or (not replace and doc["_id"] in self.documents):
+                errors.append({
+                    "index": index, "code": 11000, "keyPattern": {"slug": 1} if owner else {"_id": 1},
+                    "errmsg": f"E11000 duplicate key error index: {'slug_1' if owner else '_id_'}"
+                })
+            else:
+                self.documents[doc["_id"]] = dict(doc)
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "writeConcernErrors": []})
+
+    def insert_many(self, documents, ordered=True):
+        self.write(documents, replace=False)
+
+    def bulk_write(self, requests, ordered=True):
+        self.write([request._doc for request in requests], replace=True)
+
+class Database:
+    def __init__(self, collection):
+        self.collection = collection
+
+    def get_collection(self, name, write_concern=None):
+        return self.collection
+
+def test_allocator_suffixes_only_collisions():
+    allocator = SlugAllocator(["beta", "beta-2"])
+    assert allocator.allocate("alpha") == "alpha"
+    assert allocator.allocate("alpha") == "alpha-2"
+    assert allocator.allocate("beta") == "beta-3"
+    assert allocator.allocate("alpha") == "alpha-3"
+
+def test_generated_posts_with_colliding_corpus(monkeypatch):
+    corpus = [dict(generators.sample_posts_data[0], slug=slug) for slug in ("guide", "guide", "guide-2", "astuces")]
+    monkeypatch.setattr(generators, "sample_posts_data", corpus)
+    args = parse_args(['--users', '10', '--posts', '40', '--seed', '1'])
+    run = SyntheticRun.create(args)
+    context = SeedContext(run, args, resolvers=reference_resolvers(None, args, run))
+    slugs = [post["slug"] for post in generate_posts([(0, 20), (20, 40)], context)]
+    assert len(set(slugs)) == len(slugs)
+    assert slugs[0] == "guide" and slugs[3] == "astuces" and slugs[4] == "guide-1"
+
+def test_import_suffixes_conflicting_slugs(tmp_path, monkeypatch):
+    existing = {"_id": ObjectId(), "slug": "deja-pris"}
+    documents = [{"_id": ObjectId(), "slug": slug} for slug in ("libre", "deja-pris", "double", "double")]
+    path = tmp_path / "posts.ndjson.gz"
+    with open_compressed(path, "gzip", 6) as f:
+        f.write(''.join(json_util.dumps(doc) + '\n' for doc in documents).encode('utf-8'))
+    checkpoint = tmp_path / "migration.jsonl"
+    SeedCheckpoint.create(str(checkpoint), None, {})
+    collection = UniqueSlugCollection([existing])
+    monkeypatch.setattr(migrate, "_db", Database(collection))
+    monkeypatch.setattr(migrate, "_slugs", SlugAllocator())
+
+    result = migrate.import_file("posts", str(path), 0, str(checkpoint), 10)
+
+    slugs = {_id: doc["slug"] for _id, doc in collection.documents.items()}
+    assert result["written"] == 4 and result["renamed"] == 2
+    assert slugs[existing["_id"]] == "deja-pris" and slugs[documents[0]["_id"]] == "libre"
+    assert slugs[documents[2]["_id"]] == "double" and slugs[documents[3]["_id"]] == "double-2"
+    assert slugs[documents[1]["_id"]] == "deja-pris-2"
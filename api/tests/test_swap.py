@@ -0,0 +1,47 @@
+"""
+Fin de seed : remplacement des collections live, y compris en reprise après un remplacement interrompu
+"""
+
+from bson import ObjectId
+
+from fakes import MemoryDatabase
+from seeding import pipeline
+from seeding.checkpoint import SeedCheckpoint
+from seeding.cli import parse_args
+from seeding.config import STAGING_SUFFIX
+from seeding.run import SyntheticRun
+
+def seeded_args(tmp_path):
+    args = parse_args([
+        '--users', '1', '--posts', '1', '--checkpoint', str(tmp_path / 'seed.jsonl'),
+        '--manifest', str(tmp_path / 'manifest.json')
+    ])
+    SeedCheckpoint.create(args.checkpoint, SyntheticRun.create(args), {"users": 1, "posts": 1, "comments": 0})
+    return args
+
+def finish(db, args, monkeypatch):
+    recomputed = []
+    monkeypatch.setattr(pipeline, "recompute_user_stats", lambda db, args: recomputed.append(True))
+    pipeline.finish_run(db, args)
+    return recomputed
+
+def test_finish_swaps_all_staging_collections(tmp_path, monkeypatch):
+    args = seeded_args(tmp_path)
+    user, post = {"_id": ObjectId(), "new": True}, {"_id": ObjectId(), "new": True}
+    db = MemoryDatabase(collections={"users" + STAGING_SUFFIX: [user], "posts" + STAGING_SUFFIX: [post]})
+    assert finish(db, args, monkeypatch) == [True]
+    assert sorted(db.list_collection_names()) == ["posts", "users"]
+
+def test_resume_after_interrupted_swap(tmp_path, monkeypatch):
+    args = seeded_args(tmp_path)
+    # users déjà renommée, arrêt avant posts : l'ancienne collection posts est encore live
+    post = {"_id": ObjectId(), "new": True}
+    db = MemoryDatabase(collections={
+        "users": [{"_id": ObjectId(), "new": True}],
+        "posts": [{"_id": ObjectId(), "new": False}],
+        "posts" + STAGING_SUFFIX: [post]
+    })
+    assert finish(db, args, monkeypatch) == []
+    assert sorted(db.list_collection_names()) == ["posts", "users"]
+    assert list(db["posts"].documents.values()) == [post]
+    assert (tmp_path / 'manifest.json').exists()
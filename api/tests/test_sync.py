@@ -0,0 +1,78 @@
+"""
+Migration --sync : comparaison des lots avec la cible et ordre des écritures
+"""
+
+import os
+
+from bson import Int64, ObjectId, json_util
+from pymongo.errors import OperationFailure
+
+from fakes import InlineExecutor, MemoryClient, MemoryDatabase
+from seeding import migrate
+from seeding.checkpoint import SeedCheckpoint
+from seeding.export import open_compressed
+
+A, B, C = ObjectId(), ObjectId(), ObjectId()
+
+def target():
+    return MemoryDatabase(collections={"posts": [
+        {"_id": A, "rating": 2.2, "tags": ["a"]},
+        {"_id": B, "views": Int64(5), "tags": ["b"]}
+    ]})
+
+EXPORTED = [
+    {"_id": A, "rating": 2.3, "tags": ["a"]},
+    {"_id": B, "views": 5, "tags": ["b"]},
+    {"_id": C, "views": 1}
+]
+
+def test_server_comparison_is_exact():
+    # 2.2 -> 2.3 est une modification ; Int64(5) relu comme 5 n'en est pas une
+    assert migrate.changed_documents(target()["posts"], EXPORTED) == {A: True, C: False}
+
+def test_server_comparison_respects_field_order():
+    reordered = [{"_id": B, "tags": ["b"], "views": 5}]
+    assert migrate.changed_documents(target()["posts"], reordered) == {B: True}
+
+def test_local_comparison_on_raw_bson():
+    # Sans $documents, le type numérique compte : B est réécrit à l'identique
+    assert migrate.changed_documents_locally(target()["posts"], EXPORTED) == {A: True, B: True, C: False}
+
+def test_compare_batch_falls_back_without_documents_stage(monkeypatch):
+    db = target()
+    def aggregate(pipeline):
+        raise OperationFailure("Unrecognized pipeline stage name: '$documents'")
+    monkeypatch.setattr(db, "aggregate", aggregate)
+    monkeypatch.setattr(migrate, "_server_compare", True)
+    assert migrate.compare_batch(db["posts"], EXPORTED) == {A: True, B: True, C: False}
+    assert migrate._server_compare is False
+
+def write_export(path, files):
+    for relative, documents in files.items():
+        os.makedirs(os.path.dirname(path / relative), exist_ok=True)
+        with open_compressed(path / relative, "gzip", 6) as f:
+            f.write(''.join(json_util.dumps(doc) + '\n' for doc in documents).encode('utf-8'))
+
+def test_sync_frees_slugs_of_deleted_posts(tmp_path, monkeypatch):
+    deleted = {"_id": ObjectId(), "slug": "guide", "title": "Guide"}
+    recreated = {"_id": ObjectId(), "slug": "guide", "title": "Guide (réécrit)"}
+    db = MemoryDatabase(collections={"posts": [deleted]})
+    db["posts"].unique = ("slug",)
+    write_export(tmp_path, {"posts/posts-changes.ndjson.gz": [recreated], "posts/posts-deleted.ndjson.gz": [deleted]})
+    metadata = {
+        "mode": "incremental",
+        "files": {"posts": [{"file": "posts/posts-changes.ndjson.gz", "documents": 1}]},
+        "deleted": {"posts": {"file": "posts/posts-deleted.ndjson.gz", "documents": 1}}
+    }
+    checkpoint = str(tmp_path / "migration.jsonl")
+    args = migrate.parse_args(['--uri', 'mongodb://atlas', '--sync', '--workers', '1', '--checkpoint', checkpoint])
+    SeedCheckpoint.create(checkpoint, None, {"sync": True})
+    monkeypatch.setattr(migrate, "ProcessPoolExecutor", InlineExecutor)
+    monkeypatch.setattr(migrate, "MongoClient", lambda uri: MemoryClient(db))
+    for name in ("_db", "_slugs", "_server_compare"):
+        monkeypatch.setattr(migrate, name, getattr(migrate, name))
+
+    report = migrate.sync(db, args, str(tmp_path), metadata, ["posts"])
+
+    assert list(db["posts"].documents.values()) == [recreated]
+    assert report["sync"]["posts"] == {"inserted": 1, "replaced": 0, "unchanged": 0, "deleted": 1, "renamed": 0}
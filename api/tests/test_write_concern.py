@@ -0,0 +1,52 @@
+"""
+--write-concern 0 : pas de reprise sur des lots non confirmés, pas de remplacement incomplet
+"""
+
+import pytest
+
+from seeding.checkpoint import SeedCheckpoint
+from seeding.cli import parse_args
+from seeding.config import STAGING_SUFFIX
+from seeding.pipeline import finish_run, start_run
+from seeding.run import SyntheticRun
+
+class CountingCollection:
+    def __init__(self, name, count):
+        self.name, self.count = name, count
+
+    def count_documents(self, query):
+        return self.count
+
+class Database:
+    """Base dont les collections de chargement n'ont reçu que `count` documents"""
+
+    def __init__(self, count):
+        self.count = count
+
+    def list_collection_names(self):
+        return ["users" + STAGING_SUFFIX]
+
+    def get_collection(self, name, write_concern=None):
+        return CountingCollection(name, self.count)
+
+    def __getattr__(self, name):
+        raise AssertionError(f"{name} appelé malgré des documents manquants")
+
+def test_unacknowledged_journal_cannot_resume(tmp_path):
+    checkpoint = str(tmp_path / 'seed.jsonl')
+    args = parse_args(['--users', '10', '--write-concern', '0', '--checkpoint', checkpoint])
+    SeedCheckpoint.create(checkpoint, SyntheticRun.create(args), {"users": 10}, unacknowledged=True)
+    args = parse_args(['--resume', '--checkpoint', checkpoint, '--write-concern', '1'])
+    with pytest.raises(RuntimeError):
+        start_run(None, args)
+
+def test_missing_documents_abort_swap(tmp_path, monkeypatch):
+    monkeypatch.setattr("seeding.storage.time.sleep", lambda seconds: None)
+    monkeypatch.setattr("seeding.storage.time.monotonic", iter(range(0, 1000, 100)).__next__)
+    args = parse_args([
+        '--users', '10', '--write-concern', '0', '--manifest', str(tmp_path / 'manifest.json'),
+        '--checkpoint', str(tmp_path / 'seed.jsonl')
+    ])
+    with pytest.raises(RuntimeError):
+        finish_run(Database(8), args)
+    assert not (tmp_path / 'manifest.json').exists()